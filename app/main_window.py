@@ -82,6 +82,8 @@ class MainWindow(
         self.current_search_params = {}
         self._cancelling = False  # 검색 취소 중복 방지 플래그
         self._pending_filter = None
+        self._filter_columns = None  # 필터용 열 캐시 (all_results 기준)
+        self._last_filter_signature = None  # 마지막으로 적용한 (열 캐시, 필터 조건)
         self._last_filter_log_msg = ""
         self._last_filter_log_ts = 0.0
         self._filter_apply_timer = QTimer(self)
@@ -1,5 +1,7 @@
 """FilteringMixin methods extracted from MainWindow."""
 
+import itertools
+
 from app.mainwindow.shared import *
 from typing import TYPE_CHECKING, Any
 
@@ -7,6 +9,58 @@ if TYPE_CHECKING:
     from app.main_window import MainWindow
 
 
+def _leading_hour(value) -> int | None:
+    """'HH:MM' 형식이면 시(hour)를, 아니면 None을 돌려준다."""
+    if not value or ':' not in value:
+        return None
+    try:
+        return int(value.split(':')[0])
+    except ValueError:
+        logger.debug(f"Time filter parsing error: {value!r}")
+        return None
+
+
+class _FilterColumns:
+    """필터 조건별 값을 결과 순서대로 모아 둔 열 단위 캐시."""
+
+    def __init__(self, results):
+        self._source = results
+        self._size = len(results)
+        self.prices = [f.price for f in results]
+        self.stops = [f.stops for f in results]
+        self.dep_hours = [_leading_hour(f.departure_time) for f in results]
+        self.ret_hours = [
+            _leading_hour(f.return_departure_time) if f.is_round_trip else None
+            for f in results
+        ]
+        self._categories: list[str] | None = None
+
+    def matches(self, results) -> bool:
+        return self._source is results and self._size == len(results)
+
+    def categories(self) -> list[str]:
+        # 항공사 분류는 필요할 때 한 번만, 같은 항공사명은 한 번만 계산
+        if self._categories is None:
+            by_airline: dict[str, str] = {}
+            categories = []
+            for f in self._source:
+                category = by_airline.get(f.airline)
+                if category is None:
+                    category = by_airline[f.airline] = config.get_airline_category(f.airline)
+                categories.append(category)
+            self._categories = categories
+        return self._categories
+
+
+def _filter_columns_for(window: Any, results) -> _FilterColumns:
+    """all_results가 바뀔 때만 필터용 열 데이터를 다시 만든다."""
+    columns = getattr(window, "_filter_columns", None)
+    if columns is None or not columns.matches(results):
+        columns = _FilterColumns(results)
+        window._filter_columns = columns
+    return columns
+
+
 class FilteringMixin:
     def _schedule_filter_apply(self: Any, filters):
         """연속 필터 이벤트를 디바운스로 합쳐 마지막 변경만 적용."""
@@ -53,52 +107,47 @@ class FilteringMixin:
             end_h = pref_time.get("departure_end", 24)
             # 오는편 선호 시간은 설정에 없으므로 기본값(0-24) 유지
             
-        filtered = []
-        for f in self.all_results:
-            # 1. Stops Filter
-            if direct_only and f.stops > 0:
-                continue
-            if not include_layover and f.stops > 0:
-                continue
-            if f.stops > max_stops:
-                continue
-            
-            # 2. Airline Category Filter
-            if airline_category != "ALL":
-                category = config.get_airline_category(f.airline)
-                if category != airline_category:
-                    continue
-            
-            # 3. Time Filter (Outbound)
-            try:
-                if ':' in f.departure_time:
-                    dep_h = int(f.departure_time.split(':')[0])
-                    if not (start_h <= dep_h <= end_h):  # <= 로 변경하여 종료시간 포함
-                        continue
-            except Exception as e:
-                logger.debug(f"Time filter parsing error: {e}")
-            
-            # 4. Time Filter (Inbound) - Only for round trips
-            if f.is_round_trip and hasattr(f, 'return_departure_time') and f.return_departure_time:
-                try:
-                    if ':' in f.return_departure_time:
-                        ret_dep_h = int(f.return_departure_time.split(':')[0])
-                        if not (ret_start_h <= ret_dep_h <= ret_end_h):  # <= 로 변경
-                            continue
-                except Exception as e:
-                    logger.debug(f"Return time filter parsing error: {e}")
-            
-            # 5. Price Range Filter (Advanced)
-            min_price = filters.get("min_price", 0)
-            max_price = filters.get("max_price", MAX_PRICE_FILTER)
-            if f.price < min_price:
-                continue
-            if max_price < MAX_PRICE_FILTER:
-                if f.price > max_price:
-                    continue
-                
-            filtered.append(f)
-            
+        results = self.all_results
+        columns = _filter_columns_for(self, results)
+
+        # 같은 결과에 같은 조건이면 테이블/상태바/로그를 다시 갱신하지 않는다
+        signature = (columns, tuple(sorted(filters.items())), start_h, end_h)
+        last_signature = getattr(self, "_last_filter_signature", None)
+        if (
+            last_signature is not None
+            and last_signature[0] is columns
+            and last_signature[1:] == signature[1:]
+        ):
+            return
+        self._last_filter_signature = signature
+
+        # 1. 경유: 직항만/경유 제외면 0회, 아니면 최대 경유 횟수까지
+        stops_limit = min(max_stops, 0) if direct_only or not include_layover else max_stops
+        # 2. 항공사 분류: 전체면 비교하지 않는다
+        if airline_category != "ALL":
+            categories = columns.categories()
+        else:
+            categories = itertools.repeat(airline_category)
+        # 5. 가격 범위 (상한이 최대값이면 상한 없음)
+        min_price = filters.get("min_price", 0)
+        max_price = filters.get("max_price", MAX_PRICE_FILTER)
+        if max_price >= MAX_PRICE_FILTER:
+            max_price = float("inf")
+
+        # 행마다 속성/시간 문자열을 다시 읽지 않고 미리 만든 열 리스트만 비교한다.
+        # 시간 열이 None이면(형식 불명/편도) 시간 조건을 통과시킨다. 시간은 종료시간 포함.
+        filtered = [
+            f
+            for f, price, stops, dep_h, ret_h, category in zip(
+                results, columns.prices, columns.stops, columns.dep_hours, columns.ret_hours, categories
+            )
+            if stops <= stops_limit
+            and min_price <= price <= max_price
+            and (dep_h is None or start_h <= dep_h <= end_h)
+            and (ret_h is None or ret_start_h <= ret_h <= ret_end_h)
+            and category == airline_category
+        ]
+
         self.table.update_data(filtered)
         
         # 상태 메시지에 가격 범위 표시
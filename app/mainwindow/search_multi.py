@@ -54,6 +54,7 @@ class SearchMultiMixin:
             cabin_class,
             max_results,
             telemetry_callback=self._emit_telemetry_event,
+            max_workers=self.prefs.get_parallel_workers(),
         )
         self.multi_worker.progress.connect(self._update_progress)
         self.multi_worker.single_finished.connect(self._on_multi_single_finished)
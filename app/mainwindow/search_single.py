@@ -42,7 +42,8 @@ class SearchSingleMixin:
         self.progress_bar.setRange(0, 0)
         cabin_label = {"ECONOMY": "이코노미", "BUSINESS": "비즈니스", "FIRST": "일등석"}.get(cabin_class, "이코노미")
         self.progress_bar.setFormat(f"항공권 검색 중... ({cabin_label})")
-        self.table.setRowCount(0)
+        self.table.clear_results()
+        self._last_filter_signature = None
         manual_browser_open = self.active_searcher is not None
         if manual_browser_open and hasattr(self, "manual_status_label"):
             self.manual_status_label.setText("🖐️ <b>수동 모드 유지 중</b> - 브라우저 닫기 가능")
@@ -82,6 +83,7 @@ class SearchSingleMixin:
         if results:
             self.all_results = results
             self.results = results
+            self._last_filter_signature = None
             if hasattr(self, "_emit_telemetry_event"):
                 self._emit_telemetry_event(
                     {
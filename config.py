@@ -3,6 +3,7 @@ Flight Bot Configuration
 Shared constants and settings for scraping and GUI.
 """
 
+import functools
 import json
 import os
 import sys
@@ -32,7 +33,7 @@ DOMESTIC_AIRPORTS = {
     "TAE": "대구",
     "SEL": "서울(도시)",
 }
-DOMESTIC_AIRPORT_CODES = set(DOMESTIC_AIRPORTS.keys())
+DOMESTIC_AIRPORT_CODES = frozenset(DOMESTIC_AIRPORTS)
 SEARCH_PARAMS_SCHEMA_VERSION = 2
 VALID_CABIN_CLASSES = {"ECONOMY", "BUSINESS", "FIRST"}
 
@@ -168,12 +169,19 @@ def validate_airport_code(code: str) -> bool:
     normalized = code.strip().upper()
     return len(normalized) == 3 and normalized.isalpha() and normalized.isascii()
 
+# 분류 비교용 소문자 항공사명 (호출마다 lower()를 반복하지 않도록 미리 계산)
+_AIRLINE_CATEGORY_NAMES = tuple(
+    (category, tuple(a.lower() for a in airlines))
+    for category, airlines in AIRLINE_CATEGORIES.items()
+)
+
+
+@functools.lru_cache(maxsize=512)
 def get_airline_category(airline_name: str) -> str:
-    """항공사 이름으로 카테고리 반환"""
-    airline_name = airline_name.strip()
-    for category, airlines in AIRLINE_CATEGORIES.items():
-        if any(a.lower() in airline_name.lower() or airline_name.lower() in a.lower() 
-               for a in airlines):
+    """항공사 이름으로 카테고리 반환 (같은 이름은 결과를 재사용)"""
+    name = airline_name.strip().lower()
+    for category, airlines in _AIRLINE_CATEGORY_NAMES:
+        if any(a in name or name in a for a in airlines):
             return category
     return "OTHER"
 
@@ -212,6 +220,7 @@ class PreferenceManager:
             "alert_auto_check_enabled": False,
             "alert_auto_check_interval_min": 30,
             "max_results": 1000,
+            "parallel_workers": 2,  # 다중 목적지 검색 동시 실행 수 (브라우저 수)
         }
 
     @staticmethod
@@ -307,6 +316,15 @@ class PreferenceManager:
             max_results = default_prefs["max_results"]
         prefs["max_results"] = max(50, min(max_results, 2000))
 
+        try:
+            parallel_workers = int(
+                raw_dict.get("parallel_workers", default_prefs["parallel_workers"])
+                or default_prefs["parallel_workers"]
+            )
+        except Exception:
+            parallel_workers = default_prefs["parallel_workers"]
+        prefs["parallel_workers"] = max(1, min(parallel_workers, 8))
+
         prefs["alert_auto_check_enabled"] = _coerce_bool(
             raw_dict.get("alert_auto_check_enabled", default_prefs["alert_auto_check_enabled"]),
             default_prefs["alert_auto_check_enabled"],
@@ -433,6 +451,15 @@ class PreferenceManager:
     def get_max_results(self) -> int:
         return self.preferences.get("max_results", 1000)
 
+    # --- Parallel Workers ---
+    def set_parallel_workers(self, count: int):
+        """다중 목적지 검색 동시 실행 수 저장 (1~8)"""
+        self.preferences["parallel_workers"] = max(1, min(int(count), 8))
+        self.save()
+
+    def get_parallel_workers(self) -> int:
+        return self.preferences.get("parallel_workers", 2)
+
     # --- Theme ---
     def get_theme(self) -> str:
         """테마 설정 반환 ('dark' 또는 'light')"""
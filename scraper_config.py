@@ -3,7 +3,10 @@
 Configuration and Scripts for Flight Scraper V2
 """
 
+import ast
+import functools
 import json
+import re
 from datetime import datetime
 
 import config
@@ -13,19 +16,28 @@ MAX_RETRY_COUNT = 3
 RETRY_DELAY_SECONDS = 2
 PAGE_LOAD_TIMEOUT_MS = 60000
 DATA_WAIT_TIMEOUT_SECONDS = 30
+RESULT_WAIT_POLLING_MS = 200
 SCROLL_PAUSE_TIME = 1.0
 
 # === 성능/대기 튜닝 상수 ===
 FILTER_DEBOUNCE_MS = 120
 SEARCH_PAGE_STABILIZE_SECONDS = 1.5
 DOMESTIC_RETURN_WAIT_TIMEOUT_SECONDS = 15
-DOMESTIC_RETURN_POST_CLICK_SETTLE_SECONDS = 0.5
 DOMESTIC_SCROLL_PAUSE_SECONDS = 0.3
 DOMESTIC_SCROLL_BOTTOM_PAUSE_SECONDS = 0.5
+# 국제선 스크롤 대기: 짧게 시작해 새 콘텐츠가 없을 때마다 늘리고 SCROLL_PAUSE_TIME에서 멈춘다
+INTERNATIONAL_SCROLL_MIN_PAUSE_MS = 200
+INTERNATIONAL_SCROLL_PAUSE_BACKOFF = 1.5
 DOMESTIC_MAX_SCROLLS = 300
 DOMESTIC_COMBINATION_TOP_N = 150
 INTERNATIONAL_MAX_SCROLLS = 20
 SELECTOR_HEALTH_WINDOW = 200
+SEARCH_RESULT_CACHE_TTL_SECONDS = 300
+SEARCH_RESULT_CACHE_MAX_ENTRIES = 64
+# 백그라운드 검색에서 받지 않을 정적 리소스 (텍스트 추출에 불필요한 이미지/폰트/미디어)
+BACKGROUND_BLOCKED_RESOURCE_PATTERN = r"\.(?:png|jpe?g|gif|webp|avif|ico|svg|woff2?|ttf|otf|mp4|webm)(?:[?#]|$)"
+# 백그라운드 컨텍스트의 쿠키/스토리지를 저장해 다음 검색에서 재사용할 파일 (프로필 폴더 기준)
+BACKGROUND_STORAGE_STATE_FILENAME = "state.json"
 INTERPARK_SEARCH_URL_BASE = "https://travel.interpark.com/air/search"
 INTERPARK_AIR_API_BASE = "https://travel.interpark.com/air/air-api/inpark-air-web-api"
 
@@ -54,11 +66,13 @@ def normalize_interpark_api_date(date_text: str | None) -> str:
 def resolve_interpark_location(code: str) -> tuple[str, str]:
     """Return the route prefix and normalized city/airport code for Interpark URLs."""
     normalized = (code or "").strip().upper()
-    if normalized in config.CITY_CODES_MAP:
-        return "c", config.CITY_CODES_MAP[normalized]
+    city_code = config.CITY_CODES_MAP.get(normalized)
+    if city_code is not None:
+        return "c", city_code
     return "a", normalized
 
 
+@functools.lru_cache(maxsize=256)
 def build_interpark_search_url(
     origin: str,
     destination: str,
@@ -144,20 +158,51 @@ REGEX_STOPS = r"(\d)회\s*경유"
 # === JavaScript 스크립트 템플릿 ===
 
 class ScraperScripts:
-    
+
+    @staticmethod
+    def _airline_names(airlines_js_list):
+        """항공사 목록(list 또는 기존 JS 배열 문자열)을 이름 리스트로 정규화"""
+        if isinstance(airlines_js_list, str):
+            try:
+                parsed = ast.literal_eval(airlines_js_list)
+            except (ValueError, SyntaxError):
+                parsed = [airlines_js_list]
+            airlines_js_list = [parsed] if isinstance(parsed, str) else parsed
+        return [str(name) for name in airlines_js_list or [] if name]
+
+    @staticmethod
+    def _airline_regex(airlines):
+        """항공사명 alternation 정규식을 JS `new RegExp(...)` 리터럴로 생성"""
+        # 긴 이름 우선 배치: 접두어가 겹치는 이름(대한항공/대한)도 가장 긴 이름으로 매칭
+        names = sorted(set(ScraperScripts._airline_names(airlines)), key=lambda name: (-len(name), name))
+        escaped = [re.sub(r"[.*+?^${}()|[\]\\/]", r"\\\g<0>", name) for name in names]
+        pattern = "|".join(escaped) if escaped else "(?!)"
+        return f"new RegExp({json.dumps(pattern, ensure_ascii=False)})"
+
+    @staticmethod
+    def _airline_key(airlines_js_list):
+        """스크립트 메모이즈용 항공사 키 (정렬된 tuple)"""
+        return tuple(sorted(set(ScraperScripts._airline_names(airlines_js_list))))
+
     @staticmethod
     def get_click_flight_script(airlines_js_list):
         """특정 항공사의 항공편을 클릭하는 JS 스크립트"""
+        return ScraperScripts._click_flight_script(ScraperScripts._airline_key(airlines_js_list))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _click_flight_script(airlines):
+        airline_re = ScraperScripts._airline_regex(airlines)
         return f"""
         () => {{
-            const airlines = {airlines_js_list};
+            const RE_AIRLINE = {airline_re};
             const buttons = document.querySelectorAll('button');
             for (const btn of buttons) {{
                 const text = btn.textContent || '';
                 // 시간 및 가격 패턴 확인
                 if (/{REGEX_TIME}/.test(text) && 
                     /[0-9,]+\\s*원/.test(text) &&
-                    airlines.some(a => text.includes(a))) {{
+                    RE_AIRLINE.test(text)) {{
                     btn.click();
                     return true;
                 }}
@@ -169,13 +214,31 @@ class ScraperScripts:
     @staticmethod
     def get_domestic_list_script(airlines_js_list):
         """국내선 목록 예비 추출 JS"""
+        return ScraperScripts._domestic_list_script(ScraperScripts._airline_key(airlines_js_list))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _domestic_list_script(airlines):
+        airline_re = ScraperScripts._airline_regex(airlines)
         return f"""
         () => {{
             const results = [];
-            const airlines = {airlines_js_list};
+            const RE_AIRLINE = {airline_re};
 
             const normalize = (value) => (value || '').replace(/\\s+/g, ' ').trim();
+            // 숫자 외 문자(쉼표 등)를 건너뛰며 정수로 누적 - 중간 문자열/정규식 없이 변환
+            const toInt = (value) => {{
+                let parsed = 0;
+                for (let i = 0; i < value.length; i++) {{
+                    const code = value.charCodeAt(i);
+                    if (code >= 48 && code <= 57) parsed = parsed * 10 + (code - 48);
+                }}
+                return parsed;
+            }};
             const exactPricePattern = /^(\\d{{1,3}}(?:,\\d{{3}}){{1,2}})\\s*원$/;
+            // 버튼마다 쓰는 정규식은 스크립트 시작 시 한 번만 만든다
+            const RE_TIME = /{REGEX_TIME}/;
+            const RE_STOPS = /{REGEX_STOPS}/;
             const boundaryPricePattern = /(?:^|[^0-9,])(\\d{{1,3}}(?:,\\d{{3}}){{1,2}})\\s*원/g;
 
             const readPrice = (button) => {{
@@ -185,7 +248,7 @@ class ScraperScripts:
                     if (!text) continue;
                     const exactMatch = text.match(exactPricePattern);
                     if (exactMatch) {{
-                        return parseInt(exactMatch[1].replace(/,/g, ''), 10);
+                        return toInt(exactMatch[1]);
                     }}
                 }}
 
@@ -193,7 +256,7 @@ class ScraperScripts:
                     normalize(button.textContent).matchAll(boundaryPricePattern)
                 );
                 if (fallbackMatches.length > 0) {{
-                    return parseInt(fallbackMatches[0][1].replace(/,/g, ''), 10);
+                    return toInt(fallbackMatches[0][1]);
                 }}
                 return 0;
             }};
@@ -205,7 +268,7 @@ class ScraperScripts:
                 }}
 
                 const finalMatch = matches[matches.length - 1];
-                const benefitPrice = parseInt(finalMatch[1].replace(/,/g, ''), 10);
+                const benefitPrice = toInt(finalMatch[1]);
                 if (!benefitPrice || benefitPrice === basePrice) {{
                     return {{ benefitPrice: 0, benefitLabel: '' }};
                 }}
@@ -225,23 +288,15 @@ class ScraperScripts:
             }};
 
             const readAirline = (button, text) => {{
-                const texts = Array.from(button.querySelectorAll('p, span, div'))
-                    .map((node) => normalize(node.textContent))
-                    .filter(Boolean);
-
-                for (const airlineName of airlines) {{
-                    if (texts.some((entry) => entry === airlineName || entry.includes(airlineName))) {{
-                        return airlineName;
+                for (const node of button.querySelectorAll('p, span, div')) {{
+                    const match = normalize(node.textContent).match(RE_AIRLINE);
+                    if (match) {{
+                        return match[0];
                     }}
                 }}
 
-                for (const airlineName of airlines) {{
-                    if (text.includes(airlineName)) {{
-                        return airlineName;
-                    }}
-                }}
-
-                return '';
+                const match = text.match(RE_AIRLINE);
+                return match ? match[0] : '';
             }};
 
             const readStops = (text) => {{
@@ -249,38 +304,44 @@ class ScraperScripts:
                     return 0;
                 }}
 
-                const stopMatch = text.match(/{REGEX_STOPS}/);
+                const stopMatch = text.match(RE_STOPS);
                 if (stopMatch) {{
                     return parseInt(stopMatch[1], 10) || 0;
                 }}
                 return text.includes('경유') ? 1 : 0;
             }};
 
+            const extractOne = (btn) => {{
+                const rawText = btn.textContent || '';
+                // 가격('원')이 없거나 너무 짧은 버튼(메뉴/필터 등)은 정규식 전에 건너뛴다
+                if (rawText.length < 15 || rawText.indexOf('원') === -1) return null;
+                const text = normalize(rawText);
+                const timeMatch = text.match(RE_TIME);
+                if (!timeMatch) return null;
+
+                const airline = readAirline(btn, text);
+                if (!airline) return null;
+
+                const price = readPrice(btn);
+                if (price < 1000 || price > 10000000) return null;
+                if (text.includes('이벤트') || text.includes('프로모션')) return null;
+                const benefit = readBenefit(text, airline, price);
+
+                return {{
+                    airline: airline,
+                    price: price,
+                    benefitPrice: benefit.benefitPrice,
+                    benefitLabel: benefit.benefitLabel,
+                    depTime: timeMatch[1],
+                    arrTime: timeMatch[2],
+                    stops: readStops(text),
+                    key: `${{airline}}_${{timeMatch[1]}}_${{timeMatch[2]}}_${{price}}_${{benefit.benefitPrice}}`
+                }};
+            }};
+
             for (const btn of document.querySelectorAll('button')) {{
-                try {{
-                    const text = normalize(btn.textContent);
-                    const timeMatch = text.match(/{REGEX_TIME}/);
-                    if (!timeMatch) continue;
-
-                    const airline = readAirline(btn, text);
-                    if (!airline) continue;
-
-                    const price = readPrice(btn);
-                    if (price < 1000 || price > 10000000) continue;
-                    if (text.includes('이벤트') || text.includes('프로모션')) continue;
-                    const benefit = readBenefit(text, airline, price);
-
-                    results.push({{
-                        airline: airline,
-                        price: price,
-                        benefitPrice: benefit.benefitPrice,
-                        benefitLabel: benefit.benefitLabel,
-                        depTime: timeMatch[1],
-                        arrTime: timeMatch[2],
-                        stops: readStops(text),
-                        key: `${{airline}}_${{timeMatch[1]}}_${{timeMatch[2]}}_${{price}}_${{benefit.benefitPrice}}`
-                    }});
-                }} catch (e) {{ }}
+                const item = extractOne(btn);
+                if (item) results.push(item);
             }}
             return results;
         }}
@@ -291,75 +352,201 @@ class ScraperScripts:
         """국내선 가격 추출 JS (버튼 기반)"""
         return ScraperScripts.get_domestic_list_script(airlines_js_list)
 
+    @staticmethod
+    def get_domestic_scroll_and_collect_script(airlines_js_list, max_scrolls, pause_ms, bottom_pause_ms):
+        """국내선 스크롤+수집을 브라우저 안에서 한 번에 수행하는 async JS"""
+        return ScraperScripts._domestic_scroll_and_collect_script(
+            ScraperScripts._airline_key(airlines_js_list),
+            int(max_scrolls),
+            int(pause_ms),
+            int(bottom_pause_ms),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _domestic_scroll_and_collect_script(airlines, max_scrolls, pause_ms, bottom_pause_ms):
+        collect_js = ScraperScripts._domestic_list_script(airlines)
+        scroll_check_js = ScraperScripts.get_scroll_check_script()
+        settle_ms = max(1, min(80, pause_ms // 3))
+        return f"""
+        async () => {{
+            const collect = ({collect_js});
+            const scrollCheck = ({scroll_check_js});
+            // 고정 대기 대신 DOM 변경이 잠잠해지면 바로 진행하고, 변경이 없으면 최대 timeoutMs까지 기다린다.
+            const waitForRender = (timeoutMs) => new Promise((resolve) => {{
+                let settleTimer = null;
+                let deadline = null;
+                let observer = null;
+                const finish = () => {{
+                    if (observer) observer.disconnect();
+                    clearTimeout(settleTimer);
+                    clearTimeout(deadline);
+                    resolve();
+                }};
+                if (!document.body || typeof MutationObserver === 'undefined') {{
+                    setTimeout(resolve, timeoutMs);
+                    return;
+                }}
+                observer = new MutationObserver(() => {{
+                    clearTimeout(settleTimer);
+                    settleTimer = setTimeout(finish, {settle_ms});
+                }});
+                observer.observe(document.body, {{ childList: true, subtree: true }});
+                deadline = setTimeout(finish, timeoutMs);
+            }});
+            const seen = new Set();
+            // 항목마다 같은 키 문자열을 반복해 넘기지 않도록 필드별 병렬 배열(열 단위)로 모은다.
+            const columns = {{
+                airline: [], price: [], depTime: [], arrTime: [],
+                stops: [], benefitPrice: [], benefitLabel: [],
+            }};
+            let bottomCount = 0;
+            let noScrollCount = 0;
+            let noNewCount = 0;
+            let scrolls = 0;
+            let stopReason = 'max_scrolls';
+
+            for (let index = 0; index < {max_scrolls}; index++) {{
+                scrolls = index + 1;
+                let newCount = 0;
+                // 키는 수집 스크립트가 만든 값을 그대로 쓰고, Python으로는 새 항목의 필드만 넘긴다.
+                for (const item of collect()) {{
+                    if (seen.has(item.key)) continue;
+                    seen.add(item.key);
+                    columns.airline.push(item.airline);
+                    columns.price.push(item.price);
+                    columns.depTime.push(item.depTime);
+                    columns.arrTime.push(item.arrTime);
+                    columns.stops.push(item.stops);
+                    columns.benefitPrice.push(item.benefitPrice);
+                    columns.benefitLabel.push(item.benefitLabel);
+                    newCount += 1;
+                }}
+
+                const scroll = scrollCheck();
+                await waitForRender({pause_ms});
+
+                if (scroll.reachedBottom && newCount === 0) {{
+                    bottomCount += 1;
+                    if (bottomCount >= 3) {{
+                        stopReason = 'bottom';
+                        break;
+                    }}
+                    // 바닥에서도 새 항목이 렌더링되면 최대 대기 전에 다음 수집으로 넘어간다
+                    await waitForRender({bottom_pause_ms});
+                    continue;
+                }}
+                bottomCount = 0;
+
+                if (!scroll.canScroll) {{
+                    noScrollCount += 1;
+                    if (noScrollCount >= 3) {{
+                        stopReason = 'no_scroll';
+                        break;
+                    }}
+                }} else {{
+                    noScrollCount = 0;
+                }}
+
+                if (newCount === 0) {{
+                    noNewCount += 1;
+                    if (noNewCount >= 8) {{
+                        stopReason = 'no_new';
+                        break;
+                    }}
+                }} else {{
+                    noNewCount = 0;
+                }}
+            }}
+            return {{ columns, scrolls, stopReason }};
+        }}
+        """
+
     @staticmethod
     def get_international_prices_script():
-        """국제선 가격 추출 JS (li[data-index] 기반)"""
+        """국제선 가격 추출 JS (li[data-index] 기반, topK > 0이면 최저가 상위 topK개만 반환)"""
         return f"""
-        () => {{
+        (topK = 0) => {{
             const results = [];
             const cards = document.querySelectorAll('li[data-index], div[data-index]');
             const normalize = (value) => (value || '').replace(/\\s+/g, ' ').trim();
+            // 숫자 외 문자(쉼표 등)를 건너뛰며 정수로 누적 - 중간 문자열/정규식 없이 변환
+            const toInt = (value) => {{
+                let parsed = 0;
+                for (let i = 0; i < value.length; i++) {{
+                    const code = value.charCodeAt(i);
+                    if (code >= 48 && code <= 57) parsed = parsed * 10 + (code - 48);
+                }}
+                return parsed;
+            }};
             const exactPricePattern = /^(\\d{{1,3}}(?:,\\d{{3}}){{1,2}})\\s*원$/;
             const boundaryPricePattern = /(?:^|[^0-9,])(\\d{{1,3}}(?:,\\d{{3}}){{1,2}})\\s*원/g;
-
-            const readPrice = (card) => {{
-                const nodes = [card, ...card.querySelectorAll('p, span, div, strong, em')];
-                for (const node of nodes) {{
-                    const text = normalize(node.textContent);
-                    if (!text) continue;
-                    const exactMatch = text.match(exactPricePattern);
-                    if (exactMatch) {{
-                        return parseInt(exactMatch[1].replace(/,/g, ''), 10);
-                    }}
-                }}
-
-                const fallbackMatches = Array.from(
-                    normalize(card.textContent).matchAll(boundaryPricePattern)
-                );
-                if (fallbackMatches.length > 0) {{
-                    return parseInt(fallbackMatches[0][1].replace(/,/g, ''), 10);
-                }}
-                return 0;
+            // 카드/노드마다 쓰는 정규식은 스크립트 시작 시 한 번만 만든다
+            const exactRangePattern = /^(\\d{{2}}:\\d{{2}})\\s*-\\s*(\\d{{2}}:\\d{{2}})$/;
+            const exactTimePattern = /^\\d{{2}}:\\d{{2}}$/;
+            const RE_TIME = /{REGEX_TIME}/;
+            const RE_TIME_ALL = /{REGEX_TIME}/g;
+            const RE_STOPS_ALL = /{REGEX_STOPS}/g;
+
+            const textTags = new Set(['P', 'SPAN', 'DIV', 'STRONG', 'EM']);
+            const textFilter = {{
+                acceptNode: (node) => textTags.has(node.tagName)
+                    ? NodeFilter.FILTER_ACCEPT
+                    : NodeFilter.FILTER_SKIP,
             }};
 
-            const readTimes = (card) => {{
-                const ordered = [];
+            // 카드와 하위 텍스트 노드를 TreeWalker 한 번으로 순회하며 가격/시간을 함께 분류
+            const scanCard = (card, cardText) => {{
+                let price = 0;
+                const times = [];
                 const pushTime = (value) => {{
                     if (!value) return;
-                    if (ordered.length === 0 || ordered[ordered.length - 1] !== value) {{
-                        ordered.push(value);
+                    if (times.length === 0 || times[times.length - 1] !== value) {{
+                        times.push(value);
                     }}
                 }};
 
-                const nodes = [card, ...card.querySelectorAll('p, span, div, strong, em')];
-                for (const node of nodes) {{
+                const walker = document.createTreeWalker(card, NodeFilter.SHOW_ELEMENT, textFilter);
+                for (let node = card; node; node = walker.nextNode()) {{
                     const text = normalize(node.textContent);
                     if (!text) continue;
-                    const rangeMatch = text.match(/^(\\d{{2}}:\\d{{2}})\\s*-\\s*(\\d{{2}}:\\d{{2}})$/);
+                    if (!price) {{
+                        const exactMatch = text.match(exactPricePattern);
+                        if (exactMatch) {{
+                            price = toInt(exactMatch[1]);
+                            continue;
+                        }}
+                    }}
+                    const rangeMatch = text.match(exactRangePattern);
                     if (rangeMatch) {{
                         pushTime(rangeMatch[1]);
                         pushTime(rangeMatch[2]);
                         continue;
                     }}
-                    if (/^\\d{{2}}:\\d{{2}}$/.test(text)) {{
+                    if (exactTimePattern.test(text)) {{
                         pushTime(text);
                     }}
                 }}
 
-                if (ordered.length >= 2) {{
-                    return ordered;
+                if (!price) {{
+                    const fallbackMatch = boundaryPricePattern.exec(cardText);
+                    boundaryPricePattern.lastIndex = 0;
+                    if (fallbackMatch) {{
+                        price = toInt(fallbackMatch[1]);
+                    }}
                 }}
 
-                const cardText = normalize(card.textContent);
-                const rangeMatches = cardText.match(/{REGEX_TIME}/g) || [];
-                for (const raw of rangeMatches) {{
-                    const parts = raw.match(/{REGEX_TIME}/);
-                    if (parts && parts.length >= 3) {{
-                        pushTime(parts[1]);
-                        pushTime(parts[2]);
+                if (times.length < 2) {{
+                    const rangeMatches = cardText.match(RE_TIME_ALL) || [];
+                    for (const raw of rangeMatches) {{
+                        const parts = raw.match(RE_TIME);
+                        if (parts && parts.length >= 3) {{
+                            pushTime(parts[1]);
+                            pushTime(parts[2]);
+                        }}
                     }}
                 }}
-                return ordered;
+                return {{ price, times }};
             }};
 
             const readAirlines = (card) => {{
@@ -377,7 +564,7 @@ class ScraperScripts:
             }};
 
             const readStops = (text, isRoundTrip) => {{
-                const stopMatches = Array.from(text.matchAll(/{REGEX_STOPS}/g))
+                const stopMatches = Array.from(text.matchAll(RE_STOPS_ALL))
                     .map((match) => parseInt(match[1], 10) || 0);
                 const directCount = (text.match(/직항/g) || []).length;
 
@@ -403,37 +590,124 @@ class ScraperScripts:
                 return {{ outbound, inbound }};
             }};
 
+            const extractOne = (card) => {{
+                const rawText = card.textContent || '';
+                // 가격('원')이 없는 카드는 TreeWalker 순회 전에 건너뛴다
+                if (rawText.indexOf('원') === -1) return null;
+                const cardText = normalize(rawText);
+                const {{ price, times }} = scanCard(card, cardText);
+                if (price < 1000) return null;
+                if (times.length < 2) return null;
+                const isRoundTrip = times.length >= 4;
+                const airlines = readAirlines(card);
+                const airline = airlines[0] || "기타";
+                const returnAirline = isRoundTrip ? (airlines[1] || airline) : '';
+                const stops = readStops(cardText, isRoundTrip);
+
+                return {{
+                    airline: airline,
+                    returnAirline: returnAirline,
+                    price: price,
+                    depTime: times[0],
+                    arrTime: times[1],
+                    stops: stops.outbound,
+                    retDepTime: isRoundTrip ? times[2] : '',
+                    retArrTime: isRoundTrip ? times[3] : '',
+                    retStops: isRoundTrip ? stops.inbound : 0,
+                    isRoundTrip: isRoundTrip
+                }};
+            }};
+
+            // 스크롤 사이에 유지되는 window.__seenFlights가 있으면 이미 보낸 행은 건너뛴다
+            const seen = window.__seenFlights instanceof Set ? window.__seenFlights : null;
             for (const card of cards) {{
-                try {{
-                    const price = readPrice(card);
-                    if (price < 1000) continue;
-
-                    const times = readTimes(card);
-                    if (times.length < 2) continue;
-                    const isRoundTrip = times.length >= 4;
-                    const airlines = readAirlines(card);
-                    const airline = airlines[0] || "기타";
-                    const returnAirline = isRoundTrip ? (airlines[1] || airline) : '';
-                    const stops = readStops(normalize(card.textContent), isRoundTrip);
-
-                    results.push({{
-                        airline: airline,
-                        returnAirline: returnAirline,
-                        price: price,
-                        depTime: times[0],
-                        arrTime: times[1],
-                        stops: stops.outbound,
-                        retDepTime: isRoundTrip ? times[2] : '',
-                        retArrTime: isRoundTrip ? times[3] : '',
-                        retStops: isRoundTrip ? stops.inbound : 0,
-                        isRoundTrip: isRoundTrip
-                    }});
-                }} catch (e) {{ }}
+                const item = extractOne(card);
+                if (!item) continue;
+                if (seen) {{
+                    const key = [
+                        item.airline, item.returnAirline, item.price, item.depTime, item.arrTime,
+                        item.stops, item.retDepTime, item.retArrTime, item.retStops,
+                    ].join('|');
+                    if (seen.has(key)) continue;
+                    seen.add(key);
+                }}
+                results.push(item);
+            }}
+            if (topK > 0 && results.length > topK) {{
+                // 가격 0(미확인)은 뒤로 보내고, 같은 가격은 화면 순서를 유지한다
+                const rank = (item) => item.price > 0 ? item.price : Infinity;
+                results.sort((a, b) => rank(a) - rank(b));
+                results.length = topK;
             }}
             return results;
         }}
         """
 
+    # 추출 함수를 인자로 받아 추출 → 스크롤 → 대기 → 높이 측정을 수행
+    # 대기는 최대 pauseMs이며, 페이지 높이가 늘어나면 바로 끝낸다.
+    _INTERNATIONAL_SCROLL_STEP_JS = """
+        async (pauseMs, extract, topK = 0) => {
+            const items = extract(topK);
+            const before = document.body.scrollHeight;
+            window.scrollTo(0, before);
+            const deadline = Date.now() + pauseMs;
+            while (Date.now() < deadline && document.body.scrollHeight <= before) {
+                await new Promise((resolve) => setTimeout(resolve, Math.min(50, pauseMs)));
+            }
+            return { items, newHeight: document.body.scrollHeight };
+        }
+    """
+
+    @staticmethod
+    def get_international_scroll_and_extract_script(pause_ms, top_k=0):
+        """국제선 추출+스크롤+대기를 한 번의 evaluate로 묶은 async JS"""
+        return ScraperScripts._international_scroll_and_extract_script(int(pause_ms), max(0, int(top_k)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _international_scroll_and_extract_script(pause_ms, top_k):
+        extract_js = ScraperScripts.get_international_prices_script()
+        step_js = ScraperScripts._INTERNATIONAL_SCROLL_STEP_JS
+        return f"async () => ({step_js})({pause_ms}, ({extract_js}), {top_k})"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_extractors_init_script():
+        """국제선 추출 함수를 window.__flightExtractors에 한 번 설치하는 init script"""
+        extract_js = ScraperScripts.get_international_prices_script()
+        fallback_js = ScraperScripts.get_international_prices_fallback_script()
+        step_js = ScraperScripts._INTERNATIONAL_SCROLL_STEP_JS
+        return f"""
+        (() => {{
+            const intl = ({extract_js});
+            const intlFallback = ({fallback_js});
+            const step = ({step_js});
+            window.__flightExtractors = {{
+                intl,
+                intlFallback,
+                intlScroll: (pauseMs, topK = 0) => step(pauseMs, intl, topK),
+            }};
+        }})()
+        """
+
+    @staticmethod
+    def get_installed_international_scroll_script(pause_ms, top_k=0):
+        """설치된 추출 함수를 이름으로 호출하는 짧은 JS (미설치 시 null)"""
+        return (
+            "() => window.__flightExtractors "
+            f"? window.__flightExtractors.intlScroll({int(pause_ms)}, {max(0, int(top_k))}) : null"
+        )
+
+    @staticmethod
+    def get_installed_international_fallback_script():
+        """설치된 보조 추출 함수를 이름으로 호출하는 짧은 JS (미설치 시 null)"""
+        return "() => window.__flightExtractors ? window.__flightExtractors.intlFallback() : null"
+
+    @staticmethod
+    def get_reset_seen_flights_script():
+        """증분 추출용 window.__seenFlights 초기화 JS"""
+        return "() => { window.__seenFlights = new Set(); }"
+
     @staticmethod
     def get_click_flight_by_details_script(airline: str, dep_time: str, arr_time: str, price_text: str):
         """특정 항공편(항공사/시간/가격) 클릭 JS"""
@@ -461,6 +735,48 @@ class ScraperScripts:
         }}
         """
 
+    @staticmethod
+    def get_click_flight_with_fallback_script(
+        airline: str, dep_time: str, arr_time: str, price_text: str, airlines_js_list
+    ):
+        """특정 항공편 클릭을 시도하고 실패 시 같은 순회에서 찾은 일반 항공편을 클릭하는 JS"""
+        airline_js = json.dumps(airline or "")
+        dep_js = json.dumps(dep_time or "")
+        arr_js = json.dumps(arr_time or "")
+        price_js = json.dumps(price_text or "")
+        airline_re = ScraperScripts._airline_regex(ScraperScripts._airline_key(airlines_js_list))
+        return f"""
+        () => {{
+            const airline = {airline_js};
+            const dep = {dep_js};
+            const arr = {arr_js};
+            const priceText = {price_js};
+            const RE_AIRLINE = {airline_re};
+            let fallback = null;
+            for (const btn of document.querySelectorAll('button')) {{
+                const text = btn.textContent || '';
+                if ((!airline || text.includes(airline)) &&
+                    (!dep || text.includes(dep)) &&
+                    (!arr || text.includes(arr)) &&
+                    (!priceText || text.includes(priceText))) {{
+                    btn.click();
+                    return {{ clicked: true, strategy: 'specific' }};
+                }}
+                if (!fallback &&
+                    /{REGEX_TIME}/.test(text) &&
+                    /[0-9,]+\\s*원/.test(text) &&
+                    RE_AIRLINE.test(text)) {{
+                    fallback = btn;
+                }}
+            }}
+            if (fallback) {{
+                fallback.click();
+                return {{ clicked: true, strategy: 'fallback' }};
+            }}
+            return {{ clicked: false, strategy: '' }};
+        }}
+        """
+
     @staticmethod
     def get_international_prices_fallback_script():
         """국제선 가격 추출 보조 JS (구조 변경 대비)"""
@@ -471,6 +787,15 @@ class ScraperScripts:
                 'li[data-index], div[data-index], li[class*="result"], div[class*="result"], li[class*="ticket"], div[class*="ticket"]'
             );
             const normalize = (value) => (value || '').replace(/\\s+/g, ' ').trim();
+            // 숫자 외 문자(쉼표 등)를 건너뛰며 정수로 누적 - 중간 문자열/정규식 없이 변환
+            const toInt = (value) => {{
+                let parsed = 0;
+                for (let i = 0; i < value.length; i++) {{
+                    const code = value.charCodeAt(i);
+                    if (code >= 48 && code <= 57) parsed = parsed * 10 + (code - 48);
+                }}
+                return parsed;
+            }};
             const boundaryPricePattern = /(?:^|[^0-9,])(\\d{{1,3}}(?:,\\d{{3}}){{1,2}})\\s*원/g;
 
             const readAirlines = (card) => {{
@@ -486,63 +811,155 @@ class ScraperScripts:
                 return unique;
             }};
 
-            for (const card of candidates) {{
-                try {{
-                    const text = normalize(card.textContent);
-                    const priceMatches = Array.from(text.matchAll(boundaryPricePattern));
-                    if (priceMatches.length === 0) continue;
-                    const price = parseInt(priceMatches[0][1].replace(/,/g, ''), 10);
-
-                    const timeMatches = text.match(/{REGEX_TIME}/g) || [];
-                    const times = [];
-                    for (const t of timeMatches) {{
-                        const parts = t.match(/{REGEX_TIME}/);
-                        if (parts && parts.length >= 3) {{
-                            times.push(parts[1], parts[2]);
-                        }}
-                    }}
-                    if (times.length < 2) continue;
-
-                    const isRoundTrip = times.length >= 4;
-                    const airlines = readAirlines(card);
-                    const airline = airlines[0] || "기타";
-                    const returnAirline = isRoundTrip ? (airlines[1] || airline) : '';
-
-                    let stops = 0;
-                    let retStops = 0;
-                    const stopMatches = text.match(/{REGEX_STOPS}/g);
-                    if (stopMatches) {{
-                        stops = parseInt(stopMatches[0].replace(/[^0-9]/g, ''));
-                        retStops = (stopMatches.length > 1)
-                            ? parseInt(stopMatches[1].replace(/[^0-9]/g, ''))
-                            : stops;
-                    }} else if (text.includes("직항")) {{
-                        stops = 0;
-                        retStops = 0;
-                    }} else {{
-                        stops = 1;
-                        retStops = 1;
+            const extractOne = (card) => {{
+                const rawText = card.textContent || '';
+                if (rawText.indexOf('원') === -1) return null;
+                const text = normalize(rawText);
+                const priceMatches = Array.from(text.matchAll(boundaryPricePattern));
+                if (priceMatches.length === 0) return null;
+                const price = toInt(priceMatches[0][1]);
+
+                const timeMatches = text.match(/{REGEX_TIME}/g) || [];
+                const times = [];
+                for (const t of timeMatches) {{
+                    const parts = t.match(/{REGEX_TIME}/);
+                    if (parts && parts.length >= 3) {{
+                        times.push(parts[1], parts[2]);
                     }}
+                }}
+                if (times.length < 2) return null;
+
+                const isRoundTrip = times.length >= 4;
+                const airlines = readAirlines(card);
+                const airline = airlines[0] || "기타";
+                const returnAirline = isRoundTrip ? (airlines[1] || airline) : '';
+
+                let stops = 0;
+                let retStops = 0;
+                const stopMatches = text.match(/{REGEX_STOPS}/g);
+                if (stopMatches) {{
+                    stops = toInt(stopMatches[0]);
+                    retStops = (stopMatches.length > 1)
+                        ? toInt(stopMatches[1])
+                        : stops;
+                }} else if (text.includes("직항")) {{
+                    stops = 0;
+                    retStops = 0;
+                }} else {{
+                    stops = 1;
+                    retStops = 1;
+                }}
+
+                return {{
+                    airline: airline,
+                    returnAirline: returnAirline,
+                    price: price,
+                    depTime: times[0],
+                    arrTime: times[1],
+                    stops: stops,
+                    retDepTime: isRoundTrip ? times[2] : '',
+                    retArrTime: isRoundTrip ? times[3] : '',
+                    retStops: retStops,
+                    isRoundTrip: isRoundTrip
+                }};
+            }};
 
-                    results.push({{
-                        airline: airline,
-                        returnAirline: returnAirline,
-                        price: price,
-                        depTime: times[0],
-                        arrTime: times[1],
-                        stops: stops,
-                        retDepTime: isRoundTrip ? times[2] : '',
-                        retArrTime: isRoundTrip ? times[3] : '',
-                        retStops: retStops,
-                        isRoundTrip: isRoundTrip
-                    }});
-                    if (results.length >= 300) break;
-                }} catch (e) {{ }}
+            // 후보 selector가 겹치는 카드(중첩 컨테이너 등)는 안정 키로 한 번만 반환
+            const seen = new Set();
+            for (const card of candidates) {{
+                const item = extractOne(card);
+                if (!item) continue;
+                const key = [
+                    item.airline, item.returnAirline, item.price, item.depTime, item.arrTime,
+                    item.stops, item.retDepTime, item.retArrTime, item.retStops,
+                ].join('|');
+                if (seen.has(key)) continue;
+                seen.add(key);
+                results.push(item);
+                if (results.length >= 300) break;
             }}
             return results;
         }}
         """
 
+    @staticmethod
+    def get_wait_for_results_script(selectors):
+        """대기 selector 목록 중 처음 보이는 항목 이름을 반환하는 JS (없으면 false)"""
+        return ScraperScripts._wait_for_results_script(tuple(selectors))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _wait_for_results_script(selectors):
+        checks = []
+        for selector in selectors:
+            name_js = json.dumps(selector, ensure_ascii=False)
+            text_match = re.fullmatch(r"text=/(.*)/([a-z]*)", selector)
+            has_text_match = re.fullmatch(r'(.+?):has-text\("(.*)"\)', selector)
+            if text_match:
+                pattern_js = json.dumps(text_match.group(1), ensure_ascii=False)
+                flags_js = json.dumps(text_match.group(2))
+                check = f"() => new RegExp({pattern_js}, {flags_js}).test(bodyText())"
+            elif has_text_match:
+                base_js = json.dumps(has_text_match.group(1), ensure_ascii=False)
+                text_js = json.dumps(has_text_match.group(2), ensure_ascii=False)
+                check = (
+                    f"() => Array.prototype.some.call(document.querySelectorAll({base_js}), "
+                    f"(el) => (el.textContent || '').includes({text_js}) && isVisible(el))"
+                )
+            else:
+                check = f"() => Array.prototype.some.call(document.querySelectorAll({name_js}), isVisible)"
+            checks.append(f"[{name_js}, {check}]")
+        checks_js = ",\n                ".join(checks)
+        return f"""
+        () => {{
+            let cachedText = null;
+            const bodyText = () => {{
+                if (cachedText === null) cachedText = document.body ? document.body.innerText || '' : '';
+                return cachedText;
+            }};
+            // wait_for_selector 기본값(visible)과 같게: 크기가 있고 visibility:hidden이 아닌 요소만 인정
+            const isVisible = (el) => {{
+                const rect = el.getBoundingClientRect();
+                if (rect.width <= 0 || rect.height <= 0) return false;
+                return window.getComputedStyle(el).visibility !== 'hidden';
+            }};
+            const checks = [
+                {checks_js}
+            ];
+            for (const [name, check] of checks) {{
+                try {{
+                    if (check()) return name;
+                }} catch (e) {{}}
+            }}
+            return false;
+        }}
+        """
+
+    @staticmethod
+    def get_domestic_return_view_script():
+        """오는편 화면 전환 확인 JS (wait_for_function 폴링용)"""
+        return """
+        () => {
+            const bodyText = document.body?.innerText || '';
+            if (!bodyText.includes('오는편')) return false;
+            const pricePattern = /\\d{1,3}(,\\d{3})+\\s*원/;
+            const countPrices = (selector, needed) => {
+                let count = 0;
+                for (const node of document.querySelectorAll(selector)) {
+                    if (pricePattern.test(node.textContent || '')) {
+                        count += 1;
+                        if (count >= needed) break;
+                    }
+                }
+                return count;
+            };
+            // 항공편 카드는 button이므로 먼저 좁게 세고, 부족할 때만 li/span까지 넓혀 확인한다.
+            const buttonCount = countPrices('button', 5);
+            if (buttonCount >= 5) return true;
+            return buttonCount + countPrices('li, span', 5 - buttonCount) >= 5;
+        }
+        """
+
     @staticmethod
     def get_scroll_check_script():
         """스크롤 가능 여부 및 최하단 도달 체크 JS"""
@@ -561,14 +978,18 @@ class ScraperScripts:
             if (!isAtBottom) {
                 window.scrollBy(0, 500); 
             } else {
-                // 2. 컨테이너 스크롤 시도
-                const containers = [
-                    document.querySelector('div[scrollable="true"]'),
-                    document.querySelector('[class*="flightList"]'),
-                    document.querySelector('[class*="resultList"]'),
-                    document.querySelector('.ReactVirtualizados'),
-                    document.querySelector('div[style*="overflow"]'),
-                ];
+                // 2. 컨테이너 스크롤 시도 (후보 노드는 window에 캐시하고, 비었거나 DOM에서 떨어진 노드가 있을 때만 다시 찾는다)
+                let containers = window.__scrollContainers;
+                if (!containers || !containers.length || containers.some((node) => !node.isConnected)) {
+                    containers = [
+                        document.querySelector('div[scrollable="true"]'),
+                        document.querySelector('[class*="flightList"]'),
+                        document.querySelector('[class*="resultList"]'),
+                        document.querySelector('.ReactVirtualizados'),
+                        document.querySelector('div[style*="overflow"]'),
+                    ].filter(Boolean);
+                    window.__scrollContainers = containers;
+                }
                 
                 for (const container of containers) {
                     if (container && container.scrollHeight > container.clientHeight) {
@@ -20,6 +20,7 @@ from scraping.errors import (
     DataExtractionError,
 )
 from scraping.models import FlightResult
+from scraping.playwright_browser import shared_browser_scope
 from scraping.playwright_scraper import PlaywrightScraper
 from scraping.searcher import FlightSearcher
 from scraping.parallel import ParallelSearcher
@@ -35,4 +36,5 @@ __all__ = [
     "PlaywrightScraper",
     "FlightSearcher",
     "ParallelSearcher",
+    "shared_browser_scope",
 ]
@@ -1,10 +1,12 @@
 """Scraper data models."""
 
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class FlightResult:
     """항공권 검색 결과."""
 
@@ -36,4 +38,18 @@ class FlightResult:
     extraction_source: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # 필드가 모두 스칼라라 asdict의 재귀 복사 없이 바로 만든다.
+        return {name: getattr(self, name) for name in _FLIGHT_RESULT_FIELDS}
+
+    def __copy__(self) -> "FlightResult":
+        # copy.copy의 기본 reduce 경로 대신 필드 값을 한 번에 꺼내 생성자에 넘긴다.
+        return FlightResult(*_flight_result_values(self))
+
+
+_FLIGHT_RESULT_FIELDS = tuple(field.name for field in fields(FlightResult))
+_flight_result_values = attrgetter(*_FLIGHT_RESULT_FIELDS)
+
+
+def intern_airline(name: str) -> str:
+    """항공사명을 intern해 결과마다 같은 문자열 객체를 공유한다."""
+    return sys.intern(name) if type(name) is str else name
@@ -2,13 +2,64 @@
 
 import heapq
 import logging
-from typing import Callable, Dict, List, Optional
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from scraping.models import FlightResult
+from scraping.playwright_browser import shared_browser_scope
 from scraping.searcher import FlightSearcher
 
 logger = logging.getLogger(__name__)
 
+
+def _iter_lane_results(
+    task: Callable[[FlightSearcher, Any], Any],
+    items: Sequence[Any],
+    lanes: int,
+) -> Iterator[Tuple[bool, Any]]:
+    """작업을 lanes개 스레드로 나눠 실행하고 완료 순서대로 (성공 여부, 결과/예외)를 내보낸다.
+
+    각 스레드는 shared_browser_scope 안에서 FlightSearcher 하나로 여러 작업을 차례로
+    처리하므로 작업마다 Chromium이나 검색기를 새로 만들지 않는다. 백그라운드 검색은
+    끝날 때 페이지/컨텍스트만 닫으므로 같은 검색기로 다음 작업을 바로 이어갈 수 있다.
+    """
+
+    pending: "queue.Queue[Any]" = queue.Queue()
+    for item in items:
+        pending.put(item)
+    finished: "queue.Queue[Tuple[bool, Any]]" = queue.Queue()
+
+    def lane() -> None:
+        searcher: Optional[FlightSearcher] = None
+        with shared_browser_scope():
+            try:
+                while True:
+                    try:
+                        item = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        if searcher is None:
+                            searcher = FlightSearcher()
+                        finished.put((True, task(searcher, item)))
+                    except Exception as exc:
+                        finished.put((False, exc))
+            finally:
+                if searcher is not None:
+                    try:
+                        searcher.close()
+                    except Exception as exc:
+                        logger.debug(f"Lane searcher close error: {exc}")
+
+    lane_count = max(1, min(lanes, len(items)))
+    with ThreadPoolExecutor(max_workers=lane_count) as executor:
+        for _ in range(lane_count):
+            executor.submit(lane)
+        for _ in range(len(items)):
+            yield finished.get()
+
+
 class ParallelSearcher:
     """다중 검색을 병렬로 실행하는 검색 엔진"""
 
@@ -23,14 +74,12 @@ class ParallelSearcher:
                                      progress_callback: Optional[Callable[[str], None]] = None) -> Dict[str, List[FlightResult]]:
         """여러 목적지를 병렬로 검색"""
         import threading
-        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         self._lock = threading.Lock()
         self.results = {}
 
-        def search_single(dest: str) -> tuple:
+        def search_single(searcher: FlightSearcher, dest: str) -> tuple:
             """단일 목적지 검색"""
-            searcher = FlightSearcher()
             try:
                 def emit(msg):
                     if progress_callback:
@@ -69,27 +118,22 @@ class ParallelSearcher:
             except Exception as e:
                 logger.error(f"Parallel search error for {dest}: {e}")
                 return dest, []
-            finally:
-                searcher.close()
 
         if progress_callback:
             progress_callback(f"🚀 병렬 검색 시작: {len(destinations)}개 목적지 (동시 {self.max_concurrent}개)")
 
-        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-            futures = {executor.submit(search_single, dest): dest for dest in destinations}
+        for ok, payload in _iter_lane_results(search_single, destinations, self.max_concurrent):
+            if not ok:
+                logger.error(f"Future error: {payload}")
+                continue
+            dest, results = payload
+            with self._lock:
+                self.results[dest] = results
 
-            for future in as_completed(futures):
-                try:
-                    dest, results = future.result()
-                    with self._lock:
-                        self.results[dest] = results
-
-                    if progress_callback:
-                        count = len(results)
-                        cheapest = min((r.price for r in results), default=0) if results else 0
-                        progress_callback(f"✅ {dest} 완료: {count}개 결과, 최저가 {cheapest:,}원")
-                except Exception as e:
-                    logger.error(f"Future error: {e}")
+            if progress_callback:
+                count = len(results)
+                cheapest = min((r.price for r in results), default=0) if results else 0
+                progress_callback(f"✅ {dest} 완료: {count}개 결과, 최저가 {cheapest:,}원")
 
         if progress_callback:
             progress_callback(f"🏁 병렬 검색 완료: {len(self.results)}개 목적지")
@@ -102,13 +146,12 @@ class ParallelSearcher:
                           progress_callback: Optional[Callable[[str], None]] = None) -> Dict[str, tuple]:
         """여러 날짜를 병렬로 검색"""
         import threading
-        from concurrent.futures import ThreadPoolExecutor, as_completed
         from datetime import datetime, timedelta
 
         self._lock = threading.Lock()
         date_results = {}
 
-        def search_single_date(dep_date: str) -> tuple:
+        def search_single_date(searcher: FlightSearcher, dep_date: str) -> tuple:
             """단일 날짜 검색"""
             ret_date = None
             if return_offset > 0:
@@ -118,7 +161,6 @@ class ParallelSearcher:
                 except Exception:
                     pass
 
-            searcher = FlightSearcher()
             try:
                 # 조용히 실행
                 scraper = getattr(searcher, "scraper", None)
@@ -157,31 +199,26 @@ class ParallelSearcher:
             except Exception as e:
                 logger.error(f"Date search error for {dep_date}: {e}")
                 return dep_date, (0, "Error")
-            finally:
-                searcher.close()
 
         if progress_callback:
             progress_callback(f"🚀 날짜 병렬 검색: {len(dates)}일 (동시 {self.max_concurrent}개)")
 
-        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-            futures = {executor.submit(search_single_date, d): d for d in dates}
-            completed = 0
-
-            for future in as_completed(futures):
-                try:
-                    dep_date, price_info = future.result()
-                    with self._lock:
-                        date_results[dep_date] = price_info
-                        completed += 1
-
-                    if progress_callback:
-                        price, airline = price_info
-                        if price > 0:
-                            progress_callback(f"📅 {dep_date}: {price:,}원 ({airline}) [{completed}/{len(dates)}]")
-                        else:
-                            progress_callback(f"📅 {dep_date}: 결과 없음 [{completed}/{len(dates)}]")
-                except Exception as e:
-                    logger.error(f"Future error: {e}")
+        completed = 0
+        for ok, payload in _iter_lane_results(search_single_date, dates, self.max_concurrent):
+            if not ok:
+                logger.error(f"Future error: {payload}")
+                continue
+            dep_date, price_info = payload
+            with self._lock:
+                date_results[dep_date] = price_info
+                completed += 1
+
+            if progress_callback:
+                price, airline = price_info
+                if price > 0:
+                    progress_callback(f"📅 {dep_date}: {price:,}원 ({airline}) [{completed}/{len(dates)}]")
+                else:
+                    progress_callback(f"📅 {dep_date}: 결과 없음 [{completed}/{len(dates)}]")
 
         if progress_callback:
             progress_callback(f"🏁 날짜 검색 완료: {len(date_results)}일")
@@ -2,22 +2,142 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import re
+import sys
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, cast
 
+import playwright
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
 import scraper_config
+from scraper_config import ScraperScripts
 from scraping.errors import BrowserInitError
 
 if TYPE_CHECKING:
+    from playwright._impl._api_structures import StorageState
+
     from scraping.playwright_scraper import PlaywrightScraper
 
 
 logger = logging.getLogger("ScraperV2")
 
+# PW_INSPECT_STACK=1 이면 Playwright 기본 호출 스택 수집을 유지한다 (디버깅용).
+PW_INSPECT_STACK_ENV = "PW_INSPECT_STACK"
+
+
+_PLAYWRIGHT_PACKAGE_DIR = os.path.dirname(os.path.abspath(playwright.__file__))
+# apiName을 찾을 때 거슬러 올라갈 최대 프레임 수 (sync API 진입점은 몇 단계 위에 있다)
+_API_NAME_FRAME_LIMIT = 16
+
+
+def _api_name_from_frames() -> str:
+    """호출 스택에서 사용자 코드 바로 아래의 Playwright 프레임 이름 (예: "Page.goto")."""
+    try:
+        frame = sys._getframe(2)
+    except ValueError:
+        return ""
+    api_frame = None
+    for _ in range(_API_NAME_FRAME_LIMIT):
+        if frame is None or not frame.f_code.co_filename.startswith(_PLAYWRIGHT_PACKAGE_DIR):
+            break
+        api_frame = frame
+        frame = frame.f_back
+    if api_frame is None:
+        return ""
+    owner = api_frame.f_locals.get("self")
+    name = api_frame.f_code.co_name
+    return f"{type(owner).__name__}.{name}" if owner is not None else name
+
+
+def _light_stack_trace() -> Dict[str, Any]:
+    # 호출마다 제자리 수정(title 등)되므로 매번 새 dict를 돌려준다.
+    # 오류 메시지("Page.goto: ...")와 internal 표시에 쓰이는 apiName은 유지하고 프레임 목록만 생략한다.
+    return {"frames": [], "apiName": _api_name_from_frames(), "title": None}
+
+
+def install_fast_stack_capture() -> bool:
+    """sync API 호출마다 도는 전체 프레임 순회를 가벼운 버전으로 교체"""
+    if os.environ.get(PW_INSPECT_STACK_ENV, "0") != "0":
+        return False
+    try:
+        from playwright._impl import _sync_base
+    except Exception as exc:
+        logger.debug("Playwright 스택 패치 건너뜀: %s", exc)
+        return False
+    if not callable(getattr(_sync_base, "_capture_stack_trace", None)):
+        return False
+    setattr(_sync_base, "_capture_stack_trace", _light_stack_trace)
+    return True
+
+
+install_fast_stack_capture()
+
+
+class _SharedBrowserSlot:
+    """Browser shared by every scraper on one thread inside shared_browser_scope()."""
+
+    def __init__(self) -> None:
+        self.playwright: Any = None
+        self.browser: Any = None
+        self.headless: Optional[bool] = None
+
+    def is_usable(self, headless: bool) -> bool:
+        if self.browser is None or self.headless != bool(headless):
+            return False
+        try:
+            return bool(self.browser.is_connected())
+        except Exception:
+            return False
+
+    def shutdown(self) -> None:
+        for name, closer in (("browser", "close"), ("playwright", "stop")):
+            resource = getattr(self, name)
+            if not resource:
+                continue
+            try:
+                getattr(resource, closer)()
+            except Exception as exc:
+                logger.debug("공유 %s 정리 중 오류 (무시): %s", name, exc)
+            finally:
+                setattr(self, name, None)
+        self.headless = None
+
+
+# Playwright sync 객체는 생성한 스레드에서만 쓸 수 있으므로 스레드별로 공유한다.
+_thread_state = threading.local()
+
+
+def _active_shared_slot() -> Optional[_SharedBrowserSlot]:
+    return getattr(_thread_state, "slot", None)
+
+
+@contextmanager
+def shared_browser_scope() -> Iterator[None]:
+    """Reuse one background browser for every search run on this thread.
+
+    스코프 안에서 만든 스크래퍼는 브라우저를 빌려 쓰고 컨텍스트만 닫으며,
+    브라우저 프로세스는 스코프를 빠져나갈 때 한 번만 종료된다.
+    """
+
+    if _active_shared_slot() is not None:
+        yield
+        return
+
+    slot = _SharedBrowserSlot()
+    _thread_state.slot = slot
+    try:
+        yield
+    finally:
+        _thread_state.slot = None
+        slot.shutdown()
+
 
 def init_browser(
     scraper: "PlaywrightScraper",
@@ -32,6 +152,25 @@ def init_browser(
             log_func(message)
         logger.info(message)
 
+    if not user_data_dir and _browser_reusable(scraper, headless):
+        log("♻️ 실행 중인 브라우저를 재사용합니다.")
+        return
+
+    # 재사용할 수 없는 이전 인스턴스는 정리한 뒤 새로 시작한다.
+    close_resources(scraper)
+
+    shared_slot = None if user_data_dir else _active_shared_slot()
+    if shared_slot is not None:
+        if shared_slot.is_usable(headless):
+            scraper.playwright = shared_slot.playwright
+            scraper.browser = shared_slot.browser
+            scraper._browser_headless = bool(headless)
+            scraper._shared_browser = True
+            log("♻️ 공유 브라우저를 재사용합니다.")
+            return
+        # 같은 스레드에서 sync_playwright를 두 번 시작할 수 없으므로 기존 공유 인스턴스를 먼저 내린다.
+        shared_slot.shutdown()
+
     log("🌐 Playwright 브라우저 시작 중...")
 
     try:
@@ -99,6 +238,12 @@ def init_browser(
                 log(f"  - {browser_name} 시작 성공 (Persistent Context)")
             else:
                 scraper.browser = playwright.chromium.launch(**launch_options)
+                scraper._browser_headless = bool(headless)
+                if shared_slot is not None:
+                    shared_slot.playwright = playwright
+                    shared_slot.browser = scraper.browser
+                    shared_slot.headless = bool(headless)
+                    scraper._shared_browser = True
                 log(f"  - {browser_name} 시작 성공")
             return
         except Exception as exc:
@@ -121,6 +266,51 @@ def init_browser(
     raise BrowserInitError(error_message)
 
 
+def _browser_reusable(scraper: "PlaywrightScraper", headless: bool) -> bool:
+    """Whether the launched (non-persistent) browser can serve another search."""
+
+    browser = scraper.browser
+    if browser is None or scraper.playwright is None or scraper.context is not None:
+        return False
+    if scraper._browser_headless != bool(headless):
+        return False
+    try:
+        return bool(browser.is_connected())
+    except Exception:
+        return False
+
+
+_BLOCKED_RESOURCE_RE = re.compile(scraper_config.BACKGROUND_BLOCKED_RESOURCE_PATTERN, re.IGNORECASE)
+
+
+def _abort_route(route: Any) -> None:
+    try:
+        route.abort()
+    except Exception as exc:
+        logger.debug("리소스 차단 실패 (무시): %s", exc)
+
+
+def configure_resource_blocking(context: Any) -> None:
+    """Abort static asset requests on a background context.
+
+    URL 패턴 하나만 등록하므로 일치하지 않는 요청은 Python 핸들러를 거치지 않는다.
+    """
+
+    try:
+        context.route(_BLOCKED_RESOURCE_RE, _abort_route)
+    except Exception as exc:
+        logger.debug("리소스 차단 설정 실패 (무시): %s", exc)
+
+
+def install_extractor_scripts(context: Any) -> None:
+    """Register the extraction bundle so every page can call it by name."""
+
+    try:
+        context.add_init_script(script=ScraperScripts.get_extractors_init_script())
+    except Exception as exc:
+        logger.debug("추출 스크립트 설치 실패 (무시): %s", exc)
+
+
 def wait_for_results(
     scraper: "PlaywrightScraper",
     is_domestic: bool,
@@ -137,35 +327,41 @@ def wait_for_results(
         if is_domestic
         else scraper_config.INTERNATIONAL_WAIT_SELECTORS
     )
-    per_timeout = max(1000, timeout_ms // max(len(selectors), 1))
-
-    for selector in selectors:
-        started = time.perf_counter()
-        try:
-            scraper.page.wait_for_selector(selector, timeout=per_timeout)
-            duration_ms = int((time.perf_counter() - started) * 1000)
-            scraper._emit_telemetry(
-                "selector_wait",
-                success=True,
-                route=scraper._current_route,
-                selector_name=selector,
-                duration_ms=duration_ms,
-            )
-            return {"found": True, "selector": selector}
-        except PlaywrightTimeoutError:
-            duration_ms = int((time.perf_counter() - started) * 1000)
+    # 후보 selector를 하나의 predicate로 묶어 브라우저가 매 폴링마다 모두 확인하게 한다.
+    script = ScraperScripts.get_wait_for_results_script(selectors)
+    started = time.perf_counter()
+    try:
+        handle = scraper.page.wait_for_function(
+            script,
+            timeout=timeout_ms,
+            polling=scraper_config.RESULT_WAIT_POLLING_MS,
+        )
+        selector = str(handle.json_value() or "")
+    except PlaywrightTimeoutError:
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        # 모든 후보가 같은 시간 동안 충족되지 않았으므로 selector별 실패로 각각 기록한다.
+        for selector_name in selectors:
             scraper._emit_telemetry(
                 "selector_wait",
                 success=False,
                 route=scraper._current_route,
-                selector_name=selector,
+                selector_name=selector_name,
                 duration_ms=duration_ms,
                 error_code="SELECTOR_TIMEOUT",
             )
-            if log_func:
-                log_func(f"⚠️ 결과 대기 실패: {selector}")
+        if log_func:
+            log_func(f"⚠️ 결과 대기 실패: {len(selectors)}개 selector 모두 시간 초과")
+        return {"found": False, "selector": ""}
 
-    return {"found": False, "selector": ""}
+    duration_ms = int((time.perf_counter() - started) * 1000)
+    scraper._emit_telemetry(
+        "selector_wait",
+        success=True,
+        route=scraper._current_route,
+        selector_name=selector,
+        duration_ms=duration_ms,
+    )
+    return {"found": True, "selector": selector}
 
 
 def wait_for_domestic_return_view(scraper: "PlaywrightScraper") -> bool:
@@ -177,21 +373,8 @@ def wait_for_domestic_return_view(scraper: "PlaywrightScraper") -> bool:
     timeout_ms = int(max(5, scraper_config.DOMESTIC_RETURN_WAIT_TIMEOUT_SECONDS) * 1000)
     try:
         scraper.page.wait_for_function(
-            """
-            () => {
-                const bodyText = document.body?.innerText || '';
-                const priceNodes = document.querySelectorAll('button, li, span');
-                let priceCount = 0;
-                for (const node of priceNodes) {
-                    const text = node.textContent || '';
-                    if (/\\d{1,3}(,\\d{3})+\\s*원/.test(text)) {
-                        priceCount += 1;
-                        if (priceCount >= 5) break;
-                    }
-                }
-                return bodyText.includes('오는편') && priceCount >= 5;
-            }
-            """,
+            ScraperScripts.get_domestic_return_view_script(),
+            polling=scraper_config.RESULT_WAIT_POLLING_MS,
             timeout=timeout_ms,
         )
         return True
@@ -199,6 +382,60 @@ def wait_for_domestic_return_view(scraper: "PlaywrightScraper") -> bool:
         return False
 
 
+def load_storage_state(path: Optional[str]) -> Optional["StorageState"]:
+    """Read a saved context storage state, or None when missing/unreadable."""
+
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (OSError, ValueError) as exc:
+        logger.debug("저장된 스토리지 상태를 읽지 못함 (무시): %s", exc)
+        return None
+    return cast("StorageState", state) if isinstance(state, dict) else None
+
+
+def save_storage_state(context: Any, path: Optional[str]) -> bool:
+    """Persist cookies/localStorage of a context so the next search starts warm."""
+
+    if context is None or not path:
+        return False
+    try:
+        state = context.storage_state()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 병렬 검색이 같은 파일을 쓰므로 임시 파일에 쓴 뒤 교체해 반쯤 쓰인 파일을 남기지 않는다.
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(state, handle, ensure_ascii=False)
+        os.replace(temp_path, path)
+        return True
+    except Exception as exc:
+        logger.debug("스토리지 상태 저장 실패 (무시): %s", exc)
+        return False
+
+
+def close_search_session(scraper: "PlaywrightScraper") -> None:
+    """Close the per-search page/context but keep the browser process alive."""
+
+    if scraper._storage_state_path:
+        save_storage_state(scraper.context, scraper._storage_state_path)
+        scraper._storage_state_path = None
+
+    for name in ("page", "context"):
+        resource = getattr(scraper, name)
+        if not resource:
+            continue
+        try:
+            resource.close()
+        except Exception as exc:
+            logger.debug("%s 정리 중 오류 (무시): %s", name, exc)
+        finally:
+            setattr(scraper, name, None)
+
+    scraper.manual_mode = False
+
+
 def close_resources(scraper: "PlaywrightScraper") -> None:
     """Close every Playwright resource on the scraper instance."""
 
@@ -209,9 +446,14 @@ def close_resources(scraper: "PlaywrightScraper") -> None:
         ("playwright", scraper.playwright),
     ]
 
+    # 공유 브라우저는 빌려 쓴 것이므로 참조만 끊고 종료는 스코프에 맡긴다.
+    shared = scraper._shared_browser
     for name, resource in resources:
         if not resource:
             continue
+        if shared and name in ("browser", "playwright"):
+            setattr(scraper, name, None)
+            continue
         try:
             if name == "playwright":
                 resource.stop()
@@ -222,4 +464,7 @@ def close_resources(scraper: "PlaywrightScraper") -> None:
         finally:
             setattr(scraper, name, None)
 
+    scraper._browser_headless = None
+    scraper._shared_browser = False
+    scraper._storage_state_path = None
     scraper.manual_mode = False
@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import heapq
 import logging
-import time
 from typing import TYPE_CHECKING, Any, Dict, List
 
 import scraper_config
 from scraper_config import ScraperScripts
-from scraping.models import FlightResult
+from scraping.models import FlightResult, intern_airline
 
 if TYPE_CHECKING:
     from scraping.playwright_scraper import PlaywrightScraper
@@ -17,6 +16,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("ScraperV2")
 
+# 국내선 스크롤 수집 스크립트가 돌려주는 열 이름과 누락 시 기본값
+_DOMESTIC_COLUMN_DEFAULTS: tuple[tuple[str, Any], ...] = (
+    ("airline", "Unknown"),
+    ("price", 0),
+    ("depTime", ""),
+    ("arrTime", ""),
+    ("stops", 0),
+    ("benefitPrice", 0),
+    ("benefitLabel", ""),
+)
+
 
 def combine_domestic_round_trip(
     outbound_flights: List[Dict[str, Any]],
@@ -48,27 +58,45 @@ def combine_domestic_round_trip(
         if isinstance(max_results, int) and max_results > 0
         else len(top_outbound) * len(top_return)
     )
-    max_heap: list[tuple[int, int, FlightResult]] = []
+    # 방문하는 칸마다 쓰는 필드는 열 단위 리스트로 미리 꺼내 dict 조회를 줄인다.
+    outbound_prices = [item["price"] for item in top_outbound]
+    outbound_airlines = [intern_airline(item["airline"]) for item in top_outbound]
+    outbound_dep_times = [item["depTime"] for item in top_outbound]
+    return_prices = [item["price"] for item in top_return]
+    return_airlines = [intern_airline(item["airline"]) for item in top_return]
+    return_dep_times = [item["depTime"] for item in top_return]
+    outbound_count = len(top_outbound)
+    return_count = len(top_return)
+
+    # 두 목록이 가격순이므로 (합계, i, j) 순서로 격자를 넓혀 가며 상위 k개만 방문한다.
+    frontier: list[tuple[int, int, int]] = [(outbound_prices[0] + return_prices[0], 0, 0)]
     seen = set()
-    seq = 0
-
-    for outbound in top_outbound:
-        for returning in top_return:
-            total_price = outbound["price"] + returning["price"]
-            dedup_key = (
-                outbound["airline"],
-                returning["airline"],
-                total_price,
-                outbound["depTime"],
-                returning["depTime"],
-            )
-            if dedup_key in seen:
-                continue
-            seen.add(dedup_key)
-            seq += 1
+    results: List[FlightResult] = []
+
+    while frontier and len(results) < max_keep:
+        total_price, i, j = heapq.heappop(frontier)
+        if j + 1 < return_count:
+            heapq.heappush(frontier, (outbound_prices[i] + return_prices[j + 1], i, j + 1))
+        if j == 0 and i + 1 < outbound_count:
+            heapq.heappush(frontier, (outbound_prices[i + 1] + return_prices[0], i + 1, 0))
+
+        dedup_key = (
+            outbound_airlines[i],
+            return_airlines[j],
+            total_price,
+            outbound_dep_times[i],
+            return_dep_times[j],
+        )
+        if dedup_key in seen:
+            continue
+        seen.add(dedup_key)
+
+        outbound = top_outbound[i]
+        returning = top_return[j]
 
-            flight = FlightResult(
-                airline=outbound["airline"],
+        results.append(
+            FlightResult(
+                airline=outbound_airlines[i],
                 price=total_price,
                 departure_time=outbound["depTime"],
                 arrival_time=outbound["arrTime"],
@@ -80,25 +108,15 @@ def combine_domestic_round_trip(
                 is_round_trip=True,
                 outbound_price=outbound["price"],
                 return_price=returning["price"],
-                return_airline=returning["airline"],
+                return_airline=return_airlines[j],
                 benefit_price=_coerce_int(outbound.get("benefitPrice")) + _coerce_int(returning.get("benefitPrice")),
                 benefit_label=_combine_benefit_labels(outbound, returning),
                 confidence=0.8,
                 extraction_source="domestic_combined",
             )
+        )
 
-            entry = (-total_price, -seq, flight)
-            if len(max_heap) < max_keep:
-                heapq.heappush(max_heap, entry)
-                continue
-
-            worst_price = -max_heap[0][0]
-            worst_seq = -max_heap[0][1]
-            if (total_price, seq) < (worst_price, worst_seq):
-                heapq.heapreplace(max_heap, entry)
-
-    ranked = sorted(max_heap, key=lambda item: (-item[0], -item[1]))
-    return [item[2] for item in ranked]
+    return results
 
 
 def extract_domestic_flights_data(scraper: "PlaywrightScraper") -> list:
@@ -107,80 +125,32 @@ def extract_domestic_flights_data(scraper: "PlaywrightScraper") -> list:
     if not scraper.page:
         return []
 
-    all_flights: Dict[str, Dict[str, Any]] = {}
-    scraper._no_scroll_count = 0
-    scraper._no_new_count = 0
-    scraper._bottom_count = 0
-    airlines_js = str(scraper.DOMESTIC_AIRLINES)
+    # 스크롤/수집/중복 제거를 브라우저 안에서 한 번에 수행해 CDP 왕복을 1회로 줄인다.
+    script = ScraperScripts.get_domestic_scroll_and_collect_script(
+        scraper.DOMESTIC_AIRLINES,
+        scraper_config.DOMESTIC_MAX_SCROLLS,
+        int(scraper_config.DOMESTIC_SCROLL_PAUSE_SECONDS * 1000),
+        int(scraper_config.DOMESTIC_SCROLL_BOTTOM_PAUSE_SECONDS * 1000),
+    )
 
     try:
-        scroll_index = -1
-        for scroll_index in range(scraper_config.DOMESTIC_MAX_SCROLLS):
-            js_script = ScraperScripts.get_domestic_list_script(airlines_js)
-            batch = scraper.page.evaluate(js_script)
-
-            new_count = 0
-            for item in batch:
-                key = item.get(
-                    "key",
-                    f"{item['airline']}_{item['depTime']}_{item['arrTime']}_{item['price']}",
-                )
-                if key in all_flights:
-                    continue
-                all_flights[key] = item
-                new_count += 1
-
-            scroll_script = ScraperScripts.get_scroll_check_script()
-            scroll_result = scraper.page.evaluate(scroll_script)
-            time.sleep(scraper_config.DOMESTIC_SCROLL_PAUSE_SECONDS)
-
-            can_scroll = scroll_result.get("canScroll", False)
-            reached_bottom = scroll_result.get("reachedBottom", False)
-
-            if reached_bottom and new_count == 0:
-                scraper._bottom_count += 1
-                logger.debug(
-                    "최하단 도달 체크: %s/3 (새 항목 없음)",
-                    scraper._bottom_count,
-                )
-                if scraper._bottom_count >= 3:
-                    logger.info(
-                        "✅ 스크롤 최하단 확인: %s개 수집 완료, 다음 단계로 진행",
-                        len(all_flights),
-                    )
-                    break
-                time.sleep(scraper_config.DOMESTIC_SCROLL_BOTTOM_PAUSE_SECONDS)
-                continue
-            scraper._bottom_count = 0
-
-            if not can_scroll:
-                scraper._no_scroll_count += 1
-                if scraper._no_scroll_count >= 3:
-                    logger.info(
-                        "스크롤 종료: 더 이상 스크롤할 수 없음 (%s개 수집)",
-                        len(all_flights),
-                    )
-                    break
-            else:
-                scraper._no_scroll_count = 0
-
-            if new_count == 0:
-                scraper._no_new_count += 1
-                if scraper._no_new_count >= 8:
-                    logger.info(
-                        "스크롤 조기 종료: %s회 연속 새 항목 없음 (%s개 수집)",
-                        scraper._no_new_count,
-                        len(all_flights),
-                    )
-                    break
-            else:
-                scraper._no_new_count = 0
-
-        result_list = sorted(
-            all_flights.values(),
-            key=lambda item: item.get("price", float("inf")),
-        )
-        logger.info("국내선 %s개 항공편 추출 (스크롤 %s회)", len(result_list), scroll_index + 1)
+        payload = scraper.page.evaluate(script) or {}
+        if "columns" in payload:
+            items = _rows_from_columns(payload.get("columns"))
+        else:
+            items = [item for item in payload.get("items") or [] if isinstance(item, dict)]
+        scroll_count = int(payload.get("scrolls") or 0)
+        stop_reason = payload.get("stopReason", "")
+
+        if stop_reason == "bottom":
+            logger.info("✅ 스크롤 최하단 확인: %s개 수집 완료, 다음 단계로 진행", len(items))
+        elif stop_reason == "no_scroll":
+            logger.info("스크롤 종료: 더 이상 스크롤할 수 없음 (%s개 수집)", len(items))
+        elif stop_reason == "no_new":
+            logger.info("스크롤 조기 종료: 연속 새 항목 없음 (%s개 수집)", len(items))
+
+        result_list = sorted(items, key=lambda item: item.get("price", float("inf")))
+        logger.info("국내선 %s개 항공편 추출 (스크롤 %s회)", len(result_list), scroll_count)
         return result_list
     except Exception as exc:
         logger.error("Extract domestic data error: %s", exc, exc_info=True)
@@ -203,7 +173,7 @@ def build_domestic_results(
         price = int(item.get("price", 0) or 0)
         dep_time = item.get("depTime", "") or ""
         arr_time = item.get("arrTime", "") or ""
-        airline = item.get("airline", "Unknown") or "Unknown"
+        airline = intern_airline(item.get("airline", "Unknown") or "Unknown")
         stops = int(item.get("stops", 0) or 0)
         benefit_price = _coerce_int(item.get("benefitPrice"))
         benefit_label = str(item.get("benefitLabel", "") or "")
@@ -211,7 +181,7 @@ def build_domestic_results(
         if price <= 0 or not dep_time or not arr_time:
             continue
 
-        key = f"{airline}_{dep_time}_{arr_time}_{price}"
+        key = (airline, dep_time, arr_time, price)
         if key in seen:
             continue
         seen.add(key)
@@ -260,6 +230,33 @@ def extract_domestic_prices(scraper: "PlaywrightScraper") -> List[FlightResult]:
         return []
 
 
+def _rows_from_columns(columns: Any) -> List[Dict[str, Any]]:
+    """열 단위 배열(필드별 병렬 리스트)을 항목 dict 리스트로 되돌린다."""
+
+    if not isinstance(columns, dict):
+        return []
+    prices = columns.get("price")
+    count = len(prices) if isinstance(prices, list) else 0
+    series = []
+    for name, default in _DOMESTIC_COLUMN_DEFAULTS:
+        values = columns.get(name)
+        if not isinstance(values, list) or len(values) != count:
+            values = [default] * count
+        series.append(values)
+    return [
+        {
+            "airline": intern_airline(airline),
+            "price": price,
+            "depTime": dep_time,
+            "arrTime": arr_time,
+            "stops": stops,
+            "benefitPrice": benefit_price,
+            "benefitLabel": benefit_label,
+        }
+        for airline, price, dep_time, arr_time, stops, benefit_price, benefit_label in zip(*series)
+    ]
+
+
 def _coerce_int(value: Any) -> int:
     try:
         return int(value or 0)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set
 
 import scraper_config
 from scraper_config import ScraperScripts
-from scraping.models import FlightResult
+from scraping.models import FlightResult, intern_airline
 
 if TYPE_CHECKING:
     from scraping.playwright_scraper import PlaywrightScraper
@@ -17,22 +18,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("ScraperV2")
 
+# 중복 제거 키: 문자열 결합 대신 필드 튜플을 그대로 해시한다.
+_UniqueKey = tuple[Any, ...]
+
+
+def _price_sort_key(item: FlightResult) -> float:
+    return item.price if item.price > 0 else float("inf")
+
+
+def _topk_collect(candidates: Iterable[FlightResult], k: int) -> tuple[List[FlightResult], int]:
+    """Stream candidates through a size-k heap; return (cheapest k in price order, total seen)."""
+
+    # 최대 힙(음수 키)에 k개만 유지해 전체 목록을 보관하지 않는다. seq로 동일 가격의 입력 순서를 지킨다.
+    heap: list[tuple[float, int, FlightResult]] = []
+    total = 0
+    for item in candidates:
+        entry = (-_price_sort_key(item), -total, item)
+        total += 1
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    heap.sort(reverse=True)
+    return [entry[2] for entry in heap], total
+
 
 def sort_and_limit_results(
-    results: List[FlightResult],
+    results: Iterable[FlightResult],
     max_results: int,
     log_func: Optional[Callable[[str], None]] = None,
 ) -> List[FlightResult]:
     """Sort results by price and cap the list when needed."""
 
-    if not results:
-        return []
+    if not (isinstance(max_results, int) and max_results > 0):
+        return sorted(results, key=_price_sort_key)
 
-    ordered = sorted(results, key=lambda item: item.price if item.price > 0 else float("inf"))
-    if isinstance(max_results, int) and max_results > 0 and len(ordered) > max_results:
-        if log_func:
-            log_func(f"⚠️ 결과 {len(ordered)}개 중 상위 {max_results}개만 유지합니다.")
-        return ordered[:max_results]
+    if isinstance(results, list) and len(results) <= max_results:
+        return sorted(results, key=_price_sort_key)
+
+    # 상위 일부만 남길 때는 전체 정렬 대신 크기 k의 힙으로 흘려보낸다 (동일 가격은 입력 순서 유지)
+    ordered, total = _topk_collect(results, max_results)
+    if total > max_results and log_func:
+        log_func(f"⚠️ 결과 {total}개 중 상위 {max_results}개만 유지합니다.")
     return ordered
 
 
@@ -106,7 +133,7 @@ def _extract_international_prices_via_api(scraper: "PlaywrightScraper") -> List[
             logger.info("국제선 API 결과 payload shape mismatch: %s", list(payload.keys())[:10])
             return []
 
-        normalized: Dict[str, FlightResult] = {}
+        normalized: Dict[_UniqueKey, FlightResult] = {}
         for item in items:
             result = _normalize_international_api_item(item)
             if result is None:
@@ -125,22 +152,38 @@ def _extract_international_prices_from_dom(scraper: "PlaywrightScraper") -> List
     if not scraper.page:
         return []
 
-    all_results_dict: Dict[str, Dict[str, Any]] = {}
+    # 키 튜플 대신 그 해시(int)만 보관한다. 9개 필드 조합의 64비트 해시라 충돌은 사실상 없다.
+    seen_keys: Set[int] = set()
+    kept_items: List[Dict[str, Any]] = []
     max_scrolls = scraper_config.INTERNATIONAL_MAX_SCROLLS
     pause_time = scraper_config.SCROLL_PAUSE_TIME
     logger.info("📜 점진적 추출 시작 (최대 %s회 스크롤)...", max_scrolls)
 
     try:
+        # 페이지 쪽에서 새 행만 돌려주도록 한다. 이동 등으로 집합이 사라지면 seen_keys가 중복을 거른다.
+        scraper.page.evaluate(ScraperScripts.get_reset_seen_flights_script())
+        # 스크롤 대기는 짧게 시작하고, 높이가 그대로일 때만 늘려 pause_time에서 멈춘다.
+        max_pause_ms = int(pause_time * 1000)
+        min_pause_ms = min(scraper_config.INTERNATIONAL_SCROLL_MIN_PAUSE_MS, max_pause_ms)
+        pause_ms = min_pause_ms
+        # 스크롤마다 상위 top_k개만 받아도 전체 상위 top_k개는 그대로다 (정렬/제한은 뒤에서 다시 한다).
+        top_k = _coerce_int((getattr(scraper, "_last_search_context", {}) or {}).get("max_results"))
+        use_bundle = True
         previous_height = 0
         for index in range(max_scrolls):
-            step_results = scraper.page.evaluate(ScraperScripts.get_international_prices_script())
+            # 추출 → 스크롤 → 대기 → 높이 측정을 한 번의 왕복으로 처리
+            step = scraper.page.evaluate(_international_scroll_script(use_bundle, pause_ms, top_k))
+            if not step and index == 0:
+                # init script가 적용되지 않은 페이지면 전체 스크립트를 보내는 방식으로 전환
+                use_bundle = False
+                step = scraper.page.evaluate(_international_scroll_script(use_bundle, pause_ms, top_k))
+            step = step or {}
+            step_results = step.get("items")
             step_source = "international_primary"
             step_confidence = 0.9
 
             if not step_results and index == 0:
-                fallback_results = scraper.page.evaluate(
-                    ScraperScripts.get_international_prices_fallback_script()
-                )
+                fallback_results = _evaluate_international_fallback(scraper)
                 if fallback_results:
                     logger.info("국제선 보조 스크립트로 재시도")
                     step_results = fallback_results
@@ -151,38 +194,60 @@ def _extract_international_prices_from_dom(scraper: "PlaywrightScraper") -> List
             for item in step_results or []:
                 item.setdefault("extraction_source", step_source)
                 item.setdefault("confidence", step_confidence)
-                unique_key = _browser_item_unique_key(item)
-                if unique_key in all_results_dict:
+                unique_key = hash(_browser_item_unique_key(item))
+                if unique_key in seen_keys:
                     continue
-                all_results_dict[unique_key] = item
+                seen_keys.add(unique_key)
+                kept_items.append(item)
                 current_count += 1
 
             logger.info(
                 "🧭 스크롤 %s: 새 결과 %s개 추가 (총 %s개)",
                 index + 1,
                 current_count,
-                len(all_results_dict),
+                len(kept_items),
             )
 
-            scraper.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            scraper.page.wait_for_timeout(pause_time * 1000)
-
-            new_height = scraper.page.evaluate("document.body.scrollHeight")
-            if new_height == previous_height and index > 2:
+            new_height = step.get("newHeight", 0)
+            if new_height != previous_height:
+                pause_ms = min_pause_ms
+            elif index > 2 and pause_ms >= max_pause_ms:
                 logger.info("🧭 더 이상 새 콘텐츠가 로드되지 않습니다.")
                 break
+            else:
+                pause_ms = min(max_pause_ms, int(pause_ms * scraper_config.INTERNATIONAL_SCROLL_PAUSE_BACKOFF))
             previous_height = new_height
     except Exception as exc:
         logger.error("Extraction error: %s", exc, exc_info=True)
 
-    if not all_results_dict and scraper.page:
-        fallback_results = scraper.page.evaluate(ScraperScripts.get_international_prices_fallback_script())
+    if not kept_items and scraper.page:
+        fallback_results = _evaluate_international_fallback(scraper)
         for item in fallback_results or []:
             item.setdefault("extraction_source", "international_fallback")
             item.setdefault("confidence", 0.6)
-            all_results_dict[_browser_item_unique_key(item)] = item
+            unique_key = hash(_browser_item_unique_key(item))
+            if unique_key not in seen_keys:
+                seen_keys.add(unique_key)
+                kept_items.append(item)
 
-    return _build_international_results(all_results_dict.values())
+    return _build_international_results(kept_items)
+
+
+def _international_scroll_script(use_bundle: bool, pause_ms: int, top_k: int = 0) -> str:
+    if use_bundle:
+        return ScraperScripts.get_installed_international_scroll_script(pause_ms, top_k)
+    return ScraperScripts.get_international_scroll_and_extract_script(pause_ms, top_k)
+
+
+def _evaluate_international_fallback(scraper: "PlaywrightScraper") -> Any:
+    """설치된 보조 추출 함수를 호출하고, 없으면 전체 스크립트를 보낸다."""
+    page = scraper.page
+    if page is None:
+        return None
+    results = page.evaluate(ScraperScripts.get_installed_international_fallback_script())
+    if results is None:
+        results = page.evaluate(ScraperScripts.get_international_prices_fallback_script())
+    return results
 
 
 def _page_fetch_json(
@@ -254,10 +319,10 @@ def _normalize_international_api_item(item: Dict[str, Any]) -> Optional[FlightRe
     if not dep_time or not arr_time:
         return None
 
-    airline = _schedule_airline(outbound) or "Unknown"
+    airline = intern_airline(_schedule_airline(outbound) or "Unknown")
     is_round_trip = inbound is not None
     return_dep_time, return_arr_time = _schedule_bounds(inbound) if inbound else ("", "")
-    return_airline = _schedule_airline(inbound) if inbound else ""
+    return_airline = intern_airline(_schedule_airline(inbound)) if inbound else ""
     if is_round_trip and not return_airline:
         return_airline = airline
 
@@ -282,38 +347,45 @@ def _normalize_international_api_item(item: Dict[str, Any]) -> Optional[FlightRe
 
 def _build_international_results(items: Iterable[Dict[str, Any]]) -> List[FlightResult]:
     results: List[FlightResult] = []
+    append = results.append
     for item in items:
         if not isinstance(item, dict):
             continue
-        airline = str(item.get("airline", "Unknown") or "Unknown")
-        is_round_trip = bool(item.get("isRoundTrip", False))
-        return_airline = str(item.get("returnAirline", "") or "")
+        get = item.get
+        airline = intern_airline(str(get("airline", "Unknown") or "Unknown"))
+        is_round_trip = bool(get("isRoundTrip", False))
+        return_airline = intern_airline(str(get("returnAirline", "") or ""))
         if is_round_trip and not return_airline:
             return_airline = airline
-        price = _coerce_int(item.get("price"))
-        departure_time = str(item.get("depTime", "") or "")
-        arrival_time = str(item.get("arrTime", "") or "")
+        price = _coerce_int(get("price"))
+        departure_time = str(get("depTime", "") or "")
+        arrival_time = str(get("arrTime", "") or "")
         if price <= 0 or not departure_time or not arrival_time:
             continue
-        results.append(
-            FlightResult(
-                airline=airline,
-                return_airline=return_airline,
-                price=price,
-                departure_time=departure_time,
-                arrival_time=arrival_time,
-                stops=_coerce_int(item.get("stops")),
-                source="Interpark (Auto)",
-                return_departure_time=str(item.get("retDepTime", "") or ""),
-                return_arrival_time=str(item.get("retArrTime", "") or ""),
-                return_stops=_coerce_int(item.get("retStops")),
-                is_round_trip=is_round_trip,
-                confidence=float(item.get("confidence", 0.9) or 0.9),
-                extraction_source=str(
-                    item.get("extraction_source", "international_primary") or "international_primary"
-                ),
-            )
-        )
+        # 행마다 호출되므로 키워드 대신 FlightResult 필드 순서대로 위치 인자를 넘긴다.
+        append(FlightResult(
+            airline,  # airline
+            price,  # price
+            "KRW",  # currency
+            departure_time,  # departure_time
+            arrival_time,  # arrival_time
+            "",  # duration
+            _coerce_int(get("stops")),  # stops
+            "",  # flight_number
+            "Interpark (Auto)",  # source
+            str(get("retDepTime", "") or ""),  # return_departure_time
+            str(get("retArrTime", "") or ""),  # return_arrival_time
+            "",  # return_duration
+            _coerce_int(get("retStops")),  # return_stops
+            is_round_trip,  # is_round_trip
+            0,  # outbound_price
+            0,  # return_price
+            return_airline,  # return_airline
+            0,  # benefit_price
+            "",  # benefit_label
+            float(get("confidence", 0.9) or 0.9),  # confidence
+            str(get("extraction_source", "international_primary") or "international_primary"),  # extraction_source
+        ))
     return results
 
 
@@ -356,35 +428,32 @@ def _schedule_airline(schedule: Optional[Dict[str, Any]]) -> str:
     return ""
 
 
-def _browser_item_unique_key(item: Dict[str, Any]) -> str:
-    return "|".join(
-        [
-            str(item.get("airline", "") or ""),
-            str(item.get("returnAirline", "") or ""),
-            str(_coerce_int(item.get("price"))),
-            str(item.get("depTime", "") or ""),
-            str(item.get("arrTime", "") or ""),
-            str(_coerce_int(item.get("stops"))),
-            str(item.get("retDepTime", "") or ""),
-            str(item.get("retArrTime", "") or ""),
-            str(_coerce_int(item.get("retStops"))),
-        ]
+def _browser_item_unique_key(item: Dict[str, Any]) -> _UniqueKey:
+    get = item.get
+    return (
+        get("airline") or "",
+        get("returnAirline") or "",
+        _coerce_int(get("price")),
+        get("depTime") or "",
+        get("arrTime") or "",
+        _coerce_int(get("stops")),
+        get("retDepTime") or "",
+        get("retArrTime") or "",
+        _coerce_int(get("retStops")),
     )
 
 
-def _result_unique_key(result: FlightResult) -> str:
-    return "|".join(
-        [
-            result.airline,
-            result.return_airline,
-            str(result.price),
-            result.departure_time,
-            result.arrival_time,
-            str(result.stops),
-            result.return_departure_time,
-            result.return_arrival_time,
-            str(result.return_stops),
-        ]
+def _result_unique_key(result: FlightResult) -> _UniqueKey:
+    return (
+        result.airline,
+        result.return_airline,
+        result.price,
+        result.departure_time,
+        result.arrival_time,
+        result.stops,
+        result.return_departure_time,
+        result.return_arrival_time,
+        result.return_stops,
     )
 
 
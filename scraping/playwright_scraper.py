@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import logging
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright
@@ -11,6 +11,7 @@ from playwright.sync_api import Browser, BrowserContext, Page, Playwright
 from scraping.models import FlightResult
 from scraping.playwright_browser import (
     close_resources,
+    close_search_session,
     init_browser,
     wait_for_domestic_return_view,
     wait_for_results,
@@ -31,7 +32,7 @@ logger = logging.getLogger("ScraperV2")
 class PlaywrightScraper:
     """Context-managed Playwright scraper entry point."""
 
-    DOMESTIC_AIRLINES = [
+    DOMESTIC_AIRLINES = (
         "대한항공",
         "아시아나",
         "제주항공",
@@ -43,7 +44,7 @@ class PlaywrightScraper:
         "하이에어",
         "에어프레미아",
         "플라이강원",
-    ]
+    )
 
     def __init__(self, telemetry_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
         self.playwright: Optional[Playwright] = None
@@ -51,12 +52,12 @@ class PlaywrightScraper:
         self.page: Optional[Page] = None
         self.context: Optional[BrowserContext] = None
         self.manual_mode: bool = False
+        self._browser_headless: Optional[bool] = None
+        self._shared_browser: bool = False
+        self._storage_state_path: Optional[str] = None
         self.telemetry_callback = telemetry_callback
         self._last_is_domestic: bool = False
         self._current_route: str = ""
-        self._no_scroll_count: int = 0
-        self._no_new_count: int = 0
-        self._bottom_count: int = 0
         self._last_search_context: Dict[str, Any] = {}
 
     def _emit_telemetry(self, event_type: str, success: bool = True, **kwargs) -> None:
@@ -106,7 +107,7 @@ class PlaywrightScraper:
 
     @staticmethod
     def _sort_and_limit_results(
-        results: List[FlightResult],
+        results: Iterable[FlightResult],
         max_results: int,
         log_func: Optional[Callable[[str], None]] = None,
     ) -> List[FlightResult]:
@@ -177,6 +178,9 @@ class PlaywrightScraper:
             return self._extract_domestic_prices()
         return self._extract_prices()
 
+    def _close_search_session(self) -> None:
+        close_search_session(self)
+
     def close(self) -> None:
         close_resources(self)
 
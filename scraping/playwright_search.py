@@ -5,21 +5,67 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import TYPE_CHECKING, Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
 
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import ViewportSize
 
 import config
 import scraper_config
 from scraper_config import ScraperScripts
 from scraping.errors import BrowserInitError, DataExtractionError, NetworkError
 from scraping.models import FlightResult
+from scraping.playwright_browser import (
+    configure_resource_blocking,
+    install_extractor_scripts,
+    load_storage_state,
+)
 
 if TYPE_CHECKING:
     from scraping.playwright_scraper import PlaywrightScraper
 
 
 logger = logging.getLogger("ScraperV2")
+LogMessage = Union[str, Callable[[], str]]
+
+
+def _profile_dir_path() -> str:
+    """Return the on-disk profile location without creating it."""
+
+    if getattr(sys, "frozen", False):
+        app_data = os.path.join(
+            os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
+            "FlightBot",
+        )
+        return os.path.join(app_data, "playwright_profile")
+    return os.path.join(os.getcwd(), "playwright_profile")
+
+
+def _persistent_profile_dir() -> str:
+    """Return (and create) the on-disk profile used by visible, manual-capable sessions."""
+
+    profile_dir = _profile_dir_path()
+    os.makedirs(profile_dir, exist_ok=True)
+    return profile_dir
+
+
+def _storage_state_path() -> str:
+    """Return the file that carries background-context cookies between searches.
+
+    경로만 계산하며, 폴더는 저장 시점에만 만든다 (백그라운드 검색은 디스크 프로필을 만들지 않음).
+    """
+
+    return os.path.join(_profile_dir_path(), scraper_config.BACKGROUND_STORAGE_STATE_FILENAME)
+
+
+def _is_domestic_code(code_upper: str) -> bool:
+    """Whether an upper-cased airport/city code resolves to a domestic airport."""
+
+    domestic_airports = config.DOMESTIC_AIRPORT_CODES
+    return (
+        code_upper in domestic_airports
+        or config.CITY_CODES_MAP.get(code_upper, code_upper) in domestic_airports
+    )
 
 
 def run_search(
@@ -41,32 +87,27 @@ def run_search(
 
     search_start_time = time_module.time()
 
-    def log(message: str) -> None:
+    def log(message: LogMessage) -> None:
+        # 출력할 곳이 없으면 메시지(지연 생성 포함)를 만들지 않는다.
+        if not emit and not logger.isEnabledFor(logging.INFO):
+            return
+        text = message() if callable(message) else message
         if emit:
-            emit(message)
-        logger.info(message)
+            emit(text)
+        logger.info(text)
 
     results: List[FlightResult] = []
     scraper.manual_mode = False
-    scraper._current_route = f"{origin.upper()}->{destination.upper()}"
+    origin_upper = origin.upper()
+    destination_upper = destination.upper()
+    scraper._current_route = f"{origin_upper}->{destination_upper}"
     max_attempts = max(int(scraper_config.MAX_RETRY_COUNT), 1)
     start_attempt = max(int(retry_count or 0), 0)
     if start_attempt >= max_attempts:
         start_attempt = max_attempts - 1
     attempt_no = start_attempt + 1
 
-    domestic_airports = config.DOMESTIC_AIRPORT_CODES
-    origin_upper = origin.upper()
-    destination_upper = destination.upper()
-    origin_domestic = (
-        origin_upper in domestic_airports
-        or config.CITY_CODES_MAP.get(origin_upper, origin_upper) in domestic_airports
-    )
-    dest_domestic = (
-        destination_upper in domestic_airports
-        or config.CITY_CODES_MAP.get(destination_upper, destination_upper) in domestic_airports
-    )
-    is_domestic = origin_domestic and dest_domestic
+    is_domestic = _is_domestic_code(origin_upper) and _is_domestic_code(destination_upper)
     scraper._last_is_domestic = is_domestic
 
     cabin = cabin_class.upper() if cabin_class else "ECONOMY"
@@ -86,6 +127,7 @@ def run_search(
         "child": 0,
         "infant": 0,
         "is_domestic": is_domestic,
+        "max_results": max_results,
     }
 
     try:
@@ -93,8 +135,8 @@ def run_search(
             attempt_no = attempt_idx + 1
             scraper.manual_mode = False
 
-            scraper.close()
-            scraper.manual_mode = False
+            # 백그라운드 검색은 브라우저 프로세스를 유지하고 컨텍스트/페이지만 새로 만든다.
+            _release_attempt(scraper, background_mode)
             scraper._emit_telemetry(
                 "search_attempt",
                 success=True,
@@ -108,34 +150,31 @@ def run_search(
             )
 
             try:
-                profile_dir = None
-                if not background_mode:
-                    if getattr(sys, "frozen", False):
-                        app_data = os.path.join(
-                            os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
-                            "FlightBot",
-                        )
-                        profile_dir = os.path.join(app_data, "playwright_profile")
-                    else:
-                        profile_dir = os.path.join(os.getcwd(), "playwright_profile")
-                    os.makedirs(profile_dir, exist_ok=True)
-
+                # 백그라운드 검색은 디스크 프로필 없이 메모리 컨텍스트만 사용한다.
+                profile_dir = None if background_mode else _persistent_profile_dir()
                 scraper._init_browser(log, profile_dir, headless=background_mode)
 
                 if scraper.context is None:
                     if scraper.browser is None:
                         raise BrowserInitError("브라우저 컨텍스트를 초기화할 수 없습니다.")
+                    # 메모리 컨텍스트는 이전 검색의 쿠키를 이어받아 동의 배너/초기 토큰 발급을 건너뛴다.
+                    state_path = _storage_state_path()
                     scraper.context = scraper.browser.new_context(
-                        viewport={"width": 1400, "height": 900},
+                        viewport=ViewportSize(width=1400, height=900),
                         locale="ko-KR",
                         user_agent=(
                             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                         ),
+                        storage_state=load_storage_state(state_path),
                     )
+                    scraper._storage_state_path = state_path
+                    if background_mode:
+                        configure_resource_blocking(scraper.context)
 
                 context = scraper.context
                 if context is None:
                     raise BrowserInitError("브라우저 컨텍스트가 정상적으로 생성되지 않았습니다.")
+                install_extractor_scripts(context)
                 scraper.page = context.new_page()
                 page = scraper.page
                 if page is None:
@@ -155,10 +194,10 @@ def run_search(
                 )
 
                 if is_domestic:
-                    log(f"🇰🇷 국내선 검색 모드 ({origin_code} -> {dest_code})")
+                    log(lambda: f"🇰🇷 국내선 검색 모드 ({origin_code} -> {dest_code})")
                 else:
                     log("🌍 국제선 검색 모드")
-                log(f"URL: {url}")
+                log(lambda: f"URL: {url}")
 
                 try:
                     page.goto(
@@ -197,7 +236,6 @@ def run_search(
                         log,
                         max_results,
                         background_mode,
-                        time_module,
                     )
                     if domestic_round_trip is not None:
                         results = domestic_round_trip
@@ -229,7 +267,7 @@ def run_search(
 
                 results = scraper._sort_and_limit_results(results, max_results, log)
                 if results:
-                    log(f"✅ 자동 추출 성공: {len(results)}개")
+                    log(lambda: f"✅ 자동 추출 성공: {len(results)}개")
                 break
 
             except NetworkError as exc:
@@ -246,11 +284,10 @@ def run_search(
                     error_code="NETWORK_ERROR",
                     details={"attempt": attempt_no, "error": str(exc)},
                 )
-                scraper.close()
-                scraper.manual_mode = False
+                _release_attempt(scraper, background_mode)
                 if attempt_idx + 1 < max_attempts:
                     delay = scraper_config.RETRY_DELAY_SECONDS * (2**attempt_idx)
-                    log(f"🔁 네트워크 오류로 재시도합니다... ({attempt_no}/{max_attempts}, {delay}s 대기)")
+                    log(lambda: f"🔁 네트워크 오류로 재시도합니다... ({attempt_no}/{max_attempts}, {delay}s 대기)")
                     time_module.sleep(delay)
                     continue
                 raise
@@ -258,10 +295,10 @@ def run_search(
                 raise
             except DataExtractionError as exc:
                 if background_mode:
-                    log(f"⚠️ {exc} - 백그라운드 모드 종료")
+                    log(lambda: f"⚠️ {exc} - 백그라운드 모드 종료")
                     scraper.manual_mode = False
                 else:
-                    log(f"⚠️ {exc} - 수동 모드로 전환")
+                    log(lambda: f"⚠️ {exc} - 수동 모드로 전환")
                     scraper.manual_mode = True
                 break
             except Exception as exc:
@@ -272,7 +309,7 @@ def run_search(
                 break
     finally:
         if not scraper.manual_mode:
-            scraper.close()
+            _release_attempt(scraper, background_mode)
 
         elapsed_time = time_module.time() - search_start_time
         result_count = len(results)
@@ -294,12 +331,21 @@ def run_search(
     return results
 
 
+def _release_attempt(scraper: "PlaywrightScraper", background_mode: bool) -> None:
+    """Release the resources used by one search attempt."""
+
+    if background_mode:
+        scraper._close_search_session()
+    else:
+        scraper.close()
+    scraper.manual_mode = False
+
+
 def _handle_domestic_round_trip(
     scraper: "PlaywrightScraper",
-    log: Callable[[str], None],
+    log: Callable[[LogMessage], None],
     max_results: int,
     background_mode: bool,
-    time_module,
 ) -> Optional[List[FlightResult]]:
     """Handle domestic round-trip collection when Interpark splits legs."""
 
@@ -307,7 +353,7 @@ def _handle_domestic_round_trip(
     try:
         log("1단계: 가는편 목록 추출 중...")
         outbound_flights = scraper._extract_domestic_flights_data()
-        log(f"가는편 {len(outbound_flights)}개 발견")
+        log(lambda: f"가는편 {len(outbound_flights)}개 발견")
 
         if not outbound_flights:
             if background_mode:
@@ -318,23 +364,23 @@ def _handle_domestic_round_trip(
             return []
 
         log("2단계: 가는편 선택 -> 오는편 화면 전환...")
-        airlines_js = str(scraper.DOMESTIC_AIRLINES)
         best_outbound = min(outbound_flights, key=lambda item: item.get("price", float("inf")))
         price_text = (
             f"{best_outbound.get('price', 0):,}원"
             if best_outbound.get("price")
             else ""
         )
-        js_click = ScraperScripts.get_click_flight_by_details_script(
+        js_click = ScraperScripts.get_click_flight_with_fallback_script(
             best_outbound.get("airline", ""),
             best_outbound.get("depTime", ""),
             best_outbound.get("arrTime", ""),
             price_text,
+            scraper.DOMESTIC_AIRLINES,
         )
-        clicked = scraper.page.evaluate(js_click) if scraper.page else False
-        if not clicked and scraper.page:
-            js_click = ScraperScripts.get_click_flight_script(airlines_js)
-            clicked = scraper.page.evaluate(js_click)
+        click_result = (scraper.page.evaluate(js_click) if scraper.page else None) or {}
+        clicked = bool(click_result.get("clicked"))
+        if clicked and click_result.get("strategy") == "fallback":
+            log("ℹ️ 최저가 가는편을 찾지 못해 첫 번째 항공편을 선택했습니다.")
 
         if not clicked:
             log("⚠️ 가는편 선택 실패 - 가는편만 반환")
@@ -366,10 +412,10 @@ def _handle_domestic_round_trip(
                 log,
             )
 
+        # 오는편 확인 스크립트가 가격 카드 5개 이상 렌더링까지 기다렸으므로 추가 고정 대기 없이 추출한다.
         log("4단계: 오는편 목록 추출 중...")
-        time_module.sleep(scraper_config.DOMESTIC_RETURN_POST_CLICK_SETTLE_SECONDS)
         return_flights = scraper._extract_domestic_flights_data()
-        log(f"오는편 {len(return_flights)}개 발견")
+        log(lambda: f"오는편 {len(return_flights)}개 발견")
 
         log("5단계: 가는편/오는편 조합 중...")
         if outbound_flights and return_flights:
@@ -383,7 +429,7 @@ def _handle_domestic_round_trip(
                 return_flights,
                 max_results=max_results,
             )
-            log(f"최저가 기준 상위 {len(results)}개 조합 반환")
+            log(lambda: f"최저가 기준 상위 {len(results)}개 조합 반환")
             return scraper._sort_and_limit_results(results, max_results, log)
 
         return scraper._sort_and_limit_results(
@@ -392,6 +438,6 @@ def _handle_domestic_round_trip(
             log,
         )
     except Exception as exc:
-        log(f"⚠️ 국내선 처리 중 오류: {exc}")
+        log(lambda: f"⚠️ 국내선 처리 중 오류: {exc}")
         logger.error("Domestic error: %s", exc, exc_info=True)
         return None
@@ -1,9 +1,18 @@
 """High-level single-route searcher."""
 
+import asyncio
+import copy
+import functools
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import scraper_config
 from scraping.models import FlightResult
+from scraping.playwright_results import sort_and_limit_results
 from scraping.search_sources import InterparkAirSource, SearchSourceProtocol, create_search_source
 
 logger = logging.getLogger("ScraperV2")
@@ -12,6 +21,17 @@ logger = logging.getLogger("ScraperV2")
 class FlightSearcher:
     """통합 항공권 검색 엔진."""
 
+    # 검색 작업마다 인스턴스가 새로 만들어지므로 결과 캐시는 클래스 단위로 공유한다.
+    _result_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Tuple[FlightResult, ...]]]" = OrderedDict()
+    # 저장 순서대로 쌓인 (저장 시각, 키) 기록 - 만료 항목을 앞에서부터만 정리한다.
+    _result_cache_expiry: "deque[Tuple[float, Tuple[Any, ...]]]" = deque()
+    _result_cache_lock = threading.Lock()
+    _CABIN_LABELS = {
+        "ECONOMY": "이코노미",
+        "BUSINESS": "비즈니스",
+        "FIRST": "일등석",
+    }
+
     def __init__(self, telemetry_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
         self.source: SearchSourceProtocol = create_search_source(
             InterparkAirSource.source_id,
@@ -19,6 +39,33 @@ class FlightSearcher:
         )
         self.scraper = getattr(self.source, "scraper", None)
         self.last_results: List[FlightResult] = []
+        # sync Playwright 객체는 만든 스레드에서만 쓸 수 있으므로 비동기 호출은 전용 스레드 하나로 모은다.
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+        self._async_thread_id: Optional[int] = None
+        self._async_lock = threading.Lock()
+
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        """이 검색기 전용 단일 스레드 실행기 (처음 비동기 호출 시 생성)."""
+
+        with self._async_lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="FlightSearcher",
+                    initializer=self._mark_async_thread,
+                )
+            return self._async_executor
+
+    def _mark_async_thread(self) -> None:
+        self._async_thread_id = threading.get_ident()
+
+    def _foreign_async_executor(self) -> Optional[ThreadPoolExecutor]:
+        """전용 스레드가 있고 현재 스레드가 그 스레드가 아니면 실행기를 반환."""
+
+        executor = self._async_executor
+        if executor is None or threading.get_ident() == self._async_thread_id:
+            return None
+        return executor
 
     def search(
         self,
@@ -32,20 +79,47 @@ class FlightSearcher:
         progress_callback: Optional[Callable[[str], None]] = None,
         background_mode: bool = False,
     ) -> List[FlightResult]:
-        """항공권 검색 진입점."""
+        """항공권 검색 진입점 (비동기 호출로 브라우저가 전용 스레드에 있으면 그 스레드에서 실행)."""
+
+        executor = self._foreign_async_executor()
+        if executor is not None:
+            return executor.submit(
+                self.search,
+                origin,
+                destination,
+                departure_date,
+                return_date,
+                adults,
+                cabin_class,
+                max_results,
+                progress_callback,
+                background_mode,
+            ).result()
 
         def emit(msg: str) -> None:
             if progress_callback:
                 progress_callback(msg)
             logger.info(msg)
 
-        cabin_label = {
-            "ECONOMY": "이코노미",
-            "BUSINESS": "비즈니스",
-            "FIRST": "일등석",
-        }.get(cabin_class.upper(), "이코노미")
+        cabin_label = self._CABIN_LABELS.get(cabin_class.upper(), "이코노미")
         emit(f"🔍 {origin} → {destination} 항공권 검색 시작 ({cabin_label})")
 
+        cache_key = self._build_cache_key(
+            self.source.source_id,
+            origin,
+            destination,
+            departure_date,
+            return_date,
+            adults,
+            cabin_class,
+            max_results,
+        )
+        cached = self._get_cached_results(cache_key)
+        if cached is not None:
+            self.last_results = cached
+            emit(f"⚡ 캐시된 결과 사용: {len(cached)}개, 최저가 {cached[0].price:,}원")
+            return cached
+
         results = self.source.search(
             {
                 "origin": origin,
@@ -62,6 +136,8 @@ class FlightSearcher:
             background_mode=background_mode,
         )
         self.last_results = results
+        if results and not self.source.is_manual_mode():
+            self._store_cached_results(cache_key, results)
 
         if results:
             cheapest = results[0]
@@ -73,14 +149,131 @@ class FlightSearcher:
 
         return results
 
-    def extract_manual(self) -> List[FlightResult]:
-        """수동 모드에서 데이터 추출 재시도."""
+    async def search_async(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: Optional[str] = None,
+        adults: int = 1,
+        cabin_class: str = "ECONOMY",
+        max_results: int = 1000,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        background_mode: bool = False,
+    ) -> List[FlightResult]:
+        """asyncio 호출자용 검색 진입점 (sync Playwright 검색을 이 검색기 전용 스레드에서 실행)."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_async_executor(),
+            self.search,
+            origin,
+            destination,
+            departure_date,
+            return_date,
+            adults,
+            cabin_class,
+            max_results,
+            progress_callback,
+            background_mode,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _build_cache_key(
+        source_id: str,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        return_date: Optional[str],
+        adults: int,
+        cabin_class: str,
+        max_results: int,
+    ) -> Tuple[Any, ...]:
+        """정규화된 캐시 키 (같은 입력이면 같은 튜플 객체를 재사용)."""
+
+        return (
+            source_id,
+            (origin or "").upper(),
+            (destination or "").upper(),
+            departure_date,
+            return_date,
+            adults,
+            (cabin_class or "ECONOMY").upper(),
+            max_results,
+        )
+
+    @classmethod
+    def _get_cached_results(cls, key: Tuple[Any, ...]) -> Optional[List[FlightResult]]:
+        """TTL 안의 캐시 결과를 복사본으로 반환."""
+
+        ttl = scraper_config.SEARCH_RESULT_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return None
+        # 미스가 대부분이므로 잠금 없이 먼저 확인한다 (dict 멤버십 검사는 GIL 아래 원자적).
+        if key not in cls._result_cache:
+            return None
+        with cls._result_cache_lock:
+            entry = cls._result_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at >= ttl:
+                del cls._result_cache[key]
+                return None
+            cls._result_cache.move_to_end(key)
+            return [copy.copy(result) for result in results]
 
+    @classmethod
+    def _store_cached_results(cls, key: Tuple[Any, ...], results: List[FlightResult]) -> None:
+        """검색 결과를 LRU 캐시에 저장."""
+
+        if scraper_config.SEARCH_RESULT_CACHE_TTL_SECONDS <= 0:
+            return
+        # 이미 정렬된 결과 객체를 그대로 보관한다 (직렬화/재정렬 없음, 호출자 수정만 분리).
+        snapshot = tuple(copy.copy(result) for result in results)
+        now = time.monotonic()
+        with cls._result_cache_lock:
+            cls._prune_expired_locked(now)
+            cls._result_cache[key] = (now, snapshot)
+            cls._result_cache.move_to_end(key)
+            cls._result_cache_expiry.append((now, key))
+            while len(cls._result_cache) > scraper_config.SEARCH_RESULT_CACHE_MAX_ENTRIES:
+                cls._result_cache.popitem(last=False)
+
+    @classmethod
+    def _prune_expired_locked(cls, now: float) -> None:
+        """만료된 캐시 항목 정리 (만료된 기록 수만큼만 순회, 잠금 보유 상태에서 호출)."""
+
+        cutoff = now - scraper_config.SEARCH_RESULT_CACHE_TTL_SECONDS
+        expiry = cls._result_cache_expiry
+        while expiry and expiry[0][0] <= cutoff:
+            stored_at, key = expiry.popleft()
+            entry = cls._result_cache.get(key)
+            # 다시 저장된 키는 새 기록이 따로 있으므로 현재 항목을 지우지 않는다.
+            if entry is not None and entry[0] == stored_at:
+                del cls._result_cache[key]
+
+    @classmethod
+    def clear_result_cache(cls) -> None:
+        """검색 결과 캐시 비우기."""
+
+        with cls._result_cache_lock:
+            cls._result_cache.clear()
+            cls._result_cache_expiry.clear()
+        cls._build_cache_key.cache_clear()
+
+    def extract_manual(self, max_results: int = 0) -> List[FlightResult]:
+        """수동 모드에서 데이터 추출 재시도 (max_results > 0이면 최저가 상위 N개만 유지)."""
+
+        executor = self._foreign_async_executor()
+        if executor is not None:
+            return executor.submit(self.extract_manual, max_results).result()
         results = self.source.extract_manual()
         for result in results:
             result.confidence = 0.5
             result.extraction_source = "manual_extract"
-        results.sort(key=lambda item: item.price if item.price > 0 else float("inf"))
+        results = sort_and_limit_results(results, max_results)
         self.last_results = results
         return results
 
@@ -88,7 +281,28 @@ class FlightSearcher:
         return self.source.is_manual_mode()
 
     def close(self) -> None:
-        self.source.close()
+        """브라우저 종료 (전용 스레드가 있으면 그 스레드에서 닫고 실행기도 정리)."""
+
+        executor = self._foreign_async_executor()
+        if executor is None:
+            self.source.close()
+            return
+        try:
+            executor.submit(self.source.close).result()
+        finally:
+            with self._async_lock:
+                if self._async_executor is executor:
+                    self._async_executor = None
+                    self._async_thread_id = None
+            executor.shutdown(wait=True)
+
+    async def close_async(self) -> None:
+        """asyncio 호출자용 종료 (이벤트 루프를 막지 않음)."""
+
+        if self._async_executor is None:
+            self.close()
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
 
     def get_cheapest(self) -> Optional[FlightResult]:
         if self.last_results:
@@ -44,11 +44,11 @@ class HistoryLogsMixin:
         if not results:
             return
         
-        # 최저가만 저장
-        min_price = min(r.get('price', float('inf')) for r in results)
-        min_item = next((r for r in results if r.get('price') == min_price), None)
+        # 최저가만 저장 (한 번 순회로 첫 최저가 항목을 찾는다)
+        min_item = min(results, key=lambda r: r.get('price', float('inf')))
+        min_price = min_item.get('price')
         
-        if min_item:
+        if min_price is not None:
             airline_value = min_item.get('airline')
             self.add_price_history(
                 origin, dest, dep_date,
@@ -24,6 +24,30 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from storage.flight_database import FlightDatabase
 
+# 저장 SQL은 모듈 로드 시 한 번만 만들어 sqlite3 문장 캐시가 같은 문자열로 적중하게 한다
+_SQL_SAVE_LAST_META = """
+    INSERT OR REPLACE INTO last_search_meta
+    (id, origin, destination, departure_date, return_date, adults, cabin_class, is_domestic, searched_at, result_count)
+    VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SAVE_LAST_RESULT = """
+    INSERT INTO last_search_results
+    (airline, price, departure_time, arrival_time, stops, source,
+     return_departure_time, return_arrival_time, return_stops,
+     is_round_trip, outbound_price, return_price, return_airline,
+     benefit_price, benefit_label, confidence, extraction_source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# 복원 시 저장과 같은 열 순서로 읽어 행 dict 변환 없이 튜플을 바로 풀어 쓴다
+_SQL_LOAD_LAST_RESULTS = """
+    SELECT airline, price, departure_time, arrival_time, stops, source,
+           return_departure_time, return_arrival_time, return_stops,
+           is_round_trip, outbound_price, return_price, return_airline,
+           benefit_price, benefit_label, confidence, extraction_source
+    FROM last_search_results ORDER BY price ASC
+"""
+
+
 class LastSearchMixin:
     def save_last_search_results(self: Any, search_params: Dict[str, Any], results: List[Any]):
         """마지막 검색 결과를 DB에 저장 (프로그램 재시작 시 복원용)"""
@@ -36,11 +60,7 @@ class LastSearchMixin:
             cursor.execute("DELETE FROM last_search_meta")
             
             # 메타데이터 저장
-            cursor.execute("""
-                INSERT OR REPLACE INTO last_search_meta 
-                (id, origin, destination, departure_date, return_date, adults, cabin_class, is_domestic, searched_at, result_count)
-                VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SQL_SAVE_LAST_META, (
                 normalized_params.get('origin', ''),
                 normalized_params.get('dest', ''),
                 normalized_params.get('dep', ''),
@@ -80,17 +100,8 @@ class LastSearchMixin:
                 )
                 for flight in results[:limit]
             ]
-            cursor.executemany(
-                """
-                INSERT INTO last_search_results 
-                (airline, price, departure_time, arrival_time, stops, source,
-                 return_departure_time, return_arrival_time, return_stops,
-                 is_round_trip, outbound_price, return_price, return_airline,
-                 benefit_price, benefit_label, confidence, extraction_source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                rows,
-            )
+            # 한 트랜잭션 안에서 한 문장으로 일괄 삽입 (커밋/fsync 1회)
+            cursor.executemany(_SQL_SAVE_LAST_RESULT, rows)
             
             conn.commit()
             logger.info(f"마지막 검색 결과 저장: {actual_count}/{len(results)}건")
@@ -137,33 +148,36 @@ class LastSearchMixin:
                 except Exception:
                     pass
             
-            # 결과 조회
-            cursor.execute("SELECT * FROM last_search_results ORDER BY price ASC")
-            rows = cursor.fetchall()
-            
-            results = []
-            for row in rows:
-                r = dict(row)
-                flight = FlightResult(
-                    airline=r.get('airline', ''),
-                    price=r.get('price', 0),
-                    departure_time=r.get('departure_time', ''),
-                    arrival_time=r.get('arrival_time', ''),
-                    stops=r.get('stops', 0),
-                    source=r.get('source', 'Cached'),
-                    return_departure_time=r.get('return_departure_time', ''),
-                    return_arrival_time=r.get('return_arrival_time', ''),
-                    return_stops=r.get('return_stops', 0),
-                    is_round_trip=bool(r.get('is_round_trip', 0)),
-                    outbound_price=r.get('outbound_price', 0),
-                    return_price=r.get('return_price', 0),
-                    return_airline=r.get('return_airline', ''),
-                    benefit_price=r.get('benefit_price', 0),
-                    benefit_label=r.get('benefit_label', ''),
-                    confidence=float(r.get('confidence', 0.0) or 0.0),
-                    extraction_source=r.get('extraction_source', ''),
+            # 결과 조회 (sqlite3.Row 대신 튜플 행)
+            result_cursor = conn.cursor()
+            result_cursor.row_factory = None
+            results = [
+                FlightResult(
+                    airline=airline,
+                    price=price,
+                    departure_time=departure_time,
+                    arrival_time=arrival_time,
+                    stops=stops,
+                    source=source,
+                    return_departure_time=return_departure_time,
+                    return_arrival_time=return_arrival_time,
+                    return_stops=return_stops,
+                    is_round_trip=bool(is_round_trip),
+                    outbound_price=outbound_price,
+                    return_price=return_price,
+                    return_airline=return_airline,
+                    benefit_price=benefit_price,
+                    benefit_label=benefit_label,
+                    confidence=float(confidence or 0.0),
+                    extraction_source=extraction_source,
                 )
-                results.append(flight)
+                for (
+                    airline, price, departure_time, arrival_time, stops, source,
+                    return_departure_time, return_arrival_time, return_stops,
+                    is_round_trip, outbound_price, return_price, return_airline,
+                    benefit_price, benefit_label, confidence, extraction_source,
+                ) in result_cursor.execute(_SQL_LOAD_LAST_RESULTS)
+            ]
             
             return search_params, results, searched_at, hours_ago
     def clear_last_search_results(self: Any):
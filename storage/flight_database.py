@@ -69,6 +69,18 @@ class FlightDatabase(
         self._init_db()
         self._migrate_schema_if_needed()
         self._backfill_favorite_dedup_keys()
+    def _open_connection(self) -> sqlite3.Connection:
+        """새 SQLite 연결을 열고 성능 PRAGMA를 적용한다."""
+        # 짧은 조회/저장 문장이 많아 문장 캐시를 넉넉히 잡는다 (기본 128)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging for better concurrency
+        conn.execute("PRAGMA synchronous=NORMAL")  # Faster writes with reasonable safety
+        conn.execute("PRAGMA temp_store=MEMORY")  # 정렬/임시 테이블을 디스크 대신 메모리에서 처리
+        conn.execute("PRAGMA cache_size=-16384")  # 페이지 캐시 16MB
+        FlightDatabase._local.connections[self.db_path] = conn
+        with FlightDatabase._registry_lock:
+            FlightDatabase._all_connections.append(conn)
+        return conn
     def _get_connection(self):
         """Thread-safe connection management with proper initialization"""
         if not hasattr(FlightDatabase._local, 'connections'):
@@ -78,25 +90,12 @@ class FlightDatabase(
         
         # 연결이 없거나 닫혔을 경우 새로 생성
         if conn is None:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging for better concurrency
-            conn.execute("PRAGMA synchronous=NORMAL")  # Faster writes with reasonable safety
-            FlightDatabase._local.connections[self.db_path] = conn
-            with FlightDatabase._registry_lock:
-                FlightDatabase._all_connections.append(conn)
-        else:
-            # 연결 유효성 검사
-            try:
-                conn.execute("SELECT 1")
-            except (sqlite3.ProgrammingError, sqlite3.OperationalError):
-                # 연결이 닫혔거나 손상됐으면 재생성
-                conn = sqlite3.connect(self.db_path, check_same_thread=False)
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-                FlightDatabase._local.connections[self.db_path] = conn
-                with FlightDatabase._registry_lock:
-                    FlightDatabase._all_connections.append(conn)
-        
+            return self._open_connection()
+        # 연결 유효성 검사: SQL을 실행하지 않고 닫힌 연결만 걸러낸다
+        try:
+            conn.total_changes
+        except sqlite3.ProgrammingError:
+            return self._open_connection()
         return conn
     def close_all_connections(self):
         """열려 있는 SQLite 연결을 모두 닫는다."""
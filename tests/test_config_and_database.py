@@ -16,6 +16,18 @@ def test_default_max_results_is_1000(tmp_path: Path):
     assert prefs.get_max_results() == 1000
 
 
+def test_parallel_workers_preference_defaults_and_clamps(tmp_path: Path):
+    pref_path = tmp_path / "prefs.json"
+    prefs = PreferenceManager(filepath=str(pref_path))
+    assert prefs.get_parallel_workers() == 2
+
+    prefs.set_parallel_workers(20)
+    assert PreferenceManager(filepath=str(pref_path)).get_parallel_workers() == 8
+
+    pref_path.write_text(json.dumps({"parallel_workers": "bad"}), encoding="utf-8")
+    assert PreferenceManager(filepath=str(pref_path)).get_parallel_workers() == 2
+
+
 def test_default_alert_auto_check_is_disabled(tmp_path: Path):
     pref_path = tmp_path / "prefs.json"
     prefs = PreferenceManager(filepath=str(pref_path))
@@ -24,6 +36,14 @@ def test_default_alert_auto_check_is_disabled(tmp_path: Path):
     assert cfg["interval_min"] == 30
 
 
+def test_airline_category_matches_case_insensitive_partial_names():
+    assert config.get_airline_category("제주항공") == "LCC"
+    assert config.get_airline_category(" korean air ") == "FSC"
+    assert config.get_airline_category("대한항공 (코드쉐어)") == "FSC"
+    assert config.get_airline_category("Unknown Airways") == "OTHER"
+    assert config.get_airline_category("제주항공") is config.get_airline_category("진에어")
+
+
 def test_last_search_cache_limit_is_1000(tmp_path: Path):
     db_path = tmp_path / "flight_data.db"
     db = FlightDatabase(db_path=str(db_path))
@@ -88,6 +108,38 @@ def test_last_search_metadata_fields_are_persisted(tmp_path: Path):
     assert restored_params["is_domestic"] is False
 
 
+def test_last_search_restores_all_result_fields_in_price_order(tmp_path: Path):
+    db = FlightDatabase(db_path=str(tmp_path / "flight_data.db"))
+    saved = [
+        FlightResult(airline="대한항공", price=320000, departure_time="09:00", arrival_time="11:30", source="Interpark"),
+        FlightResult(
+            airline="제주항공",
+            price=180000,
+            departure_time="07:10",
+            arrival_time="08:20",
+            stops=1,
+            source="Domestic",
+            return_departure_time="19:00",
+            return_arrival_time="20:10",
+            return_stops=0,
+            is_round_trip=True,
+            outbound_price=90000,
+            return_price=90000,
+            return_airline="진에어",
+            confidence=0.5,
+            extraction_source="domestic_list",
+        ),
+    ]
+    db.save_last_search_results({"origin": "GMP", "dest": "CJU", "dep": "20260301"}, saved)
+
+    _, restored, _, _ = db.get_last_search_results()
+
+    assert [r.price for r in restored] == [180000, 320000]
+    assert restored[0].to_dict() == saved[1].to_dict()
+    assert restored[0].is_round_trip is True
+    assert restored[1].to_dict() == saved[0].to_dict()
+
+
 def test_last_search_metadata_persists_sel_domestic_route(tmp_path: Path):
     db = FlightDatabase(db_path=str(tmp_path / "flight_data.db"))
     search_params = {
@@ -111,6 +163,26 @@ def test_last_search_metadata_persists_sel_domestic_route(tmp_path: Path):
     assert restored_params["is_domestic"] is True
 
 
+def test_price_history_batch_records_first_cheapest_item(tmp_path: Path):
+    db = FlightDatabase(db_path=str(tmp_path / "flight_data.db"))
+
+    db.add_price_history_batch("ICN", "NRT", "20260301", [])
+    db.add_price_history_batch(
+        "ICN",
+        "NRT",
+        "20260301",
+        [
+            {"price": 210000, "airline": "A"},
+            {"price": 180000, "airline": "B"},
+            {"price": 180000, "airline": "C"},
+        ],
+    )
+    history = db.get_price_history("ICN", "NRT")
+    db.close_all_connections()
+
+    assert [(item.price, item.airline) for item in history] == [(180000, "B")]
+
+
 def test_close_all_connections_allows_db_file_removal(tmp_path: Path):
     db_path = tmp_path / "flight_data.db"
     db = FlightDatabase(db_path=str(db_path))
@@ -120,6 +192,20 @@ def test_close_all_connections_allows_db_file_removal(tmp_path: Path):
     assert not db_path.exists()
 
 
+def test_connection_is_reused_and_reopened_after_close(tmp_path: Path):
+    db = FlightDatabase(db_path=str(tmp_path / "flight_data.db"))
+
+    conn = db._get_connection()
+    assert db._get_connection() is conn
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    conn.close()
+    reopened = db._get_connection()
+    assert reopened is not conn
+    assert reopened.execute("SELECT 1").fetchone() == (1,)
+    db.close_all_connections()
+
+
 def test_favorite_dedup_distinguishes_different_return_legs(tmp_path: Path):
     db = FlightDatabase(db_path=str(tmp_path / "flight_data.db"))
 
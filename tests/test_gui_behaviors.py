@@ -418,12 +418,14 @@ def test_result_table_copy_row_info_uses_sorted_visual_row(qapp):
         FlightResult(airline="Cheap", price=100000, departure_time="08:00", arrival_time="10:00"),
     ]
     table.update_data(results)
-    table.sortItems(1, Qt.SortOrder.AscendingOrder)
+    table.sortByColumn(1, Qt.SortOrder.AscendingOrder)
 
+    model = table.model()
+    assert model is not None
     target_row = None
-    for row in range(table.rowCount()):
-        item = table.item(row, 0)
-        if item and "Cheap" in item.text():
+    for row in range(model.rowCount()):
+        text = model.index(row, 0).data()
+        if text and "Cheap" in text:
             target_row = row
             break
 
@@ -436,6 +438,144 @@ def test_result_table_copy_row_info_uses_sorted_visual_row(qapp):
     assert "100,000" in copied
 
 
+def test_result_table_model_keeps_user_sort_and_placeholder(qapp):
+    table = ResultTable()
+    model = table.model()
+    assert model is not None
+
+    table.update_data([])
+    assert model.rowCount() == 1
+    assert "검색 결과가 없습니다" in model.index(0, 0).data()
+    assert table.get_flight_at_row(0) is None
+
+    first = [
+        FlightResult(airline="B", price=200000, departure_time="09:00", arrival_time="11:00"),
+        FlightResult(airline="A", price=150000, departure_time="07:00", arrival_time="09:00"),
+    ]
+    table.update_data(first)
+    # 정렬하지 않았으면 결과 순서를 그대로 보여준다
+    assert [model.index(row, 0).data() for row in range(model.rowCount())] == ["B", "A"]
+    assert model.index(1, 1).data(Qt.ItemDataRole.UserRole) == 150000
+    assert model.index(1, 1).data().startswith("🏆")
+
+    table.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+    refreshed = first + [
+        FlightResult(airline="C", price=900000, departure_time="12:00", arrival_time="14:00"),
+    ]
+    table.update_data(refreshed)
+
+    prices = []
+    for row in range(3):
+        flight = table.get_flight_at_row(row)
+        assert flight is not None
+        prices.append(flight.price)
+    assert prices == [900000, 200000, 150000]
+    assert table.results_data is refreshed
+    assert [flight.airline for flight in refreshed] == ["B", "A", "C"]
+
+
+def test_result_table_model_updates_only_changed_tail_rows(qapp):
+    table = ResultTable()
+    model = table.model()
+    assert model is not None
+    events = []
+    model.modelReset.connect(lambda: events.append("reset"))
+    model.rowsInserted.connect(lambda _parent, first, last: events.append(("inserted", first, last)))
+    model.rowsRemoved.connect(lambda _parent, first, last: events.append(("removed", first, last)))
+    model.dataChanged.connect(lambda top, bottom, *_: events.append(("changed", top.row(), bottom.row())))
+
+    base = [
+        FlightResult(airline="A", price=200000, departure_time="09:00", arrival_time="11:00"),
+        FlightResult(airline="B", price=250000, departure_time="10:00", arrival_time="12:00"),
+    ]
+    extra = FlightResult(airline="C", price=150000, departure_time="12:00", arrival_time="14:00")
+
+    table.update_data(base)
+    assert events == ["reset"]
+
+    events.clear()
+    table.update_data(list(base))
+    assert events == []
+
+    events.clear()
+    table.update_data(base + [extra])
+    # 최저가가 바뀌었으므로 기존 행 배지/색상 갱신도 알린다
+    assert events == [("inserted", 2, 2), ("changed", 0, 1)]
+    assert model.index(2, 1).data().startswith("🏆")
+    assert not model.index(0, 1).data().startswith("🏆")
+
+    events.clear()
+    table.update_data(base)
+    assert events == [("removed", 2, 2), ("changed", 0, 1)]
+
+    events.clear()
+    table.update_data([base[1], base[0]])
+    assert events == ["reset"]
+
+
+def test_apply_filter_reuses_column_cache_and_skips_identical_filters():
+    class _Table:
+        def __init__(self):
+            self.data: list[FlightResult] = []
+            self.update_count = 0
+
+        def update_data(self, data):
+            self.data = data
+            self.update_count += 1
+
+    class _Ctx:
+        def __init__(self, results):
+            self.all_results = results
+            self.table = _Table()
+            self._filter_columns = None
+            self._last_filter_signature = None
+            self.logs = []
+
+        def statusBar(self):
+            return None
+
+        def _append_filter_log(self, message):
+            self.logs.append(message)
+
+    results = [
+        FlightResult(airline="A", price=100000, stops=0, departure_time="08:00",
+                     is_round_trip=True, return_departure_time="22:00"),
+        FlightResult(airline="B", price=120000, stops=1, departure_time="09:00"),
+        FlightResult(airline="C", price=90000, stops=0, departure_time="--"),
+        FlightResult(airline="D", price=300000, stops=0, departure_time="10:00"),
+    ]
+    ctx = _Ctx(results)
+    filters = {
+        "direct_only": True,
+        "start_time": 6,
+        "end_time": 12,
+        "ret_start_time": 0,
+        "ret_end_time": 20,
+        "max_price": 200000,
+    }
+
+    MainWindow._apply_filter(ctx, filters)
+    columns = ctx._filter_columns
+
+    # 오는편 22시(A), 경유(B), 가격 초과(D)는 제외, 시간 형식 불명(C)은 통과
+    assert [f.airline for f in ctx.table.data] == ["C"]
+    assert ctx.logs[-1].startswith("필터링: 1/4")
+
+    # 같은 조건을 다시 적용하면 테이블/로그를 건드리지 않는다
+    MainWindow._apply_filter(ctx, dict(reversed(list(filters.items()))))
+    assert ctx.table.update_count == 1
+    assert len(ctx.logs) == 1
+
+    MainWindow._apply_filter(ctx, {**filters, "ret_end_time": 24})
+    assert ctx._filter_columns is columns
+    assert [f.airline for f in ctx.table.data] == ["A", "C"]
+
+    ctx.all_results = results[:2]
+    MainWindow._apply_filter(ctx, filters)
+    assert ctx._filter_columns is not columns
+    assert ctx.table.data == []
+
+
 def test_manual_extract_logs_success_event_and_uses_search_finished(monkeypatch):
     class _DummySearcher:
         def extract_manual(self):
@@ -625,6 +765,88 @@ def test_filter_debounce_applies_last_event_once(qapp):
     assert ctx.applied[0]["start_time"] == 4
 
 
+def test_multi_search_uses_parallel_workers_preference(monkeypatch):
+    created = []
+
+    class _FakeSignal:
+        def connect(self, _slot):
+            return None
+
+    class _FakeWorker:
+        def __init__(self, *args, **kwargs):
+            self.args = args
+            self.kwargs = kwargs
+            self.progress = _FakeSignal()
+            self.single_finished = _FakeSignal()
+            self.all_finished = _FakeSignal()
+            self.started = False
+            created.append(self)
+
+        def start(self):
+            self.started = True
+
+    class _FakeProgressBar:
+        def setRange(self, *_args):
+            return None
+
+        def setFormat(self, *_args):
+            return None
+
+    class _FakeTabs:
+        def setCurrentIndex(self, _index):
+            return None
+
+    class _FakeLogViewer(_DummyLogViewer):
+        def clear(self):
+            self.logs.clear()
+
+    class _FakePrefs:
+        @staticmethod
+        def get_max_results():
+            return 300
+
+        @staticmethod
+        def get_parallel_workers():
+            return 4
+
+    class _DummyContext:
+        def __init__(self):
+            self.log_viewer = _FakeLogViewer()
+            self.progress_bar = _FakeProgressBar()
+            self.tabs = _FakeTabs()
+            self.prefs = _FakePrefs()
+            self.multi_worker: _FakeWorker | None = None
+
+        def _stop_alert_worker_if_running(self):
+            return None
+
+        def _ensure_no_running_search(self):
+            return True
+
+        def _guard_manual_browser_for_new_search(self, _action_name):
+            return True
+
+        def _emit_telemetry_event(self, _payload):
+            return None
+
+        def _update_progress(self, _message):
+            return None
+
+        def _on_multi_single_finished(self, *_args):
+            return None
+
+        def _multi_search_finished(self, _results):
+            return None
+
+    monkeypatch.setattr("app.mainwindow.search_multi.MultiSearchWorker", _FakeWorker)
+    ctx = _DummyContext()
+    MainWindow._start_multi_search(ctx, "ICN", ["NRT", "KIX"], "20260301", None, 1, "ECONOMY")
+
+    assert len(created) == 1 and created[0].started
+    assert created[0].kwargs["max_workers"] == 4
+    assert ctx.multi_worker is created[0]
+
+
 def test_auto_alert_failure_logs_and_stores_error():
     class _DummyDB:
         def __init__(self):
@@ -690,11 +912,12 @@ def test_result_table_price_tooltip_and_csv_include_benefit(tmp_path, qapp, monk
     ]
     table.update_data(results)
 
-    price_item = table.item(0, 1)
-    assert price_item is not None
-    assert "기본가: 39,900원" in price_item.toolTip()
-    assert "혜택가: 38,930원" in price_item.toolTip()
-    assert "혜택 정보: 삼성카드 2.5% 캐시백 적용 시" in price_item.toolTip()
+    model = table.model()
+    assert model is not None
+    price_tooltip = model.index(0, 1).data(Qt.ItemDataRole.ToolTipRole)
+    assert "기본가: 39,900원" in price_tooltip
+    assert "혜택가: 38,930원" in price_tooltip
+    assert "혜택 정보: 삼성카드 2.5% 캐시백 적용 시" in price_tooltip
 
     output_path = tmp_path / "benefit.csv"
     monkeypatch.setattr(
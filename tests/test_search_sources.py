@@ -24,3 +24,213 @@ def test_ticket_source_exposes_metadata_and_placeholder_contract():
     assert source.build_search_url({}) == "https://nol.interpark.com/ticket"
     with pytest.raises(NotImplementedError):
         source.search({})
+
+
+class _CountingSource:
+    source_id = "counting"
+    metadata: dict = {}
+
+    def __init__(self, results, manual=False):
+        self.results = results
+        self.manual = manual
+        self.calls = 0
+
+    def search(self, params, emit=None, background_mode=False):
+        self.calls += 1
+        return list(self.results)
+
+    def is_manual_mode(self):
+        return self.manual
+
+    def close(self):
+        return None
+
+
+def _make_searcher(monkeypatch, source):
+    import scraping.searcher as searcher_module
+
+    monkeypatch.setattr(searcher_module, "create_search_source", lambda *_args, **_kwargs: source)
+    searcher_module.FlightSearcher.clear_result_cache()
+    return searcher_module.FlightSearcher()
+
+
+def test_flight_searcher_serves_repeat_query_from_cache(monkeypatch):
+    from scraping.models import FlightResult
+
+    source = _CountingSource([FlightResult(airline="A", price=100000)])
+    searcher = _make_searcher(monkeypatch, source)
+
+    first = searcher.search("icn", "nrt", "20260301", None, max_results=10)
+    first[0].price = 1
+    second = searcher.search("ICN", "NRT", "20260301", None, max_results=10)
+
+    assert source.calls == 1
+    assert second[0].price == 100000
+    assert second[0] is not first[0]
+    key_args = ("counting", "icn", "nrt", "20260301", None, 1, "economy", 10)
+    assert searcher._build_cache_key(*key_args) is searcher._build_cache_key(*key_args)
+    assert searcher._build_cache_key(*key_args) == ("counting", "ICN", "NRT", "20260301", None, 1, "ECONOMY", 10)
+
+
+def test_flight_result_copy_keeps_every_field():
+    import copy
+
+    from scraping.models import FlightResult
+
+    original = FlightResult(
+        airline="A",
+        price=100000,
+        return_airline="B",
+        is_round_trip=True,
+        benefit_label="카드할인",
+        confidence=0.9,
+        extraction_source="international_api",
+    )
+    cloned = copy.copy(original)
+
+    assert cloned == original
+    assert cloned is not original
+    assert cloned.to_dict() == original.to_dict()
+
+
+def test_flight_searcher_does_not_cache_empty_or_manual_results(monkeypatch):
+    from scraping.models import FlightResult
+
+    empty_source = _CountingSource([])
+    searcher = _make_searcher(monkeypatch, empty_source)
+    searcher.search("ICN", "NRT", "20260301")
+    searcher.search("ICN", "NRT", "20260301")
+    assert empty_source.calls == 2
+
+    manual_source = _CountingSource([FlightResult(airline="A", price=100000)], manual=True)
+    searcher = _make_searcher(monkeypatch, manual_source)
+    searcher.search("ICN", "NRT", "20260301")
+    searcher.search("ICN", "NRT", "20260301")
+    assert manual_source.calls == 2
+
+
+def test_flight_searcher_cache_miss_skips_lock(monkeypatch):
+    import scraping.searcher as searcher_module
+
+    class _NoLock:
+        def __enter__(self):
+            raise AssertionError("cache miss should not take the lock")
+
+        def __exit__(self, *exc):
+            return False
+
+    searcher_module.FlightSearcher.clear_result_cache()
+    monkeypatch.setattr(searcher_module.FlightSearcher, "_result_cache_lock", _NoLock())
+
+    assert searcher_module.FlightSearcher._get_cached_results(("missing",)) is None
+
+
+def test_flight_searcher_store_drops_only_expired_entries(monkeypatch):
+    import scraping.searcher as searcher_module
+    from scraping.models import FlightResult
+
+    searcher_cls = searcher_module.FlightSearcher
+    searcher_cls.clear_result_cache()
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(searcher_module.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(searcher_module.scraper_config, "SEARCH_RESULT_CACHE_TTL_SECONDS", 10)
+    results = [FlightResult(airline="A", price=100000)]
+
+    searcher_cls._store_cached_results(("old",), results)
+    clock["now"] += 6
+    searcher_cls._store_cached_results(("recent",), results)
+    clock["now"] += 5
+    searcher_cls._store_cached_results(("new",), results)
+
+    assert list(searcher_cls._result_cache) == [("recent",), ("new",)]
+    assert len(searcher_cls._result_cache_expiry) == 2
+    searcher_cls.clear_result_cache()
+
+
+def test_flight_searcher_extract_manual_keeps_cheapest_when_limited(monkeypatch):
+    from scraping.models import FlightResult
+
+    class _ManualSource(_CountingSource):
+        def extract_manual(self):
+            return [FlightResult(airline=name, price=price) for name, price in self.results]
+
+    rows = [("A", 300000), ("B", 0), ("C", 100000), ("D", 200000), ("E", 100000)]
+    searcher = _make_searcher(monkeypatch, _ManualSource(rows))
+
+    limited = searcher.extract_manual(max_results=3)
+    full = searcher.extract_manual()
+
+    assert [r.airline for r in limited] == ["C", "E", "D"]
+    assert [r.airline for r in full] == ["C", "E", "D", "A", "B"]
+    assert all(r.extraction_source == "manual_extract" for r in full)
+    assert searcher.last_results == full
+
+
+def test_flight_searcher_search_async_runs_concurrently_off_the_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    from scraping.models import FlightResult
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _BlockingSource(_CountingSource):
+        def search(self, params, emit=None, background_mode=False):
+            barrier.wait()
+            return [FlightResult(airline=params["destination"], price=100000)]
+
+    searchers = [
+        _make_searcher(monkeypatch, _BlockingSource([])),
+        _make_searcher(monkeypatch, _BlockingSource([])),
+    ]
+
+    async def _run():
+        return await asyncio.gather(
+            searchers[0].search_async("ICN", "NRT", "20260301"),
+            searchers[1].search_async("ICN", "KIX", "20260301"),
+        )
+
+    first, second = asyncio.run(_run())
+
+    assert first[0].airline == "NRT"
+    assert second[0].airline == "KIX"
+
+
+def test_flight_searcher_search_async_reuses_one_thread_per_searcher(monkeypatch):
+    import asyncio
+    import threading
+
+    from scraping.models import FlightResult
+
+    class _ThreadRecordingSource(_CountingSource):
+        def __init__(self):
+            super().__init__([])
+            self.threads = []
+            self.background_modes = []
+
+        def search(self, params, emit=None, background_mode=False):
+            self.threads.append(threading.get_ident())
+            self.background_modes.append(background_mode)
+            return [FlightResult(airline=params["destination"], price=100000)]
+
+        def close(self):
+            self.threads.append(threading.get_ident())
+
+    source = _ThreadRecordingSource()
+    searcher = _make_searcher(monkeypatch, source)
+
+    async def _run():
+        await searcher.search_async("ICN", "NRT", "20260301")
+        await searcher.search_async("ICN", "KIX", "20260301")
+
+    asyncio.run(_run())
+    # 동기 호출도 브라우저를 가진 전용 스레드에서 실행된다
+    searcher.search("ICN", "FUK", "20260301")
+    searcher.close()
+
+    assert len(source.threads) == 4
+    assert len(set(source.threads)) == 1
+    assert source.threads[0] != threading.get_ident()
+    assert searcher._async_executor is None
+    # 비동기 진입점도 동기 search와 같은 브라우저 모드 기본값을 쓴다
+    assert source.background_modes == [False, False, False]
@@ -40,26 +40,88 @@ def test_price_regex_avoids_time_digit_prefix_regression():
     assert "531,500" not in price_matches
 
 
+def test_airline_regex_prefers_longest_name_and_accepts_legacy_list_text():
+    regex_literal = ScraperScripts._airline_regex(str(["대한", "대한항공", "에어.서울"]))
+
+    assert regex_literal == 'new RegExp("에어\\\\.서울|대한항공|대한")'
+    assert "RE_AIRLINE" in ScraperScripts.get_click_flight_script(["진에어"])
+    assert ScraperScripts._airline_regex([]) == 'new RegExp("(?!)")'
+
+
+def test_airline_scripts_are_memoized_regardless_of_list_order_or_format():
+    first = ScraperScripts.get_domestic_list_script(["진에어", "제주항공"])
+    second = ScraperScripts.get_domestic_prices_script(str(["제주항공", "진에어"]))
+
+    assert first is second
+
+
+def test_scroll_check_script_caches_containers_without_body_observer():
+    script = ScraperScripts.get_scroll_check_script()
+
+    assert "window.__scrollContainers" in script
+    assert "!node.isConnected" in script
+    assert "MutationObserver" not in script
+
+
+def test_domestic_scroll_script_waits_for_render_instead_of_fixed_sleep():
+    script = ScraperScripts.get_domestic_scroll_and_collect_script(["진에어"], 10, 300, 500)
+
+    assert "await waitForRender(300)" in script
+    assert "await waitForRender(500)" in script
+    assert "await sleep(" not in script
+
+
 def test_wait_for_results_returns_selected_selector():
+    class _FakeHandle:
+        def json_value(self):
+            return "div[data-index]"
+
     class _FakePage:
         def __init__(self):
-            self.calls = 0
+            self.calls = []
 
-        def wait_for_selector(self, _selector, timeout=0):
-            self.calls += 1
-            if self.calls < 2:
-                raise PlaywrightTimeoutError("timeout")
-            return True
+        def wait_for_function(self, script, timeout=0, polling=None):
+            self.calls.append((script, timeout, polling))
+            return _FakeHandle()
 
     scraper = PlaywrightScraper()
-    cast(Any, scraper).page = _FakePage()
+    page = _FakePage()
+    cast(Any, scraper).page = page
 
-    # Exception type is broad in fake page; fallback path should still keep trying.
     result = scraper._wait_for_results(is_domestic=False, log_func=lambda _m: None)
 
-    assert isinstance(result, dict)
-    assert result["found"] is True
-    assert result["selector"]
+    assert result == {"found": True, "selector": "div[data-index]"}
+    assert len(page.calls) == 1
+    assert page.calls[0][1] == int(scraper_config.DATA_WAIT_TIMEOUT_SECONDS * 1000)
+
+
+def test_wait_for_results_reports_timeout_per_selector():
+    class _FakePage:
+        def __init__(self):
+            self.calls = 0
+
+        def wait_for_function(self, *_args, **_kwargs):
+            self.calls += 1
+            raise PlaywrightTimeoutError("timeout")
+
+    events = []
+    scraper = PlaywrightScraper(telemetry_callback=events.append)
+    page = _FakePage()
+    cast(Any, scraper).page = page
+
+    assert scraper._wait_for_results(is_domestic=True) == {"found": False, "selector": ""}
+    assert page.calls == 1
+    assert [event["selector_name"] for event in events] == list(scraper_config.DOMESTIC_WAIT_SELECTORS)
+    assert all(not event["success"] and event["error_code"] == "SELECTOR_TIMEOUT" for event in events)
+
+
+def test_wait_for_results_script_requires_visible_elements():
+    script = ScraperScripts.get_wait_for_results_script(["li[data-index]", 'button:has-text("원")'])
+
+    assert "isVisible" in script
+    assert "querySelector(" not in script
+    assert "getBoundingClientRect" in script
+    assert "visibility !== 'hidden'" in script
 
 
 def test_international_script_handles_live_like_fixture_and_ignores_crossselling():
@@ -89,6 +151,27 @@ def test_domestic_script_extracts_base_and_benefit_price_from_fixture():
     assert "1% 캐시백 적용 시" in results[0]["benefitLabel"]
 
 
+def test_click_with_fallback_script_reports_strategy_on_fixture():
+    fixture = Path(__file__).resolve().parent / "fixtures" / "interpark_domestic_card.html"
+    html = fixture.read_text(encoding="utf-8")
+
+    specific = _evaluate_script_on_fixture(
+        html,
+        ScraperScripts.get_click_flight_with_fallback_script(
+            "진에어", "19:05", "20:20", "31,500원", PlaywrightScraper.DOMESTIC_AIRLINES
+        ),
+    )
+    fallback = _evaluate_script_on_fixture(
+        html,
+        ScraperScripts.get_click_flight_with_fallback_script(
+            "대한항공", "07:00", "08:10", "99,000원", PlaywrightScraper.DOMESTIC_AIRLINES
+        ),
+    )
+
+    assert specific == {"clicked": True, "strategy": "specific"}
+    assert fallback == {"clicked": True, "strategy": "fallback"}
+
+
 def _evaluate_script_on_fixture(html: str, script: str):
     try:
         from playwright.sync_api import sync_playwright
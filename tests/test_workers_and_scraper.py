@@ -47,35 +47,34 @@ def test_date_range_worker_closes_searcher_when_cancelled_after_init(monkeypatch
 def test_international_dedup_key_preserves_distinct_return_details():
     class _FakePage:
         def evaluate(self, script):
-            if script == "document.body.scrollHeight":
-                return 100
-            if script.startswith("window.scrollTo("):
-                return None
             if "const cards = document.querySelectorAll('li[data-index], div[data-index]');" in script:
-                return [
-                    {
-                        "airline": "TestAir",
-                        "price": 200000,
-                        "depTime": "10:00",
-                        "arrTime": "12:00",
-                        "stops": 0,
-                        "retDepTime": "14:00",
-                        "retArrTime": "16:00",
-                        "retStops": 0,
-                        "isRoundTrip": True,
-                    },
-                    {
-                        "airline": "TestAir",
-                        "price": 200000,
-                        "depTime": "10:00",
-                        "arrTime": "12:30",
-                        "stops": 1,
-                        "retDepTime": "18:00",
-                        "retArrTime": "20:00",
-                        "retStops": 1,
-                        "isRoundTrip": True,
-                    },
-                ]
+                return {
+                    "newHeight": 100,
+                    "items": [
+                        {
+                            "airline": "TestAir",
+                            "price": 200000,
+                            "depTime": "10:00",
+                            "arrTime": "12:00",
+                            "stops": 0,
+                            "retDepTime": "14:00",
+                            "retArrTime": "16:00",
+                            "retStops": 0,
+                            "isRoundTrip": True,
+                        },
+                        {
+                            "airline": "TestAir",
+                            "price": 200000,
+                            "depTime": "10:00",
+                            "arrTime": "12:30",
+                            "stops": 1,
+                            "retDepTime": "18:00",
+                            "retArrTime": "20:00",
+                            "retStops": 1,
+                            "isRoundTrip": True,
+                        },
+                    ],
+                }
             if "const candidates = document.querySelectorAll(" in script:
                 return []
             return []
@@ -92,6 +91,194 @@ def test_international_dedup_key_preserves_distinct_return_details():
     assert sorted(r.return_stops for r in results) == [0, 1]
 
 
+def test_international_dom_extraction_resets_page_seen_set_before_scrolling():
+    calls = []
+    row = {"airline": "TestAir", "price": 200000, "depTime": "10:00", "arrTime": "12:00", "stops": 0}
+
+    class _FakePage:
+        def evaluate(self, script):
+            calls.append(script)
+            if script == scraper_config.ScraperScripts.get_reset_seen_flights_script():
+                return None
+            if "__flightExtractors.intlScroll" in script:
+                # 페이지 집합이 사라진 경우처럼 같은 행을 다시 돌려준다
+                return {"newHeight": 100, "items": [dict(row)]}
+            return None
+
+        def wait_for_timeout(self, _):
+            return None
+
+    scraper = PlaywrightScraper()
+    cast(Any, scraper).page = _FakePage()
+
+    results = scraper._extract_prices()
+
+    assert calls[0] == scraper_config.ScraperScripts.get_reset_seen_flights_script()
+    # 스크롤당 evaluate 한 번: 높이가 그대로면 대기를 1.5배씩 늘리고, 최대 대기 후에도 그대로면 멈춘다
+    assert calls[1:] == [
+        scraper_config.ScraperScripts.get_installed_international_scroll_script(pause_ms)
+        for pause_ms in (200, 200, 300, 450, 675, 1000)
+    ]
+    assert len(results) == 1
+
+
+def test_international_dom_extraction_sends_full_script_when_bundle_missing(monkeypatch):
+    monkeypatch.setattr(scraper_config, "SCROLL_PAUSE_TIME", 0.5)
+    calls = []
+
+    class _FakePage:
+        def evaluate(self, script):
+            calls.append(script)
+            if "const cards = document.querySelectorAll" in script and "async () =>" in script:
+                item = {"airline": "A", "price": 150000, "depTime": "09:00", "arrTime": "11:00"}
+                return {"newHeight": 100, "items": [item]}
+            return None
+
+        def wait_for_timeout(self, _):
+            return None
+
+    scraper = PlaywrightScraper()
+    cast(Any, scraper).page = _FakePage()
+
+    results = scraper._extract_prices()
+
+    assert calls[1] == scraper_config.ScraperScripts.get_installed_international_scroll_script(200)
+    assert calls[2:] == [
+        scraper_config.ScraperScripts.get_international_scroll_and_extract_script(pause_ms)
+        for pause_ms in (200, 200, 300, 450, 500)
+    ]
+    assert len(results) == 1
+
+
+def test_international_dom_extraction_asks_page_for_top_k_rows():
+    calls = []
+
+    class _FakePage:
+        def evaluate(self, script):
+            calls.append(script)
+            if "__flightExtractors.intlScroll" in script:
+                item = {"airline": "A", "price": 150000, "depTime": "09:00", "arrTime": "11:00"}
+                return {"newHeight": 100, "items": [item]}
+            return None
+
+        def wait_for_timeout(self, _):
+            return None
+
+    scraper = PlaywrightScraper()
+    cast(Any, scraper).page = _FakePage()
+    scraper._last_search_context = {"is_domestic": True, "max_results": 5}
+
+    scraper._extract_prices()
+
+    assert calls[1] == scraper_config.ScraperScripts.get_installed_international_scroll_script(200, 5)
+    assert "intlScroll(200, 5)" in calls[1]
+    assert "results.length = topK" in scraper_config.ScraperScripts.get_international_prices_script()
+
+
+def test_install_extractor_scripts_registers_bundle_on_context():
+    from scraping.playwright_browser import install_extractor_scripts
+
+    class _FakeContext:
+        def __init__(self):
+            self.scripts = []
+
+        def add_init_script(self, script=None):
+            self.scripts.append(script)
+
+    context = _FakeContext()
+    install_extractor_scripts(context)
+
+    assert context.scripts == [scraper_config.ScraperScripts.get_extractors_init_script()]
+    assert "window.__flightExtractors" in context.scripts[0]
+
+
+def test_search_session_close_persists_storage_state_for_next_context(tmp_path, monkeypatch):
+    from scraping import playwright_search
+    from scraping.playwright_browser import load_storage_state
+
+    state = {"cookies": [{"name": "consent", "value": "1", "domain": ".interpark.com", "path": "/"}], "origins": []}
+
+    class _FakeContext:
+        def __init__(self):
+            self.closed = False
+
+        def storage_state(self):
+            return state
+
+        def close(self):
+            self.closed = True
+
+    # 경로 계산만으로는 프로필 폴더를 만들지 않고, 저장할 때만 만든다
+    monkeypatch.chdir(tmp_path)
+    state_path = playwright_search._storage_state_path()
+    assert not (tmp_path / "playwright_profile").exists()
+    assert load_storage_state(state_path) is None
+
+    scraper = PlaywrightScraper()
+    context = _FakeContext()
+    cast(Any, scraper).context = context
+    scraper._storage_state_path = state_path
+
+    scraper._close_search_session()
+
+    assert context.closed is True
+    assert scraper._storage_state_path is None
+    assert load_storage_state(state_path) == state
+
+    (tmp_path / "playwright_profile" / "state.json").write_text("{broken", encoding="utf-8")
+    assert load_storage_state(state_path) is None
+
+
+def test_international_results_positional_build_matches_keyword_fields():
+    from scraping.playwright_results import _build_international_results
+
+    item = {
+        "airline": "TestAir",
+        "returnAirline": "OtherAir",
+        "price": 250000,
+        "depTime": "10:00",
+        "arrTime": "12:00",
+        "stops": 1,
+        "retDepTime": "14:00",
+        "retArrTime": "16:00",
+        "retStops": 0,
+        "isRoundTrip": True,
+        "confidence": 0.6,
+        "extraction_source": "international_fallback",
+    }
+
+    [result] = _build_international_results([item])
+
+    assert result == FlightResult(
+        airline="TestAir",
+        return_airline="OtherAir",
+        price=250000,
+        departure_time="10:00",
+        arrival_time="12:00",
+        stops=1,
+        source="Interpark (Auto)",
+        return_departure_time="14:00",
+        return_arrival_time="16:00",
+        return_stops=0,
+        is_round_trip=True,
+        confidence=0.6,
+        extraction_source="international_fallback",
+    )
+
+
+def test_browser_item_unique_key_is_tuple_with_normalized_numbers():
+    from scraping.playwright_results import _browser_item_unique_key
+
+    base = {"airline": "TestAir", "price": 200000, "depTime": "10:00", "arrTime": "12:00", "stops": 0}
+    same = dict(base, price="200000", stops=None, retDepTime=None)
+    other = dict(base, retStops=1)
+
+    key = _browser_item_unique_key(base)
+    assert isinstance(key, tuple)
+    assert key == _browser_item_unique_key(same)
+    assert key != _browser_item_unique_key(other)
+
+
 def test_domestic_topk_combination_matches_naive_ordering():
     scraper = PlaywrightScraper()
     max_results = 7
@@ -128,6 +315,105 @@ def test_domestic_topk_combination_matches_naive_ordering():
     assert combined_keys == naive
 
 
+def test_domestic_topk_combination_keeps_tie_order_and_skips_duplicates():
+    scraper = PlaywrightScraper()
+    outbound = [
+        {"airline": "A", "price": 50000, "depTime": "07:00", "arrTime": "08:00", "stops": 0},
+        {"airline": "A", "price": 50000, "depTime": "07:00", "arrTime": "08:05", "stops": 0},
+        {"airline": "B", "price": 50000, "depTime": "09:00", "arrTime": "10:00", "stops": 0},
+    ]
+    inbound = [
+        {"airline": "C", "price": 40000, "depTime": "18:00", "arrTime": "19:00", "stops": 0},
+        {"airline": "D", "price": 40000, "depTime": "20:00", "arrTime": "21:00", "stops": 0},
+    ]
+
+    combined = scraper._combine_domestic_round_trip(outbound, inbound, max_results=10)
+
+    assert [(f.airline, f.return_airline, f.arrival_time) for f in combined] == [
+        ("A", "C", "08:00"),
+        ("A", "D", "08:00"),
+        ("B", "C", "10:00"),
+        ("B", "D", "10:00"),
+    ]
+
+
+def test_domestic_results_share_interned_airline_strings():
+    from scraping.playwright_domestic import build_domestic_results
+
+    # 런타임에 만든 서로 다른 문자열 객체라도 결과에서는 같은 객체를 공유해야 한다
+    names = ["".join(["제주", "항공"]) for _ in range(3)]
+    assert names[0] is not names[1]
+    items = [
+        {"airline": name, "price": 30000 + index, "depTime": "07:00", "arrTime": "08:00", "stops": 0}
+        for index, name in enumerate(names)
+    ]
+
+    results = build_domestic_results(items)
+
+    assert len(results) == 3
+    assert results[0].airline is results[1].airline is results[2].airline
+
+
+def test_sort_and_limit_results_partial_selection_matches_full_sort():
+    results = [
+        FlightResult(airline=f"A{i}", price=(i * 7919) % 50 * 1000)
+        for i in range(200)
+    ]
+    expected = sorted(results, key=lambda item: item.price if item.price > 0 else float("inf"))
+
+    assert PlaywrightScraper._sort_and_limit_results(results, 10) == expected[:10]
+    assert PlaywrightScraper._sort_and_limit_results(results, 150) == expected[:150]
+    assert PlaywrightScraper._sort_and_limit_results(results, 0) == expected
+    assert PlaywrightScraper._sort_and_limit_results(results, 10)[0].price > 0
+
+    logs = []
+    streamed = PlaywrightScraper._sort_and_limit_results(iter(results), 10, logs.append)
+    assert streamed == expected[:10]
+    assert logs == ["⚠️ 결과 200개 중 상위 10개만 유지합니다."]
+
+
+def test_domestic_extraction_scrolls_and_collects_in_single_evaluate():
+    class _FakePage:
+        def __init__(self):
+            self.scripts = []
+
+        def evaluate(self, script):
+            self.scripts.append(script)
+            return {
+                "columns": {
+                    "airline": ["진에어", "제주항공"],
+                    "price": [52000, 31000],
+                    "depTime": ["09:00", "07:00"],
+                    "arrTime": ["10:10", "08:10"],
+                    "stops": [0, 0],
+                    "benefitPrice": [0, 3000],
+                    "benefitLabel": ["", "카드할인"],
+                },
+                "scrolls": 4,
+                "stopReason": "bottom",
+            }
+
+    scraper = PlaywrightScraper()
+    page = _FakePage()
+    cast(Any, scraper).page = page
+
+    flights = scraper._extract_domestic_flights_data()
+
+    assert len(page.scripts) == 1
+    assert page.scripts[0].lstrip().startswith("async () =>")
+    assert "columns.price.push(item.price)" in page.scripts[0]
+    assert [flight["price"] for flight in flights] == [31000, 52000]
+    assert flights[0] == {
+        "airline": "제주항공",
+        "price": 31000,
+        "depTime": "07:00",
+        "arrTime": "08:10",
+        "stops": 0,
+        "benefitPrice": 3000,
+        "benefitLabel": "카드할인",
+    }
+
+
 def test_international_api_path_builds_results_without_dom_fallback():
     class _FakePage:
         def __init__(self):
@@ -183,10 +469,6 @@ def test_international_api_path_builds_results_without_dom_fallback():
                 raise AssertionError("DOM fallback should not run when API succeeds")
             if "const candidates = document.querySelectorAll(" in script:
                 raise AssertionError("Fallback DOM parser should not run when API succeeds")
-            if script == "document.body.scrollHeight":
-                return 100
-            if script.startswith("window.scrollTo("):
-                return None
             raise AssertionError(f"Unexpected script: {script[:120]}")
 
         def wait_for_timeout(self, _timeout):
@@ -268,6 +550,37 @@ def test_multi_search_worker_runs_with_parallelism(monkeypatch):
     assert state["max_active"] >= 2
 
 
+def test_multi_search_worker_honours_configured_max_workers(monkeypatch):
+    lock = threading.Lock()
+    state = {"active": 0, "max_active": 0}
+
+    class _FakeSearcher:
+        def search(self, *args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            time.sleep(0.1)
+            with lock:
+                state["active"] -= 1
+            return []
+
+        def close(self):
+            return None
+
+    monkeypatch.setattr("ui.workers.FlightSearcher", _FakeSearcher)
+    dep = (datetime.now() + timedelta(days=7)).strftime("%Y%m%d")
+
+    worker = MultiSearchWorker("ICN", ["NRT", "HND", "KIX", "FUK"], dep, None, 1, max_workers=4)
+    captured = {}
+    worker.all_finished.connect(lambda data: captured.update(data))
+    worker.run()
+
+    assert list(captured) == ["NRT", "HND", "KIX", "FUK"]
+    assert state["max_active"] == 4
+    assert MultiSearchWorker("ICN", ["NRT"], dep, None, 1, max_workers=99).max_workers == 8
+    assert MultiSearchWorker("ICN", ["NRT"], dep, None, 1, max_workers=0).max_workers == 1
+
+
 def test_multi_search_worker_cancel_cancels_pending_futures(monkeypatch):
     state = {"started": 0}
 
@@ -702,6 +1015,195 @@ def test_playwright_background_mode_disables_manual_fallback(monkeypatch):
     assert scraper.manual_mode is False
 
 
+def test_init_browser_reuses_connected_background_browser(monkeypatch):
+    class _FakeBrowser:
+        def is_connected(self):
+            return True
+
+    def _fail_start():
+        raise AssertionError("Playwright should not be restarted")
+
+    monkeypatch.setattr("scraping.playwright_browser.sync_playwright", _fail_start)
+    scraper = PlaywrightScraper()
+    browser = _FakeBrowser()
+    cast(Any, scraper).playwright = object()
+    cast(Any, scraper).browser = browser
+    scraper._browser_headless = True
+
+    scraper._init_browser(None, None, headless=True)
+
+    assert scraper.browser is browser
+
+
+def test_shared_browser_scope_launches_once_for_sequential_scrapers(monkeypatch):
+    from scraper_v2 import shared_browser_scope
+
+    events = []
+
+    class _FakeBrowser:
+        def is_connected(self):
+            return True
+
+        def close(self):
+            events.append("browser.close")
+
+    class _FakeChromium:
+        def launch(self, **_kwargs):
+            events.append("launch")
+            return _FakeBrowser()
+
+    class _FakePlaywright:
+        chromium = _FakeChromium()
+
+        def stop(self):
+            events.append("playwright.stop")
+
+    class _FakeManager:
+        def start(self):
+            events.append("start")
+            return _FakePlaywright()
+
+    monkeypatch.setattr("scraping.playwright_browser.sync_playwright", _FakeManager)
+
+    with shared_browser_scope():
+        first = PlaywrightScraper()
+        first._init_browser(None, None, headless=True)
+        first.close()
+        second = PlaywrightScraper()
+        second._init_browser(None, None, headless=True)
+        second.close()
+        assert events == ["start", "launch"]
+
+    assert events == ["start", "launch", "browser.close", "playwright.stop"]
+    assert second.browser is None
+
+
+def test_background_search_keeps_browser_and_closes_only_session(monkeypatch):
+    class _FakePage:
+        def __init__(self):
+            self.closed = False
+
+        def goto(self, *_args, **_kwargs):
+            return None
+
+        def close(self):
+            self.closed = True
+
+    class _FakeContext:
+        def __init__(self, page):
+            self._page = page
+            self.closed = False
+
+        def new_page(self):
+            return self._page
+
+        def close(self):
+            self.closed = True
+
+    page = _FakePage()
+    context = _FakeContext(page)
+    browser = object()
+    scraper = PlaywrightScraper()
+    full_closes = {"count": 0}
+    init_calls = []
+
+    def _fake_init_browser(_log=None, _user_data_dir=None, headless=False):
+        init_calls.append((_user_data_dir, headless))
+        cast(Any, scraper).browser = browser
+        cast(Any, scraper).context = context
+
+    def _fake_close():
+        full_closes["count"] += 1
+
+    monkeypatch.setattr(scraper, "_init_browser", _fake_init_browser)
+    monkeypatch.setattr(scraper, "_wait_for_results", lambda *_args, **_kwargs: {"found": True, "selector": "li[data-index]"})
+    monkeypatch.setattr(
+        scraper,
+        "_extract_prices",
+        lambda: [FlightResult(airline="A", price=100000, departure_time="10:00", arrival_time="12:00")],
+    )
+    monkeypatch.setattr(scraper, "close", _fake_close)
+    monkeypatch.setattr("scraper_v2.time.sleep", lambda *_args, **_kwargs: None)
+
+    results = scraper.search("ICN", "NRT", "20260301", None, max_results=10, background_mode=True)
+
+    assert len(results) == 1
+    assert full_closes["count"] == 0
+    assert page.closed and context.closed
+    assert scraper.page is None and scraper.context is None
+    assert scraper.browser is browser
+    assert init_calls == [(None, True)]
+
+
+def test_fast_stack_capture_is_env_gated(monkeypatch):
+    from playwright._impl import _sync_base
+    from scraping import playwright_browser
+
+    monkeypatch.setattr(_sync_base, "_capture_stack_trace", lambda: {"frames": ["slow"]})
+    monkeypatch.setenv("PW_INSPECT_STACK", "1")
+    assert playwright_browser.install_fast_stack_capture() is False
+    assert getattr(_sync_base, "_capture_stack_trace")() == {"frames": ["slow"]}
+
+    monkeypatch.delenv("PW_INSPECT_STACK")
+    assert playwright_browser.install_fast_stack_capture() is True
+    capture = getattr(_sync_base, "_capture_stack_trace")
+    first = capture()
+    assert first == {"frames": [], "apiName": "", "title": None}
+    assert capture() is not first
+
+
+def test_fast_stack_capture_keeps_api_name_in_errors(monkeypatch, tmp_path):
+    import pytest
+    from playwright.sync_api import Error, sync_playwright
+    from scraping import playwright_browser
+
+    monkeypatch.delenv("PW_INSPECT_STACK", raising=False)
+    assert playwright_browser.install_fast_stack_capture() is True
+
+    try:
+        manager = sync_playwright().start()
+    except Exception as exc:
+        pytest.skip(f"Playwright driver unavailable: {exc}")
+    try:
+        with pytest.raises(Error) as excinfo:
+            manager.chromium.launch(executable_path=str(tmp_path / "missing-browser"))
+    finally:
+        manager.stop()
+
+    assert str(excinfo.value).startswith("BrowserType.launch: ")
+
+
+def test_background_context_blocks_static_assets_only():
+    from scraping.playwright_browser import configure_resource_blocking
+
+    class _FakeContext:
+        def __init__(self):
+            self.routes = []
+
+        def route(self, pattern, handler):
+            self.routes.append((pattern, handler))
+
+    class _FakeRoute:
+        def __init__(self):
+            self.aborted = False
+
+        def abort(self):
+            self.aborted = True
+
+    context = _FakeContext()
+    configure_resource_blocking(context)
+
+    assert len(context.routes) == 1
+    pattern, handler = context.routes[0]
+    assert pattern.search("https://cdn.example.com/logo.PNG?v=2")
+    assert pattern.search("https://cdn.example.com/font.woff2")
+    assert not pattern.search("https://travel.interpark.com/air/air-api/search")
+    assert not pattern.search("https://travel.interpark.com/static/app.js")
+    route = _FakeRoute()
+    handler(route)
+    assert route.aborted
+
+
 def test_parallel_searcher_smoke_runs_without_nameerror(monkeypatch):
     class _FakeScraper:
         def search(self, *args, **kwargs):
@@ -727,3 +1229,37 @@ def test_parallel_searcher_smoke_runs_without_nameerror(monkeypatch):
     )
 
     assert result == {"NRT": []}
+
+
+def test_parallel_searcher_runs_tasks_on_bounded_lanes(monkeypatch):
+    import threading
+
+    from scraping.models import FlightResult as _Result
+
+    threads = set()
+    created = []
+    closed = []
+
+    class _FakeSearcher:
+        def __init__(self):
+            created.append(self)
+
+        def search(self, origin, dest, *args, **kwargs):
+            threads.add(threading.get_ident())
+            return [_Result(airline="A", price=1000 + len(dest))]
+
+        def close(self):
+            closed.append(self)
+
+    monkeypatch.setattr("scraping.parallel.FlightSearcher", _FakeSearcher)
+
+    searcher = ParallelSearcher(max_concurrent=2)
+    dates = [(datetime.now() + timedelta(days=7 + i)).strftime("%Y%m%d") for i in range(6)]
+    result = searcher.search_date_range("ICN", "NRT", dates)
+
+    assert set(result) == set(dates)
+    assert all(price_info[0] > 0 for price_info in result.values())
+    assert 1 <= len(threads) <= 2
+    # 작업마다가 아니라 레인마다 검색기 하나를 만들고, 레인이 끝날 때 닫는다
+    assert 1 <= len(created) <= 2
+    assert sorted(map(id, closed)) == sorted(map(id, created))
@@ -9,11 +9,11 @@ from typing import Any
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QGridLayout, QLabel, QPushButton, QCheckBox,
     QSpinBox, QComboBox, QDateEdit, QTabWidget, QFrame,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QTableView, QHeaderView, QAbstractItemView,
     QMenu, QMessageBox, QFileDialog, QApplication, QTextEdit,
     QRadioButton, QButtonGroup, QInputDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QDate, QSettings
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QDate, QSettings, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor, QFont, QTextCharFormat
 
 # Try importing openpyxl
@@ -28,19 +28,264 @@ import config
 
 logger = logging.getLogger(__name__)
 
-class ResultTable(QTableWidget):
+_RESULT_HEADERS = (
+    "항공사", "가격", "가는편 출발", "가는편 도착", "경유",
+    "오는편 출발", "오는편 도착", "경유", "출처"
+)
+_PLACEHOLDER_TEXT = "🔍 검색 결과가 없습니다. 검색 조건을 확인해주세요."
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_PRICE = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_ROLE_DISPLAY = Qt.ItemDataRole.DisplayRole
+_ROLE_TOOLTIP = Qt.ItemDataRole.ToolTipRole
+_ROLE_FOREGROUND = Qt.ItemDataRole.ForegroundRole
+_ROLE_BACKGROUND = Qt.ItemDataRole.BackgroundRole
+_ROLE_FONT = Qt.ItemDataRole.FontRole
+_ROLE_ALIGNMENT = Qt.ItemDataRole.TextAlignmentRole
+_ROLE_PRICE = Qt.ItemDataRole.UserRole
+
+
+def _stops_text(stops):
+    return "✈️ 직항" if not stops else f"{stops}회 경유"
+
+
+class FlightResultsModel(QAbstractTableModel):
+    """검색 결과 리스트를 그대로 들고 보이는 셀만 그때그때 계산하는 모델"""
+
+    def __init__(self, table, parent=None):
+        super().__init__(parent)
+        self._table = table  # 색상/폰트 등 공용 스타일 객체 보관처
+        self._rows = []
+        self._placeholder = False
+        self._min_price = 0
+        self._price_range = 1
+
+    def set_rows(self, rows, placeholder=False):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._placeholder = placeholder and not self._rows
+        self._update_price_range()
+        self.endResetModel()
+
+    def replace_rows(self, rows):
+        """앞부분이 같은 결과면 늘어나거나 줄어든 행만 알리고, 아니면 모델을 리셋한다."""
+        rows = list(rows)
+        old_rows = self._rows
+        old_count = len(old_rows)
+        new_count = len(rows)
+        common = min(old_count, new_count)
+        if (
+            self._placeholder
+            or not common
+            or not all(old is new for old, new in zip(old_rows, rows))
+        ):
+            self.set_rows(rows, placeholder=True)
+            return
+
+        old_range = (self._min_price, self._price_range)
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows = rows
+            self._update_price_range()
+            self.endInsertRows()
+        elif new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows = rows
+            self._update_price_range()
+            self.endRemoveRows()
+        else:
+            return
+
+        # 최저가/가격 구간이 바뀌면 남아 있던 행의 배지·색상도 다시 그려야 한다
+        if (self._min_price, self._price_range) != old_range:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(common - 1, len(_RESULT_HEADERS) - 1),
+            )
+
+    def _update_price_range(self):
+        if not self._rows:
+            return
+        # 가격 구간 색상 계산용 최소/최대는 갱신 시 한 번만 구한다
+        prices = [r.price for r in self._rows]
+        self._min_price = min(prices)
+        max_price = max(prices)
+        self._price_range = max_price - self._min_price if max_price > self._min_price else 1
+
+    def flight_at(self, row):
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 if self._placeholder else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_RESULT_HEADERS)
+
+    def headerData(self, section, orientation, role=_ROLE_DISPLAY):
+        if (
+            role == _ROLE_DISPLAY
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(_RESULT_HEADERS)
+        ):
+            return _RESULT_HEADERS[section]
+        return None
+
+    def data(self, index, role=_ROLE_DISPLAY):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        table = self._table
+
+        if self._placeholder:
+            if col != 0:
+                return None
+            if role == _ROLE_DISPLAY:
+                return _PLACEHOLDER_TEXT
+            if role == _ROLE_ALIGNMENT:
+                return _ALIGN_CENTER
+            if role == _ROLE_FOREGROUND:
+                return table._color_placeholder
+            if role == _ROLE_FONT:
+                return table._font_placeholder
+            return None
+
+        if row >= len(self._rows):
+            return None
+        flight = self._rows[row]
+
+        if role == _ROLE_DISPLAY:
+            return self._display_text(flight, col)
+        if role == _ROLE_ALIGNMENT:
+            if col == 1:
+                return _ALIGN_PRICE
+            if col in (2, 3) or (col in (5, 6) and flight.is_round_trip):
+                return _ALIGN_CENTER
+            return None
+        if role == _ROLE_FOREGROUND:
+            if col == 1:
+                return self._price_color(flight.price)
+            if col == 4:
+                return table._color_stops_direct if not flight.stops else table._color_stops_layover
+            if col == 7 and flight.is_round_trip:
+                return table._color_stops_direct if not flight.return_stops else table._color_stops_layover
+            return None
+        if role == _ROLE_BACKGROUND:
+            # 최저가 행 배경색 강조
+            return table._highlight_color if flight.price == self._min_price else None
+        if role == _ROLE_FONT:
+            if flight.price == self._min_price:
+                return table._font_highlight
+            return table._font_price if col == 1 else None
+        if role == _ROLE_TOOLTIP:
+            if col == 0 and flight.return_airline:
+                return f"가는편: {flight.airline}\\n오는편: {flight.return_airline}"
+            if col == 1:
+                return self._price_tooltip(flight)
+            return None
+        if role == _ROLE_PRICE and col == 1:
+            return flight.price
+        return None
+
+    def _display_text(self, flight, col):
+        if col == 0:
+            if flight.return_airline and flight.airline != flight.return_airline:
+                return f"{flight.airline} + {flight.return_airline}"
+            return flight.airline
+        if col == 1:
+            # 국내선: 가는편/오는편 가격 분리 표시, 최저가에는 배지 표시
+            if flight.outbound_price > 0:
+                text = f"{flight.price:,}원 ({flight.outbound_price:,}+{flight.return_price:,})"
+            else:
+                text = f"{flight.price:,}원"
+            return f"🏆 {text}" if flight.price == self._min_price else text
+        if col == 2:
+            return flight.departure_time
+        if col == 3:
+            return flight.arrival_time
+        if col == 4:
+            return _stops_text(flight.stops)
+        if col == 8:
+            return flight.source
+        if not flight.is_round_trip:
+            return "-"
+        if col == 5:
+            return flight.return_departure_time
+        if col == 6:
+            return flight.return_arrival_time
+        if col == 7:
+            return _stops_text(flight.return_stops)
+        return None
+
+    def _price_color(self, price):
+        # 가격 위치에 따른 색상: green=cheap, red=expensive
+        table = self._table
+        ratio = (price - self._min_price) / self._price_range
+        if ratio < 0.2:
+            return table._color_price_cheap
+        if ratio < 0.5:
+            return table._color_price_good
+        if ratio < 0.8:
+            return table._color_price_mid
+        return table._color_price_high
+
+    @staticmethod
+    def _price_tooltip(flight):
+        tooltip_lines = [f"기본가: {flight.price:,}원"]
+        if flight.outbound_price > 0:
+            tooltip_lines.append(
+                f"구성: {flight.outbound_price:,}원 + {flight.return_price:,}원"
+            )
+        if flight.benefit_price > 0:
+            tooltip_lines.append(f"혜택가: {flight.benefit_price:,}원")
+        if flight.benefit_label:
+            tooltip_lines.append(f"혜택 정보: {flight.benefit_label}")
+        return "\n".join(tooltip_lines)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if self._placeholder or not self._rows or not 0 <= column < len(_RESULT_HEADERS):
+            return
+        if column == 1:
+            key = lambda flight: flight.price
+        elif column == 4:
+            key = lambda flight: flight.stops
+        elif column == 7:
+            key = lambda flight: flight.return_stops if flight.is_round_trip else -1
+        else:
+            key = lambda flight: self._display_text(flight, column) or ""
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=key, reverse=order == Qt.SortOrder.DescendingOrder)
+        self.layoutChanged.emit()
+
+
+class ResultTable(QTableView):
     favorite_requested = pyqtSignal(int)  # row index
-    
+    cellDoubleClicked = pyqtSignal(int, int)  # row, column (QTableWidget 호환)
+
     def __init__(self):
         super().__init__()
         self.results_data = []  # Store flight results for access
-        
-        self.setColumnCount(9)
-        self.setHorizontalHeaderLabels([
-            "항공사", "가격", "가는편 출발", "가는편 도착", "경유",
-            "오는편 출발", "오는편 도착", "경유", "출처"
-        ])
-        
+
+        # 렌더링 시 재사용할 스타일 객체 (모델이 셀 요청 시 참조)
+        self._font_placeholder = QFont("Pretendard", 12)
+        self._font_price = QFont("Pretendard", 11, QFont.Weight.Bold)
+        self._font_highlight = QFont("Pretendard", 11, QFont.Weight.Bold)
+        self._color_placeholder = QColor("#64748b")
+        self._color_price_cheap = QColor("#22c55e")
+        self._color_price_good = QColor("#4cc9f0")
+        self._color_price_mid = QColor("#f59e0b")
+        self._color_price_high = QColor("#ef4444")
+        self._color_stops_direct = QColor("#22c55e")
+        self._color_stops_layover = QColor("#94a3b8")
+        self._highlight_color = QColor(34, 197, 94, 40)
+
+        # 셀마다 아이템을 만들지 않고 모델이 보이는 셀만 그린다
+        self._model = FlightResultsModel(self, self)
+        self.setModel(self._model)
+
         # 열 너비 설정: 내용에 맞게 자동 조절 + 마지막 열 스트레치
         header = self.horizontalHeader()
         if header is not None:
@@ -52,36 +297,27 @@ class ResultTable(QTableWidget):
                     header.setSectionResizeMode(idx, QHeaderView.ResizeMode.Stretch)
             else:
                 self.setColumnWidth(idx, width)
-        
+
         # 최소 너비 설정 (HiDPI 대응)
         if header is not None:
             header.setMinimumSectionSize(60)
-        
+            # 검색 직후에는 정렬하지 않고 결과 순서를 그대로 보여준다
+            header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+
         v_header = self.verticalHeader()
         if v_header is not None:
             v_header.setVisible(False)
             v_header.setDefaultSectionSize(48)
+            # 행 높이를 내용으로 다시 계산하지 않도록 고정
+            v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.setAlternatingRowColors(True)
         self.setSortingEnabled(True)
 
-        # 렌더링 시 재사용할 스타일 객체
-        self._font_placeholder = QFont("Pretendard", 12)
-        self._font_price = QFont("Pretendard", 11, QFont.Weight.Bold)
-        self._font_highlight = QFont("Pretendard", 11, QFont.Weight.Bold)
-        self._color_placeholder = QColor("#64748b")
-        self._color_price_cheap = QColor("#22c55e")
-        self._color_price_good = QColor("#4cc9f0")
-        self._color_price_mid = QColor("#f59e0b")
-        self._color_price_high = QColor("#ef4444")
-        self._color_stops_direct = QColor("#22c55e")
-        self._color_stops_layover = QColor("#94a3b8")
-        self._highlight_color = QColor(34, 197, 94, 40)
-        
         # 테이블 스타일
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 font-size: 13px;
             }
             QHeaderView::section {
@@ -90,142 +326,40 @@ class ResultTable(QTableWidget):
                 padding: 8px 4px;
             }
         """)
-        
+
+        self.doubleClicked.connect(self._emit_cell_double_clicked)
+
         # Enable context menu
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
 
     def update_data(self, results):
-        # 대량 업데이트 최적화
-        self.setUpdatesEnabled(False)
-        self.setSortingEnabled(False)
         self.results_data = results
-        
+        self.clearSpans()
         # Handle empty results - show placeholder
         if not results:
-            self.setRowCount(1)
-            placeholder_item = QTableWidgetItem("🔍 검색 결과가 없습니다. 검색 조건을 확인해주세요.")
-            placeholder_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            placeholder_item.setForeground(self._color_placeholder)
-            placeholder_item.setFont(self._font_placeholder)
-            self.setSpan(0, 0, 1, 9)
-            self.setItem(0, 0, placeholder_item)
+            self._model.set_rows([], placeholder=True)
+            self.setSpan(0, 0, 1, len(_RESULT_HEADERS))
             self.setRowHeight(0, 80)
-            self.setSortingEnabled(False)
-            self.setUpdatesEnabled(True)
             return
-        
-        # Clear any previous span
+        self._model.replace_rows(results)
+
+        # 사용자가 정렬한 열이 있으면 새 결과에도 같은 정렬을 적용
+        header = self.horizontalHeader()
+        if header is not None:
+            section = header.sortIndicatorSection()
+            if 0 <= section < len(_RESULT_HEADERS):
+                self._model.sort(section, header.sortIndicatorOrder())
+
+    def clear_results(self):
+        """검색 시작 시 이전 결과를 비운다 (안내 문구 없이)"""
+        self.results_data = []
         self.clearSpans()
-        self.setRowCount(len(results))
-        
-        # Calculate price range for color coding
-        min_price = min(r.price for r in results)
-        max_price = max(r.price for r in results)
-        price_range = max_price - min_price if max_price > min_price else 1
-        
-        for i, flight in enumerate(results):
-            # Store flight object in first column's data
-            airline_str = flight.airline
-            if hasattr(flight, 'return_airline') and flight.return_airline and flight.airline != flight.return_airline:
-                airline_str = f"{flight.airline} + {flight.return_airline}"
-            
-            airline_item = QTableWidgetItem(airline_str)
-            airline_item.setData(Qt.ItemDataRole.UserRole + 1, i)
-            # 툴팁에 상세 정보 표시
-            if hasattr(flight, 'return_airline') and flight.return_airline:
-                 airline_item.setToolTip(f"가는편: {flight.airline}\\n오는편: {flight.return_airline}")
-            self.setItem(i, 0, airline_item)
-            
-            # Price (Color-coded: green=cheap, red=expensive)
-            # 국내선: 가는편/오는편 가격 분리 표시
-            # Add best price badge for minimum price
-            if flight.price == min_price:
-                if hasattr(flight, 'outbound_price') and flight.outbound_price > 0:
-                    price_text = f"🏆 {flight.price:,}원 ({flight.outbound_price:,}+{flight.return_price:,})"
-                else:
-                    price_text = f"🏆 {flight.price:,}원"
-            elif hasattr(flight, 'outbound_price') and flight.outbound_price > 0:
-                price_text = f"{flight.price:,}원 ({flight.outbound_price:,}+{flight.return_price:,})"
-            else:
-                price_text = f"{flight.price:,}원"
-            
-            price_item = QTableWidgetItem(price_text)
-            price_item.setData(Qt.ItemDataRole.UserRole, flight.price)
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            tooltip_lines = [f"기본가: {flight.price:,}원"]
-            if hasattr(flight, 'outbound_price') and flight.outbound_price > 0:
-                tooltip_lines.append(
-                    f"구성: {flight.outbound_price:,}원 + {flight.return_price:,}원"
-                )
-            if getattr(flight, 'benefit_price', 0) > 0:
-                tooltip_lines.append(f"혜택가: {flight.benefit_price:,}원")
-            if getattr(flight, 'benefit_label', ''):
-                tooltip_lines.append(f"혜택 정보: {flight.benefit_label}")
-            price_item.setToolTip("\n".join(tooltip_lines))
-            
-            # Color coding based on price position
-            ratio = (flight.price - min_price) / price_range if price_range else 0
-            if ratio < 0.2:
-                price_color = self._color_price_cheap  # Green - cheapest
-            elif ratio < 0.5:
-                price_color = self._color_price_good  # Cyan - good
-            elif ratio < 0.8:
-                price_color = self._color_price_mid  # Orange - moderate
-            else:
-                price_color = self._color_price_high  # Red - expensive
-            
-            price_item.setForeground(price_color)
-            price_item.setFont(self._font_price)
-            self.setItem(i, 1, price_item)
-            
-            # Outbound
-            self._set_time_item(i, 2, flight.departure_time)
-            self._set_time_item(i, 3, flight.arrival_time)
-            
-            # Stops - highlight direct flights
-            stops_item = QTableWidgetItem("✈️ 직항" if not flight.stops else f"{flight.stops}회 경유")
-            if not flight.stops:
-                stops_item.setForeground(self._color_stops_direct)
-            else:
-                stops_item.setForeground(self._color_stops_layover)
-            self.setItem(i, 4, stops_item)
-            
-            # Inbound
-            if hasattr(flight, 'is_round_trip') and flight.is_round_trip:
-                self._set_time_item(i, 5, flight.return_departure_time)
-                self._set_time_item(i, 6, flight.return_arrival_time)
-                ret_stops = QTableWidgetItem("✈️ 직항" if not flight.return_stops else f"{flight.return_stops}회 경유")
-                if not flight.return_stops:
-                    ret_stops.setForeground(self._color_stops_direct)
-                else:
-                    ret_stops.setForeground(self._color_stops_layover)
-                self.setItem(i, 7, ret_stops)
-            else:
-                self.setItem(i, 5, QTableWidgetItem("-"))
-                self.setItem(i, 6, QTableWidgetItem("-"))
-                self.setItem(i, 7, QTableWidgetItem("-"))
-                
-            # Source
-            self.setItem(i, 8, QTableWidgetItem(flight.source))
-            
-            # 최저가 행 배경색 강조 (더 눈에 띄게)
-            if flight.price == min_price:
-                for col in range(self.columnCount()):
-                    item = self.item(i, col)
-                    if item:
-                        item.setBackground(self._highlight_color)
-                        item.setFont(self._font_highlight)
-            
-        self.setSortingEnabled(True)
-        self.setUpdatesEnabled(True)  # 렌더링 다시 활성화
+        self._model.set_rows([])
 
+    def _emit_cell_double_clicked(self, index):
+        self.cellDoubleClicked.emit(index.row(), index.column())
 
-    def _set_time_item(self, row, col, text):
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setItem(row, col, item)
-    
     def _show_context_menu(self, pos):
         row = self.rowAt(pos.y())
         if row < 0:
@@ -402,11 +536,4 @@ class ResultTable(QTableWidget):
     
     def get_flight_at_row(self, row):
         """Get flight data for the given visual row"""
-        if 0 <= row < len(self.results_data):
-            # Account for sorting - get original index from item data
-            item = self.item(row, 0)
-            if item:
-                orig_idx = item.data(Qt.ItemDataRole.UserRole + 1)
-                if orig_idx is not None and 0 <= orig_idx < len(self.results_data):
-                    return self.results_data[orig_idx]
-        return None
+        return self._model.flight_at(row)
@@ -84,8 +84,16 @@ class SettingsDialog(QDialog):
         self.spin_limit.setSuffix(" 개")
         self.spin_limit.setToolTip("한 번의 검색에서 표시할 최대 결과 수 (기본: 1000)")
         
+        self.spin_parallel = QSpinBox()
+        self.spin_parallel.setRange(1, 8)
+        self.spin_parallel.setValue(self.prefs.get_parallel_workers())
+        self.spin_parallel.setSuffix(" 개")
+        self.spin_parallel.setToolTip("다중 목적지 검색에서 동시에 띄울 브라우저 수 (기본: 2)")
+
         gl_layout.addWidget(QLabel("최대 표시 개수:"))
         gl_layout.addWidget(self.spin_limit)
+        gl_layout.addWidget(QLabel("동시 검색:"))
+        gl_layout.addWidget(self.spin_parallel)
         gl_layout.addStretch()
         
         # Save Button (Combined)
@@ -137,6 +145,7 @@ class SettingsDialog(QDialog):
     def _save_time_pref(self):
         self.prefs.set_preferred_time(self.spin_start.value(), self.spin_end.value())
         self.prefs.set_max_results(self.spin_limit.value())
+        self.prefs.set_parallel_workers(self.spin_parallel.value())
         QMessageBox.information(self, "저장", "설정이 저장되었습니다.")
 
     def _save_alert_auto_check(self):
@@ -222,7 +222,7 @@ QPushButton#manual_btn:hover {
 }
 
 /* ===== Table (Modern Rows with Enhanced Effects) ===== */
-QTableWidget {
+QTableView {
     background-color: rgba(22, 33, 62, 0.7);
     border: 1px solid rgba(30, 58, 95, 0.8);
     border-radius: 16px;
@@ -231,15 +231,15 @@ QTableWidget {
     selection-color: #f1f5f9;
     alternate-background-color: rgba(15, 20, 35, 0.4);
 }
-QTableWidget::item {
+QTableView::item {
     padding: 14px 12px;
     border-bottom: 1px solid rgba(30, 58, 95, 0.2);
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: rgba(102, 126, 234, 0.4);
     border-left: 4px solid #818cf8;
 }
-QTableWidget::item:hover {
+QTableView::item:hover {
     background-color: rgba(34, 211, 238, 0.18);
 }
 QHeaderView::section {
@@ -162,7 +162,7 @@ QPushButton#tool_btn:hover {
 }
 
 /* ===== Table ===== */
-QTableWidget {
+QTableView {
     background-color: #ffffff;
     border: 1px solid #e2e8f0;
     border-radius: 8px;
@@ -171,14 +171,14 @@ QTableWidget {
     selection-color: #1e293b;
     alternate-background-color: #f8fafc;
 }
-QTableWidget::item {
+QTableView::item {
     padding: 8px 6px;
     border-bottom: 1px solid #f1f5f9;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #3b82f640;
 }
-QTableWidget::item:hover {
+QTableView::item:hover {
     background-color: #e0f2fe;
 }
 QHeaderView::section {
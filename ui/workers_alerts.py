@@ -6,7 +6,7 @@ from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from scraper_v2 import FlightSearcher, BrowserInitError, NetworkError
+from scraper_v2 import FlightSearcher, BrowserInitError, NetworkError, shared_browser_scope
 
 logger = logging.getLogger(__name__)
 MAX_DATE_RANGE_SEARCHES = 30
@@ -64,6 +64,12 @@ class AlertAutoCheckWorker(QThread):
             return self._cancelled or self.isInterruptionRequested()
 
     def run(self):
+        # 알림은 한 스레드에서 순차 점검하므로 브라우저 프로세스 하나를 끝까지 공유한다.
+        with shared_browser_scope():
+            checked, hits = self._check_alerts()
+        self.done.emit(checked, hits)
+
+    def _check_alerts(self):
         checked = 0
         hits = 0
 
@@ -124,4 +130,4 @@ class AlertAutoCheckWorker(QThread):
                 hits += 1
                 self.alert_hit.emit(alert_id, current_price, target_price, origin, dest, cabin_class)
 
-        self.done.emit(checked, hits)
+        return checked, hits
@@ -11,6 +11,7 @@ from scraper_v2 import FlightSearcher, BrowserInitError, NetworkError
 logger = logging.getLogger(__name__)
 MAX_DATE_RANGE_SEARCHES = 30
 MAX_PARALLEL_WORKERS = 2
+MAX_PARALLEL_WORKERS_LIMIT = 8  # 작업마다 브라우저를 띄우므로 동시 실행 상한
 
 
 def _searcher_cls():
@@ -23,7 +24,7 @@ def _searcher_cls():
         return FlightSearcher
 
 class MultiSearchWorker(QThread):
-    """다중 목적지 병렬 검색 Worker (동시 2개)"""
+    """다중 목적지 병렬 검색 Worker (기본 동시 2개, max_workers로 조정)"""
     progress = pyqtSignal(str)
     single_finished = pyqtSignal(str, list)  # dest, results
     all_finished = pyqtSignal(dict)  # {dest: [results]}
@@ -39,6 +40,7 @@ class MultiSearchWorker(QThread):
         cabin_class="ECONOMY",
         max_results=1000,
         telemetry_callback=None,
+        max_workers=MAX_PARALLEL_WORKERS,
     ):
         super().__init__()
         self.origin = origin
@@ -49,6 +51,11 @@ class MultiSearchWorker(QThread):
         self.cabin_class = cabin_class
         self.max_results = max_results
         self.telemetry_callback = telemetry_callback
+        try:
+            max_workers = int(max_workers)
+        except (TypeError, ValueError):
+            max_workers = MAX_PARALLEL_WORKERS
+        self.max_workers = max(1, min(max_workers, MAX_PARALLEL_WORKERS_LIMIT))
         self._cancelled = False
         self._cancel_lock = threading.Lock()
         self._active_searchers = set()
@@ -121,7 +128,9 @@ class MultiSearchWorker(QThread):
                 except Exception:
                     pass
 
-        executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_WORKERS)
+        # 먼저 끝난 목적지부터 수거하고 빈 자리에 다음 목적지를 바로 넣는다
+        worker_count = min(self.max_workers, total)
+        executor = ThreadPoolExecutor(max_workers=worker_count)
         pending = list(enumerate(self.destinations, 1))
         futures = {}
         try:
@@ -134,7 +143,7 @@ class MultiSearchWorker(QThread):
                     self.progress.emit(f"⚠️ 다중 검색이 취소되었습니다. ({len(all_results)}/{total} 완료)")
                     return
 
-                while pending and len(futures) < MAX_PARALLEL_WORKERS and not self.is_cancelled():
+                while pending and len(futures) < worker_count and not self.is_cancelled():
                     index, dest = pending.pop(0)
                     self.progress.emit(f"🔍 [{index}/{total}] {dest} 검색 대기...")
                     futures[executor.submit(search_single, index, dest)] = dest